@@ -38,7 +38,8 @@ from rbnics.sampling.distributions import DrawFrom, EquispacedDistribution, LogE
 from rbnics.scm.problems import SCM, ExactCoercivityConstant
 from rbnics.shape_parametrization.problems import AffineShapeParametrization, ShapeParametrization
 from rbnics.utils.decorators import CustomizeReducedProblemFor, CustomizeReductionMethodFor, exact_problem
-from rbnics.utils.factories import ReducedBasis, PODGalerkin
+from rbnics.utils.factories import HPReducedBasis, ReducedBasis, PODGalerkin
+from rbnics.utils.profiler import memory_profiler, profiler
 
 __all__ += [
     # rbnics.eim
@@ -76,8 +77,12 @@ __all__ += [
     'CustomizeReductionMethodFor',
     'exact_problem',
     # rbnics.utils.factories
+    'HPReducedBasis',
     'ReducedBasis',
     'PODGalerkin',
+    # rbnics.utils.profiler
+    'memory_profiler',
+    'profiler',
 ]
 
 # Import remaining modules
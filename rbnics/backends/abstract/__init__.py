@@ -30,6 +30,7 @@ from rbnics.backends.abstract.functions_list import FunctionsList
 from rbnics.backends.abstract.gram_schmidt import GramSchmidt
 from rbnics.backends.abstract.high_order_proper_orthogonal_decomposition import HighOrderProperOrthogonalDecomposition
 from rbnics.backends.abstract.import_ import import_
+from rbnics.backends.abstract.is_replicated import is_replicated
 from rbnics.backends.abstract.linear_program_solver import LinearProgramSolver
 from rbnics.backends.abstract.linear_solver import LinearProblemWrapper, LinearSolver
 from rbnics.backends.abstract.matrix import Matrix
@@ -70,6 +71,7 @@ __all__ = [
     'GramSchmidt',
     'HighOrderProperOrthogonalDecomposition',
     'import_',
+    'is_replicated',
     'LinearProblemWrapper',
     'LinearProgramSolver',
     'LinearSolver',
@@ -26,13 +26,8 @@ def evaluate(backend, wrapping, online_backend, online_wrapping):
         
         @overload(backend.FunctionsList, (backend.ReducedMesh, backend.ReducedVertices))
         def __call__(self, functions_list, at, **kwargs):
-            out_size = len(at.get_dofs_list())
-            out = online_backend.OnlineMatrix(out_size, out_size)
-            for (j, fun_j) in enumerate(functions_list):
-                evaluate_fun_j = self.__call__(fun_j, at)
-                for (i, out_ij) in enumerate(evaluate_fun_j):
-                    out[i, j] = out_ij
-            return out
+            # All functions are evaluated at once, the j-th column of the output storing the values of the j-th function
+            return wrapping.evaluate_sparse_tensors_at_dofs([function.vector() for function in functions_list], at.get_dofs_list())
         
         @overload(backend.ParametrizedExpressionFactory, None)
         def __call__(self, parametrized_expression, at, **kwargs):
@@ -60,13 +55,8 @@ def evaluate(backend, wrapping, online_backend, online_wrapping):
         
         @overload(backend.TensorsList, backend.ReducedMesh)
         def __call__(self, tensors_list, at, **kwargs):
-            out_size = len(at.get_dofs_list())
-            out = online_backend.OnlineMatrix(out_size, out_size)
-            for (j, tensor_j) in enumerate(tensors_list):
-                evaluate_tensor_j = self.__call__(tensor_j, at)
-                for (i, out_ij) in enumerate(evaluate_tensor_j):
-                    out[i, j] = out_ij
-            return out
+            # All tensors are evaluated at once, the j-th column of the output storing the (vectorized) values of the j-th tensor
+            return wrapping.evaluate_sparse_tensors_at_dofs(list(tensors_list), at.get_dofs_list())
         
         @overload(backend.ParametrizedTensorFactory, None)
         def __call__(self, parametrized_tensor, at, **kwargs):
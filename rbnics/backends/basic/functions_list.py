@@ -21,6 +21,7 @@ from numbers import Number
 from rbnics.backends.abstract import FunctionsList as AbstractFunctionsList
 from rbnics.utils.decorators import dict_of, list_of, overload, ThetaType, tuple_of
 from rbnics.utils.mpi import is_io_process
+from rbnics.utils.profiler import memory_profiler
 
 def FunctionsList(backend, wrapping, online_backend, online_wrapping, AdditionalIsFunction=None, ConvertAdditionalFunctionTypes=None):
     if AdditionalIsFunction is None:
@@ -41,6 +42,7 @@ def FunctionsList(backend, wrapping, online_backend, online_wrapping, Additional
             self.mpi_comm = wrapping.get_mpi_comm(space)
             self._list = list() # of functions
             self._precomputed_slices = dict() # from tuple to FunctionsList
+            memory_profiler.track("functions lists", self)
         
         def enrich(self, functions, component=None, weights=None, copy=True):
             # Append to storage
@@ -18,6 +18,7 @@
 
 from math import sqrt
 from rbnics.backends.abstract import GramSchmidt as AbstractGramSchmidt
+from rbnics.utils.profiler import profiler
 
 def GramSchmidt(backend, wrapping):
     class _GramSchmidt(AbstractGramSchmidt):
@@ -25,6 +26,7 @@ def GramSchmidt(backend, wrapping):
             # Inner product
             self.inner_product = inner_product
             
+        @profiler.span("Gram-Schmidt")
         def apply(self, basis_functions, N_bc):
             inner_product = self.inner_product
             
@@ -19,6 +19,7 @@
 from math import sqrt
 from numpy import abs, cumsum as compute_retained_energy, isclose, sum as compute_total_energy
 from rbnics.utils.io import ExportableList
+from rbnics.utils.profiler import memory_profiler, profiler
 
 # Class containing the implementation of the POD
 def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_wrapping, ParentProperOrthogonalDecomposition, SnapshotsContainerType, BasisContainerType):
@@ -44,6 +45,7 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
         # it has different interface for the standard POD and
         # the tensor one.
                 
+        @profiler.span("POD")
         def apply(self, Nmax, tol):
             inner_product = self.inner_product
             snapshots_matrix = self.snapshots_matrix
@@ -53,6 +55,8 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
                 correlation = transpose(snapshots_matrix)*inner_product*snapshots_matrix
             else:
                 correlation = transpose(snapshots_matrix)*snapshots_matrix
+            memory_profiler.track("POD correlation matrices", correlation)
+            memory_profiler.check()
             
             basis_functions = BasisContainerType(self.space, *self.args)
             
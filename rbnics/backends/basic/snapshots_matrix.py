@@ -18,10 +18,15 @@
 
 from numbers import Number
 from rbnics.utils.decorators import dict_of, list_of, overload
+from rbnics.utils.profiler import memory_profiler
 
 def SnapshotsMatrix(FunctionsList):
     class _SnapshotsMatrix(FunctionsList):
         
+        def __init__(self, *args, **kwargs):
+            FunctionsList.__init__(self, *args, **kwargs)
+            memory_profiler.track("snapshots matrices", self)
+            
         @overload(FunctionsList, (None, str, dict_of(str, str)), (None, list_of(Number)), bool)
         def _enrich(self, functions, component, weights, copy):
             if weights is not None:
@@ -18,7 +18,7 @@
 
 from rbnics.backends.basic.wrapping.delayed_linear_solver import DelayedLinearSolver
 from rbnics.utils.decorators import overload
-from rbnics.utils.io import TextIO as LengthIO
+from rbnics.utils.io import BinaryIO as LengthIO
 
 class DelayedFunctionsList(object):
     def __init__(self, space):
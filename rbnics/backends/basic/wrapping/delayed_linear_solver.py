@@ -22,7 +22,7 @@ from rbnics.backends.abstract import ParametrizedTensorFactory as AbstractParame
 from rbnics.backends.basic.wrapping.delayed_product import DelayedProduct
 from rbnics.backends.basic.wrapping.delayed_sum import DelayedSum
 from rbnics.eim.utils.decorators import get_component_and_index_from_basis_function, get_problem_from_problem_name, get_reduced_problem_from_problem, get_reduced_problem_from_riesz_solve_homogeneous_dirichlet_bc, get_reduced_problem_from_riesz_solve_inner_product, get_reduced_problem_from_riesz_solve_storage, get_term_and_index_from_parametrized_operator, get_problem_from_parametrized_operator
-from rbnics.utils.io import Folders, TextIO as BCsIO, TextIO as LHSIO, TextIO as ParametersIO, TextIO as RHSIO, TextIO as SolutionIO
+from rbnics.utils.io import BinaryIO as BCsIO, BinaryIO as LHSIO, BinaryIO as ParametersIO, BinaryIO as RHSIO, BinaryIO as SolutionIO, Folders
 
 class DelayedLinearSolver(object):
     def __init__(self, lhs=None, solution=None, rhs=None, bcs=None):
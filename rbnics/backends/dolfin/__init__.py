@@ -52,6 +52,7 @@ from rbnics.backends.dolfin.functions_list import FunctionsList
 from rbnics.backends.dolfin.gram_schmidt import GramSchmidt
 from rbnics.backends.dolfin.high_order_proper_orthogonal_decomposition import HighOrderProperOrthogonalDecomposition
 from rbnics.backends.dolfin.import_ import import_
+from rbnics.backends.dolfin.is_replicated import is_replicated
 from rbnics.backends.dolfin.linear_solver import LinearSolver
 from rbnics.backends.dolfin.matrix import Matrix
 from rbnics.backends.dolfin.max import max
@@ -91,6 +92,7 @@ __all__ = [
     'GramSchmidt',
     'HighOrderProperOrthogonalDecomposition',
     'import_',
+    'is_replicated',
     'LinearSolver',
     'Matrix',
     'max',
@@ -23,6 +23,7 @@ from rbnics.backends.dolfin.matrix import Matrix
 from rbnics.backends.dolfin.vector import Vector
 from rbnics.backends.dolfin.function import Function
 from rbnics.utils.decorators import backend_for, list_of, overload, tuple_of
+from rbnics.utils.profiler import memory_profiler
 
 # Generic backend
 @backend_for("dolfin", inputs=((tuple_of(list_of(DirichletBC)), tuple_of(Form), tuple_of(Function.Type()), tuple_of(Matrix.Type()), tuple_of(Vector.Type()), tuple_of((Form, Matrix.Type())), tuple_of((Form, Vector.Type()))), ))
@@ -33,6 +34,7 @@ def AffineExpansionStorage(args):
 class AffineExpansionStorage_Base(AbstractAffineExpansionStorage):
     def __init__(self, args):
         self._content = None
+        memory_profiler.track("affine expansion storages", self)
         
     def __getitem__(self, key):
         return self._content[key]
@@ -19,11 +19,10 @@
 from petsc4py import PETSc
 from ufl import Form
 from dolfin import as_backend_type, assemble, DirichletBC, Function, FunctionSpace, has_pybind11, PETScMatrix, PETScVector, SLEPcEigenSolver
-if has_pybind11():
-    from dolfin import compile_cpp_code
 from rbnics.backends.dolfin.evaluate import evaluate
 from rbnics.backends.dolfin.matrix import Matrix
 from rbnics.backends.dolfin.parametrized_tensor_factory import ParametrizedTensorFactory
+from rbnics.backends.dolfin.wrapping.compile_cpp_code import compile_cpp_code
 from rbnics.backends.dolfin.wrapping.dirichlet_bc import ProductOutputDirichletBC
 from rbnics.backends.abstract import EigenSolver as AbstractEigenSolver
 from rbnics.utils.decorators import BackendFor, dict_of, list_of, overload
@@ -116,47 +115,8 @@ class EigenSolver(AbstractEigenSolver):
         return self.eigen_solver.get_eigenvalue(i)
     
     def get_eigenvector(self, i):
-        # Helper functions
-        if has_pybind11():
-            cpp_code = """
-                #include <pybind11/pybind11.h>
-                #include <dolfin/la/PETScVector.h>
-                #include <dolfin/la/SLEPcEigenSolver.h>
-                
-                PetscInt get_converged(std::shared_ptr<dolfin::SLEPcEigenSolver> eigen_solver)
-                {
-                    PetscInt num_computed_eigenvalues;
-                    EPSGetConverged(eigen_solver->eps(), &num_computed_eigenvalues);
-                    return num_computed_eigenvalues;
-                }
-                
-                void get_eigen_pair(std::shared_ptr<dolfin::SLEPcEigenSolver> eigen_solver, std::size_t i, std::shared_ptr<dolfin::PETScVector> condensed_real_vector, std::shared_ptr<dolfin::PETScVector> condensed_imag_vector)
-                {
-                    const PetscInt ii = static_cast<PetscInt>(i);
-                    double real_value;
-                    double imag_value;
-                    EPSGetEigenpair(eigen_solver->eps(), ii, &real_value, &imag_value, condensed_real_vector->vec(), condensed_imag_vector->vec());
-                }
-                
-                PYBIND11_MODULE(SIGNATURE, m)
-                {
-                    m.def("get_converged", &get_converged);
-                    m.def("get_eigen_pair", &get_eigen_pair);
-                }
-            """
-            
-            cpp_module = compile_cpp_code(cpp_code)
-            get_converged = cpp_module.get_converged
-            get_eigen_pair = cpp_module.get_eigen_pair
-        else:
-            def get_converged(eigen_solver):
-                return eigen_solver.eps().getConverged()
-            
-            def get_eigen_pair(eigen_solver, i, condensed_real_vector, condensed_imag_vector):
-                eigen_solver.eps().getEigenpair(i, condensed_real_vector.vec(), condensed_imag_vector.vec())
-        
         # Get number of computed eigenvectors/values
-        num_computed_eigenvalues = get_converged(self.eigen_solver)
+        num_computed_eigenvalues = _get_converged(self.eigen_solver)
 
         if (i < num_computed_eigenvalues):
             # Initialize eigenvectors
@@ -165,23 +125,75 @@ class EigenSolver(AbstractEigenSolver):
             self.A.init_vector(real_vector, 0)
             self.A.init_vector(imag_vector, 0)
 
-            # Condense input vectors
+            # Initialize condensed eigenvectors
             if hasattr(self, "_is"): # there were Dirichlet BCs
-                condensed_real_vector = PETScVector(real_vector.vec().getSubVector(self._is))
-                condensed_imag_vector = PETScVector(imag_vector.vec().getSubVector(self._is))
+                condensed_real_vector = PETScVector(self.condensed_A.mat().createVecRight())
+                condensed_imag_vector = PETScVector(self.condensed_A.mat().createVecRight())
             else:
                 condensed_real_vector = real_vector
                 condensed_imag_vector = imag_vector
 
             # Get eigenpairs
-            get_eigen_pair(self.eigen_solver, i, condensed_real_vector, condensed_imag_vector)
+            _get_eigen_pair(self.eigen_solver, i, condensed_real_vector, condensed_imag_vector)
 
-            # Restore input vectors
+            # Expand condensed eigenvectors, setting to zero the value at constrained dofs
             if hasattr(self, "_is"): # there were Dirichlet BCs
-                real_vector.vec().restoreSubVector(self._is, condensed_real_vector.vec())
-                imag_vector.vec().restoreSubVector(self._is, condensed_imag_vector.vec())
+                if not hasattr(self, "_scatter"):
+                    self._scatter = PETSc.Scatter().create(condensed_real_vector.vec(), None, real_vector.vec(), self._is)
+                for (condensed_vector, vector) in ((condensed_real_vector, real_vector), (condensed_imag_vector, imag_vector)):
+                    self._scatter.scatter(condensed_vector.vec(), vector.vec(), PETSc.InsertMode.INSERT, PETSc.ScatterMode.FORWARD)
             
             # Return as Function
             return (Function(self.V, real_vector), Function(self.V, imag_vector))
         else:
             raise RuntimeError("Requested eigenpair has not been computed")
+            
+# Helper functions
+if has_pybind11():
+    _cpp_code = """
+        #include <pybind11/pybind11.h>
+        #include <dolfin/la/PETScVector.h>
+        #include <dolfin/la/SLEPcEigenSolver.h>
+        
+        PetscInt get_converged(std::shared_ptr<dolfin::SLEPcEigenSolver> eigen_solver)
+        {
+            PetscInt num_computed_eigenvalues;
+            EPSGetConverged(eigen_solver->eps(), &num_computed_eigenvalues);
+            return num_computed_eigenvalues;
+        }
+        
+        void get_eigen_pair(std::shared_ptr<dolfin::SLEPcEigenSolver> eigen_solver, std::size_t i, std::shared_ptr<dolfin::PETScVector> condensed_real_vector, std::shared_ptr<dolfin::PETScVector> condensed_imag_vector)
+        {
+            const PetscInt ii = static_cast<PetscInt>(i);
+            double real_value;
+            double imag_value;
+            EPSGetEigenpair(eigen_solver->eps(), ii, &real_value, &imag_value, condensed_real_vector->vec(), condensed_imag_vector->vec());
+        }
+        
+        PYBIND11_MODULE(SIGNATURE, m)
+        {
+            m.def("get_converged", &get_converged);
+            m.def("get_eigen_pair", &get_eigen_pair);
+        }
+    """
+    
+    # Compile on first use rather than at import, and store the compiled module for later calls
+    _cpp_module = None
+    
+    def _get_cpp_module():
+        global _cpp_module
+        if _cpp_module is None:
+            _cpp_module = compile_cpp_code(_cpp_code)
+        return _cpp_module
+    
+    def _get_converged(eigen_solver):
+        return _get_cpp_module().get_converged(eigen_solver)
+    
+    def _get_eigen_pair(eigen_solver, i, condensed_real_vector, condensed_imag_vector):
+        _get_cpp_module().get_eigen_pair(eigen_solver, i, condensed_real_vector, condensed_imag_vector)
+else:
+    def _get_converged(eigen_solver):
+        return eigen_solver.eps().getConverged()
+    
+    def _get_eigen_pair(eigen_solver, i, condensed_real_vector, condensed_imag_vector):
+        eigen_solver.eps().getEigenpair(i, condensed_real_vector.vec(), condensed_imag_vector.vec())
@@ -29,7 +29,7 @@ from rbnics.backends.dolfin.reduced_mesh import ReducedMesh
 from rbnics.backends.dolfin.reduced_vertices import ReducedVertices
 from rbnics.backends.dolfin.tensors_list import TensorsList
 from rbnics.backends.dolfin.vector import Vector
-from rbnics.backends.dolfin.wrapping import assemble, evaluate_and_vectorize_sparse_matrix_at_dofs, evaluate_expression, evaluate_sparse_function_at_dofs, evaluate_sparse_vector_at_dofs, expression_iterator, expression_replace, form_argument_replace, form_iterator, form_replace, function_from_ufl_operators, get_auxiliary_problem_for_non_parametrized_function, is_problem_solution_or_problem_solution_component, is_problem_solution_or_problem_solution_component_type, solution_identify_component, solution_iterator
+from rbnics.backends.dolfin.wrapping import assemble, evaluate_and_vectorize_sparse_matrix_at_dofs, evaluate_expression, evaluate_sparse_function_at_dofs, evaluate_sparse_tensors_at_dofs, evaluate_sparse_vector_at_dofs, expression_iterator, expression_replace, form_argument_replace, form_iterator, form_replace, function_from_ufl_operators, get_auxiliary_problem_for_non_parametrized_function, is_problem_solution_or_problem_solution_component, is_problem_solution_or_problem_solution_component_type, solution_identify_component, solution_iterator
 from rbnics.backends.dolfin.wrapping.expression_on_reduced_mesh import basic_expression_on_reduced_mesh
 from rbnics.backends.dolfin.wrapping.expression_on_truth_mesh import basic_expression_on_truth_mesh
 from rbnics.backends.dolfin.wrapping.form_on_reduced_function_space import basic_form_on_reduced_function_space
@@ -45,7 +45,7 @@ expression_on_reduced_mesh = basic_expression_on_reduced_mesh(backend, wrapping_
 expression_on_truth_mesh = basic_expression_on_truth_mesh(backend, wrapping_for_wrapping)
 form_on_reduced_function_space = basic_form_on_reduced_function_space(backend, wrapping_for_wrapping, online_backend_for_wrapping, online_wrapping_for_wrapping)
 form_on_truth_function_space = basic_form_on_truth_function_space(backend, wrapping_for_wrapping)
-wrapping = ModuleWrapper(evaluate_and_vectorize_sparse_matrix_at_dofs, evaluate_sparse_function_at_dofs, evaluate_sparse_vector_at_dofs, expression_on_reduced_mesh=expression_on_reduced_mesh, expression_on_truth_mesh=expression_on_truth_mesh, form_on_reduced_function_space=form_on_reduced_function_space, form_on_truth_function_space=form_on_truth_function_space)
+wrapping = ModuleWrapper(evaluate_and_vectorize_sparse_matrix_at_dofs, evaluate_sparse_function_at_dofs, evaluate_sparse_tensors_at_dofs, evaluate_sparse_vector_at_dofs, expression_on_reduced_mesh=expression_on_reduced_mesh, expression_on_truth_mesh=expression_on_truth_mesh, form_on_reduced_function_space=form_on_reduced_function_space, form_on_truth_function_space=form_on_truth_function_space)
 online_backend = ModuleWrapper(OnlineFunction=OnlineFunction, OnlineMatrix=OnlineMatrix, OnlineVector=OnlineVector)
 online_wrapping = ModuleWrapper()
 evaluate_base = basic_evaluate(backend, wrapping, online_backend, online_wrapping)
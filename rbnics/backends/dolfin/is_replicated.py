@@ -0,0 +1,38 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from mpi4py.MPI import LAND
+from rbnics.backends.dolfin.function import Function
+from rbnics.backends.dolfin.vector import Vector
+from rbnics.backends.dolfin.wrapping import to_petsc4py
+from rbnics.utils.decorators import backend_for, overload
+
+# is_replicated function to check whether a function or vector is stored as a whole on every process,
+# rather than being distributed among processes. This is a collective operation
+@backend_for("dolfin", inputs=((Function.Type(), Vector.Type()), ))
+def is_replicated(arg):
+    return _is_replicated(arg)
+    
+@overload
+def _is_replicated(function: Function.Type()):
+    return _is_replicated(function.vector())
+    
+@overload
+def _is_replicated(vector: Vector.Type()):
+    vec = to_petsc4py(vector)
+    return vec.comm.tompi4py().allreduce(vec.getLocalSize() == vec.getSize(), op=LAND)
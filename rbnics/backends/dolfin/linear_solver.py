@@ -16,6 +16,7 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
+from collections import OrderedDict
 from ufl import Form
 from dolfin import assemble, DirichletBC, PETScLUSolver
 from rbnics.backends.abstract import LinearSolver as AbstractLinearSolver
@@ -24,35 +25,42 @@ from rbnics.backends.dolfin.function import Function
 from rbnics.backends.dolfin.matrix import Matrix
 from rbnics.backends.dolfin.parametrized_tensor_factory import ParametrizedTensorFactory
 from rbnics.backends.dolfin.vector import Vector
+from rbnics.backends.dolfin.wrapping import to_petsc4py
 from rbnics.backends.dolfin.wrapping.dirichlet_bc import ProductOutputDirichletBC
+from rbnics.utils.config import config
 from rbnics.utils.decorators import BackendFor, dict_of, list_of, overload
 
 @BackendFor("dolfin", inputs=((Form, Matrix.Type(), ParametrizedTensorFactory), Function.Type(), (Form, ParametrizedTensorFactory, Vector.Type()), (list_of(DirichletBC), ProductOutputDirichletBC, dict_of(str, list_of(DirichletBC)), dict_of(str, ProductOutputDirichletBC), None)))
 class LinearSolver(AbstractLinearSolver):
+    # Factorizations are shared among all instances, so that solves with the same left-hand side
+    # (e.g. supremizer and Riesz solves) only perform forward and backward substitutions. The cache is keyed
+    # by identity and PETSc state of the left-hand side before the application of BCs, by the boundaries
+    # where BCs are applied (but not their values, which only affect the right-hand side) and by the solver type.
+    _factorization_cache = OrderedDict()
+    
     def __init__(self, lhs, solution, rhs, bcs=None):
         self.solution = solution
+        self._bcs = bcs
         self._init_lhs(lhs, bcs)
         self._init_rhs(rhs, bcs)
-        self._apply_bcs(bcs)
+        self._apply_bcs_to_rhs(bcs)
         self._linear_solver = "default"
     
     @overload
     def _init_lhs(self, lhs: Form, bcs: (list_of(DirichletBC), ProductOutputDirichletBC, dict_of(str, list_of(DirichletBC)), dict_of(str, ProductOutputDirichletBC), None)):
         self.lhs = assemble(lhs, keep_diagonal=True)
+        self._lhs_is_cacheable = False # a new matrix is assembled every time
         
     @overload
     def _init_lhs(self, lhs: ParametrizedTensorFactory, bcs: (list_of(DirichletBC), ProductOutputDirichletBC, dict_of(str, list_of(DirichletBC)), dict_of(str, ProductOutputDirichletBC), None)):
         self.lhs = evaluate(lhs)
+        self._lhs_is_cacheable = False # a new matrix is evaluated for every parameter value
         
     @overload
-    def _init_lhs(self, lhs: Matrix.Type(), bcs: None):
+    def _init_lhs(self, lhs: Matrix.Type(), bcs: (list_of(DirichletBC), ProductOutputDirichletBC, dict_of(str, list_of(DirichletBC)), dict_of(str, ProductOutputDirichletBC), None)):
+        # Note that a copy of lhs will be created when applying bcs, in order not to change the original reference
         self.lhs = lhs
-        
-    @overload
-    def _init_lhs(self, lhs: Matrix.Type(), bcs: (list_of(DirichletBC), ProductOutputDirichletBC, dict_of(str, list_of(DirichletBC)), dict_of(str, ProductOutputDirichletBC))):
-        # Create a copy of lhs, in order not to change
-        # the original references when applying bcs
-        self.lhs = lhs.copy()
+        self._lhs_is_cacheable = True
         
     @overload
     def _init_rhs(self, rhs: Form, bcs: (list_of(DirichletBC), ProductOutputDirichletBC, dict_of(str, list_of(DirichletBC)), dict_of(str, ProductOutputDirichletBC), None)):
@@ -72,20 +80,21 @@ class LinearSolver(AbstractLinearSolver):
         # the original references when applying bcs
         self.rhs = rhs.copy()
         
+    def _apply_bcs_to_rhs(self, bcs):
+        for bc in self._bcs_to_list(bcs):
+            bc.apply(self.rhs)
+            
     @overload
-    def _apply_bcs(self, bcs: None):
-        pass
+    def _bcs_to_list(self, bcs: None):
+        return list()
         
     @overload
-    def _apply_bcs(self, bcs: (list_of(DirichletBC), ProductOutputDirichletBC)):
-        for bc in bcs:
-            bc.apply(self.lhs, self.rhs)
+    def _bcs_to_list(self, bcs: (list_of(DirichletBC), ProductOutputDirichletBC)):
+        return list(bcs)
             
     @overload
-    def _apply_bcs(self, bcs: (dict_of(str, list_of(DirichletBC)), dict_of(str, ProductOutputDirichletBC))):
-        for key in bcs:
-            for bc in bcs[key]:
-                bc.apply(self.lhs, self.rhs)
+    def _bcs_to_list(self, bcs: (dict_of(str, list_of(DirichletBC)), dict_of(str, ProductOutputDirichletBC))):
+        return [bc for key in bcs for bc in bcs[key]]
                 
     def set_parameters(self, parameters):
         assert len(parameters) in (0, 1)
@@ -94,6 +103,64 @@ class LinearSolver(AbstractLinearSolver):
         self._linear_solver = parameters.get("linear_solver", "default")
         
     def solve(self):
-        solver = PETScLUSolver(self._linear_solver)
-        solver.solve(self.lhs, self.solution.vector(), self.rhs)
+        self._factorized_solver().solve(self.solution.vector(), self.rhs)
         return self.solution
+        
+    def solve_many(self, rhs_list, bcs_list=None):
+        """
+        Solve the linear system for each right-hand side in the provided list, reusing the same factorization.
+        If a list of BCs is provided, the i-th BCs are applied to the i-th right-hand side: they must be applied
+        on the same boundaries of the BCs provided to the constructor, but may have different values.
+        Solutions are returned as a list, and self.solution is not changed.
+        """
+        if bcs_list is None:
+            bcs_list = [self._bcs]*len(rhs_list)
+        assert len(bcs_list) == len(rhs_list)
+        solver = self._factorized_solver()
+        solutions = list()
+        for (rhs, bcs) in zip(rhs_list, bcs_list):
+            self._init_rhs(rhs, bcs)
+            self._apply_bcs_to_rhs(bcs)
+            solution = Function(self.solution.function_space())
+            solver.solve(solution.vector(), self.rhs)
+            solutions.append(solution)
+        return solutions
+        
+    def _factorized_solver(self):
+        # Get a factorized solver from cache, if available
+        cache_key = self._factorization_cache_key()
+        if cache_key is not None and cache_key in self._factorization_cache:
+            self._factorization_cache.move_to_end(cache_key)
+            (_, _, solver) = self._factorization_cache[cache_key]
+            return solver
+        # Otherwise, apply bcs to the left-hand side (on a copy, if the left-hand side was provided by the user,
+        # which is the only case in which it is cacheable)
+        bcs = self._bcs_to_list(self._bcs)
+        if len(bcs) > 0 and self._lhs_is_cacheable:
+            lhs = self.lhs.copy()
+        else:
+            lhs = self.lhs
+        for bc in bcs:
+            bc.apply(lhs)
+        solver = PETScLUSolver(self._linear_solver)
+        solver.set_operator(lhs)
+        # Store the factorized solver in cache, together with the objects whose identity is part of the key,
+        # so that they are kept alive as long as the cache entry exists
+        cache_size = config.get("backends", "linear solver factorization cache size")
+        if cache_key is not None:
+            self._factorization_cache[cache_key] = ((self.lhs, [bc.identifier() for bc in bcs]), lhs, solver)
+            while len(self._factorization_cache) > cache_size:
+                self._factorization_cache.popitem(last=False)
+        return solver
+        
+    def _factorization_cache_key(self):
+        if not self._lhs_is_cacheable or config.get("backends", "linear solver factorization cache size") == 0:
+            return None
+        lhs_petsc4py = to_petsc4py(self.lhs)
+        if not hasattr(lhs_petsc4py, "stateGet"): # not available in old petsc4py versions
+            return None
+        bcs_identifier = tuple(
+            id(identifier_item) if not isinstance(identifier_item, str) else identifier_item
+            for bc in self._bcs_to_list(self._bcs) for identifier_item in bc.identifier()
+        )
+        return (id(self.lhs), lhs_petsc4py.stateGet(), bcs_identifier, self._linear_solver)
@@ -16,9 +16,10 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
-from sympy import ccode, MatrixSymbol, sympify
+from numpy import unique
+from sympy import ccode, lambdify, MatrixSymbol, sympify
 from mpi4py.MPI import MAX, MIN
-from dolfin import ALE, cells, Function, FunctionSpace, has_pybind11, LagrangeInterpolator, VectorFunctionSpace
+from dolfin import cells, Function, FunctionSpace, has_pybind11, LagrangeInterpolator, VectorFunctionSpace
 if has_pybind11():
     from dolfin.cpp.log import log, LogLevel
     from dolfin.cpp.mesh import MeshFunctionSizet
@@ -64,19 +65,52 @@ class MeshMotion(AbstractMeshMotion):
         # Subdomain numbering is contiguous
         assert min(self.subdomain_id_to_deformation_dofs.keys()) == 0
         assert len(self.subdomain_id_to_deformation_dofs.keys()) == max(self.subdomain_id_to_deformation_dofs.keys()) + 1
+        # Also store the (local) vertices of each subdomain, to deform the mesh without interpolation
+        self.subdomain_id_to_vertices = dict() # from int to array
+        mesh_cells = self.mesh.cells()
+        subdomains_array = self.subdomains.array()
+        for subdomain_id in self.subdomain_id_to_deformation_dofs.keys():
+            self.subdomain_id_to_vertices[subdomain_id] = unique(mesh_cells[subdomains_array == subdomain_id + 1].flatten())
         
         # Store the shape parametrization expression
         self.shape_parametrization_expression = shape_parametrization_expression
         assert len(self.shape_parametrization_expression) == len(self.subdomain_id_to_deformation_dofs.keys())
         
-        # Prepare storage for displacement expression, computed by init()
+        # Prepare storage for the problem and for the vectorized shape parametrization, computed by init()
+        self.problem = None
+        self.shape_parametrization_function = list()
+        # Prepare storage for displacement expression, computed by compute_displacement()
         self.displacement_expression = list()
+        # Cache the deformed coordinates corresponding to the last value of the parameters,
+        # since the mesh is often moved multiple times for the same parameter (e.g. to export several solutions)
+        self._deformed_coordinates = None
+        self._deformed_coordinates_mu = None
         
     def init(self, problem):
+        if self.problem is None: # avoid initialize multiple times
+            # Preprocess the shape parametrization expression to convert it in a function which evaluates it
+            # at all vertices at once. This cannot be done during __init__ because at construction time the number
+            # of parameters is still unknown
+            self.problem = problem
+            
+            # Declare first some sympy simbolic quantities
+            from rbnics.shape_parametrization.utils.symbolic import python_string_to_sympy, sympy_symbolic_coordinates
+            from rbnics.shape_parametrization.utils.symbolic.python_string_to_sympy import MatrixListSymbol
+            x = sympy_symbolic_coordinates(self.mesh.geometry().dim(), MatrixListSymbol)
+            mu = MatrixListSymbol("mu", len(problem.mu), 1)
+            
+            # Then carry out the proprocessing
+            for shape_parametrization_expression_on_subdomain in self.shape_parametrization_expression:
+                assert len(shape_parametrization_expression_on_subdomain) == self.mesh.geometry().dim()
+                self.shape_parametrization_function.append(tuple(
+                    lambdify((tuple(x), tuple(mu)), python_string_to_sympy(shape_parametrization_component_on_subdomain, x, mu), "numpy")
+                    for shape_parametrization_component_on_subdomain in shape_parametrization_expression_on_subdomain
+                ))
+                
+    def _init_displacement_expression(self):
         if len(self.displacement_expression) == 0: # avoid initialize multiple times
             # Preprocess the shape parametrization expression to convert it in the displacement expression
-            # This cannot be done during __init__ because at construction time the number
-            # of parameters is still unknown
+            problem = self.problem
             
             # Declare first some sympy simbolic quantities, needed by ccode
             from rbnics.shape_parametrization.utils.symbolic import sympy_symbolic_coordinates
@@ -105,15 +139,29 @@ class MeshMotion(AbstractMeshMotion):
         
     def move_mesh(self):
         log(PROGRESS, "moving mesh")
-        displacement = self.compute_displacement()
-        ALE.move(self.mesh, displacement)
+        self.mesh.coordinates()[:] = self.compute_deformed_coordinates()
         
     def reset_reference(self):
         log(PROGRESS, "back to the reference mesh")
         self.mesh.coordinates()[:] = self.reference_coordinates
         
-    # Auxiliary method to deform the domain
+    # Auxiliary method to compute the coordinates of the vertices of the deformed domain
+    def compute_deformed_coordinates(self):
+        mu = tuple(self.problem.mu)
+        if mu != self._deformed_coordinates_mu:
+            deformed_coordinates = self.reference_coordinates.copy()
+            for (subdomain, shape_parametrization_function_on_subdomain) in enumerate(self.shape_parametrization_function):
+                subdomain_vertices = self.subdomain_id_to_vertices[subdomain]
+                reference_coordinates_on_subdomain = tuple(self.reference_coordinates[subdomain_vertices].T)
+                for (component, shape_parametrization_function_component_on_subdomain) in enumerate(shape_parametrization_function_on_subdomain):
+                    deformed_coordinates[subdomain_vertices, component] = shape_parametrization_function_component_on_subdomain(reference_coordinates_on_subdomain, mu)
+            self._deformed_coordinates = deformed_coordinates
+            self._deformed_coordinates_mu = mu
+        return self._deformed_coordinates
+        
+    # Auxiliary method to compute the displacement which deforms the domain
     def compute_displacement(self):
+        self._init_displacement_expression()
         displacement = Function(self.deformation_V)
         assert len(self.displacement_expression) == len(self.shape_parametrization_expression)
         for (subdomain, displacement_expression_on_subdomain) in enumerate(self.displacement_expression):
@@ -16,7 +16,8 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
-from ufl import Form
+from weakref import WeakKeyDictionary
+from ufl import Form, Measure
 from ufl.algorithms import expand_derivatives
 from dolfin import assemble
 from rbnics.backends.basic import ParametrizedTensorFactory as BasicParametrizedTensorFactory
@@ -52,8 +53,7 @@ class ParametrizedTensorFactory(ParametrizedTensorFactory_Base):
             )
         # Create empty snapshot
         def assemble_empty_snapshot():
-            empty_snapshot = assemble(form, keep_diagonal=True)
-            empty_snapshot.zero()
+            empty_snapshot = _assemble_empty_snapshot(form, spaces)
             empty_snapshot.generator = self
             return empty_snapshot
         # Call Parent
@@ -82,3 +82,38 @@ class ParametrizedTensorFactory(ParametrizedTensorFactory_Base):
             return ParametrizedTensorFactory_Base.create_interpolation_locations_container(self, subdomain_data=subdomain_data)
         else:
             return ParametrizedTensorFactory_Base.create_interpolation_locations_container(self)
+
+def _assemble_empty_snapshot(form, spaces):
+    """
+    Return a zero tensor with the same layout (and sparsity pattern, in case of bilinear forms) of the one
+    obtained by assembling the form. Since the sparsity pattern only depends on the function spaces and
+    on the integral types of the form, a cheap surrogate form is assembled in place of the (possibly
+    expensive to assemble) parametrized one, and the result is shared among all forms with the same
+    function spaces and integral types. Storage is indexed by the first function space through weak
+    references, so that stored tensors are released together with the function space.
+    """
+    integral_types = tuple(sorted(set(integral.integral_type() for integral in form.integrals())))
+    storage = _assemble_empty_snapshot._storage.setdefault(spaces[0], dict())
+    key = (spaces[1:], integral_types)
+    if key not in storage:
+        if all(integral_type in ("cell", "exterior_facet", "interior_facet") for integral_type in integral_types):
+            integrand = 1
+            for argument in form.arguments():
+                if len(argument.ufl_shape) > 0:
+                    argument = argument[tuple([0]*len(argument.ufl_shape))]
+                integrand = integrand*argument
+            surrogate_form = 0
+            for integral_type in integral_types:
+                measure = Measure(integral_type, domain=form.ufl_domain())
+                if integral_type == "interior_facet":
+                    surrogate_form += integrand("+")*measure
+                else:
+                    surrogate_form += integrand*measure
+        else:
+            surrogate_form = form
+        empty_snapshot = assemble(surrogate_form, keep_diagonal=True)
+        empty_snapshot.zero()
+        storage[key] = empty_snapshot
+    return copy(storage[key])
+    
+_assemble_empty_snapshot._storage = WeakKeyDictionary()
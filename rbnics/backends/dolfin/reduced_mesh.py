@@ -17,7 +17,8 @@
 #
 
 import os
-from dolfin import cells, has_hdf5, has_hdf5_parallel, has_pybind11, Mesh, MeshFunction
+from numpy import arange, argsort, array, int64, repeat, split, unique
+from dolfin import has_hdf5, has_hdf5_parallel, has_pybind11, Mesh, MeshFunction
 if has_pybind11():
     from dolfin.cpp.log import log, LogLevel
     DEBUG = LogLevel.DEBUG
@@ -132,6 +133,10 @@ def BasicReducedMesh(backend, wrapping):
             self.reduced_mesh_markers = dict() # from N to MeshFunction
             # ... which again is not initialized here for performance reasons
             
+            # Map between DOFs on V and on the reduced function space of the latest reduced mesh
+            self._dofs__to__reduced_dofs = None # tuple (of size len(V)) of dict from int to int
+            # ... which is only needed offline in the append() method
+            
             # DOFs list (of the full mesh) that need to be added at each N
             self.reduced_mesh_dofs_list = list() # list (of size N) of tuple (of size len(V)) of dofs
             if copy_from is not None:
@@ -204,16 +209,35 @@ def BasicReducedMesh(backend, wrapping):
             # Mark all cells
             N = self._get_next_index()
             reduced_mesh_markers = self.reduced_mesh_markers[N]
+            new_cells_marked = 0
             for (component, global_dof) in enumerate(global_dofs):
                 global_dof_found = 0
                 if global_dof in self.dof_to_cells[component]:
                     global_dof_found = 1
-                    for cell in self.dof_to_cells[component][global_dof]:
-                        reduced_mesh_markers[cell] = True
+                    cells = self.dof_to_cells[component][global_dof]
+                    if not reduced_mesh_markers.array()[cells].all():
+                        new_cells_marked = 1
+                        reduced_mesh_markers.array()[cells] = True
                 global_dof_found = self.mpi_comm.allreduce(global_dof_found, op=MAX)
                 assert global_dof_found == 1
-            # Actually update to data structures using updated cells marker
-            self._update()
+            new_cells_marked = self.mpi_comm.allreduce(new_cells_marked, op=MAX)
+            # Actually update to data structures using updated cells marker. If no new cell has been marked,
+            # the reduced mesh would be the same as the previous one: reuse it, and only map the new dofs
+            if N > 0 and new_cells_marked == 0 and self._dofs__to__reduced_dofs is not None:
+                self._extend()
+            else:
+                self._update()
+            
+        def _extend(self):
+            N = self._get_next_index()
+            self.reduced_mesh[N] = self.reduced_mesh[N - 1]
+            self.reduced_subdomain_data[N] = self.reduced_subdomain_data[N - 1]
+            self.reduced_function_spaces[N] = self.reduced_function_spaces[N - 1]
+            reduced_mesh_reduced_dofs_list = list(self.reduced_mesh_reduced_dofs_list[N - 1])
+            reduced_mesh_reduced_dofs_list.append(self._compute_reduced_dofs(self.reduced_mesh_dofs_list[-1]))
+            log(DEBUG, "Reduced DOFs list " + str(reduced_mesh_reduced_dofs_list))
+            log(DEBUG, "corresponding to DOFs list " + str(self.reduced_mesh_dofs_list))
+            self.reduced_mesh_reduced_dofs_list[N] = reduced_mesh_reduced_dofs_list
             
         def _update(self):
             N = self._get_next_index()
@@ -240,25 +264,29 @@ def BasicReducedMesh(backend, wrapping):
                 dofs__to__reduced_dofs.append(dofs__to__reduced_dofs_component)
                 log(DEBUG, "DOFs to reduced DOFs (component " + str(component) + ") is " + str(dofs__to__reduced_dofs[component]))
             self.reduced_function_spaces[N] = tuple(reduced_function_spaces)
+            self._dofs__to__reduced_dofs = tuple(dofs__to__reduced_dofs)
             # ... and fill in reduced_mesh_reduced_dofs_list ...
             reduced_mesh_reduced_dofs_list = list()
             for dofs in self.reduced_mesh_dofs_list:
-                reduced_dofs = list()
-                for (component, dof) in enumerate(dofs):
-                    dof_processor = -1
-                    reduced_dof = None
-                    if dof in dofs__to__reduced_dofs[component]:
-                        reduced_dof = dofs__to__reduced_dofs[component][dof]
-                        dof_processor = self.mpi_comm.rank
-                    dof_processor = self.mpi_comm.allreduce(dof_processor, op=MAX)
-                    assert dof_processor >= 0
-                    reduced_dofs.append(self.mpi_comm.bcast(reduced_dof, root=dof_processor))
-                assert len(reduced_dofs) in (1, 2)
-                reduced_mesh_reduced_dofs_list.append(tuple(reduced_dofs))
+                reduced_mesh_reduced_dofs_list.append(self._compute_reduced_dofs(dofs))
             log(DEBUG, "Reduced DOFs list " + str(reduced_mesh_reduced_dofs_list))
             log(DEBUG, "corresponding to DOFs list " + str(self.reduced_mesh_dofs_list))
             self.reduced_mesh_reduced_dofs_list[N] = reduced_mesh_reduced_dofs_list
             
+        def _compute_reduced_dofs(self, dofs):
+            reduced_dofs = list()
+            for (component, dof) in enumerate(dofs):
+                dof_processor = -1
+                reduced_dof = None
+                if dof in self._dofs__to__reduced_dofs[component]:
+                    reduced_dof = self._dofs__to__reduced_dofs[component][dof]
+                    dof_processor = self.mpi_comm.rank
+                dof_processor = self.mpi_comm.allreduce(dof_processor, op=MAX)
+                assert dof_processor >= 0
+                reduced_dofs.append(self.mpi_comm.bcast(reduced_dof, root=dof_processor))
+            assert len(reduced_dofs) in (1, 2)
+            return tuple(reduced_dofs)
+            
         def _init_for_append_if_needed(self):
             # Initialize dof to cells map only the first time
             if len(self.dof_to_cells) == 0:
@@ -267,8 +295,9 @@ def BasicReducedMesh(backend, wrapping):
                     dof_to_cells = self._compute_dof_to_cells(V_component)
                     # Debugging
                     log(DEBUG, "DOFs to cells map (component " + str(component) + ") on processor " + str(self.mpi_comm.rank) + ":")
+                    cells_global_indices = self.mesh.topology().global_indices(self.mesh.topology().dim())
                     for (global_dof, cells_) in dof_to_cells.items():
-                        log(DEBUG, "\t" + str(global_dof) + ": " + str([cell.global_index() for cell in cells_]))
+                        log(DEBUG, "\t" + str(global_dof) + ": " + str(cells_global_indices[cells_].tolist()))
                     # Add to storage
                     self.dof_to_cells.append(dof_to_cells)
                 self.dof_to_cells = tuple(self.dof_to_cells)
@@ -699,16 +728,18 @@ ReducedMesh_Base = BasicReducedMesh(backend, wrapping)
 class ReducedMesh(ReducedMesh_Base):
     def _compute_dof_to_cells(self, V_component):
         assert isinstance(V_component, FunctionSpace)
-        dof_to_cells = dict() # from global dof to cell
-        for cell in cells(self.mesh):
-            local_dofs = V_component.dofmap().cell_dofs(cell.index())
-            for local_dof in local_dofs:
-                global_dof = V_component.dofmap().local_to_global_index(local_dof)
-                if global_dof not in dof_to_cells:
-                    dof_to_cells[global_dof] = list()
-                if cell not in dof_to_cells[global_dof]:
-                    dof_to_cells[global_dof].append(cell)
-        return dof_to_cells
+        dofmap = V_component.dofmap()
+        # Tabulate the global dofs of all (non ghost) cells at once ...
+        num_cells = self.mesh.topology().ghost_offset(self.mesh.topology().dim())
+        local_to_global = dofmap.tabulate_local_to_global_dofs()
+        cells_local_dofs = array([dofmap.cell_dofs(cell_index) for cell_index in range(num_cells)], dtype=int64).reshape((num_cells, dofmap.max_element_dofs()))
+        cells_global_dofs = local_to_global[cells_local_dofs]
+        # ... and then group cells by global dof, sorting the flattened (global dof, cell) pairs by global dof
+        global_dofs = cells_global_dofs.flatten()
+        cell_indices = repeat(arange(num_cells), cells_global_dofs.shape[1])
+        sorting = argsort(global_dofs, kind="mergesort")
+        (unique_global_dofs, unique_global_dofs_start) = unique(global_dofs[sorting], return_index=True)
+        return dict(zip(unique_global_dofs.tolist(), split(cell_indices[sorting], unique_global_dofs_start[1:])))
         
     @staticmethod
     def _get_reduced_function_space_type(V_component):
@@ -20,6 +20,7 @@ from rbnics.backends.dolfin.wrapping.assemble import assemble
 from rbnics.backends.dolfin.wrapping.assemble_operator_for_derivative import assemble_operator_for_derivative
 from rbnics.backends.dolfin.wrapping.assemble_operator_for_restriction import assemble_operator_for_restriction
 from rbnics.backends.dolfin.wrapping.basis_functions_matrix_mul import basis_functions_matrix_mul_online_matrix, basis_functions_matrix_mul_online_vector
+from rbnics.backends.dolfin.wrapping.compile_cpp_code import compile_cpp_code, compile_extension_module
 from rbnics.backends.dolfin.wrapping.compute_theta_for_derivative import compute_theta_for_derivative
 from rbnics.backends.dolfin.wrapping.compute_theta_for_restriction import compute_theta_for_restriction
 from rbnics.backends.dolfin.wrapping.counterclockwise import counterclockwise
@@ -30,6 +31,7 @@ from rbnics.backends.dolfin.wrapping.evaluate_and_vectorize_sparse_matrix_at_dof
 from rbnics.backends.dolfin.wrapping.evaluate_basis_functions_matrix_at_dofs import evaluate_basis_functions_matrix_at_dofs
 from rbnics.backends.dolfin.wrapping.evaluate_expression import evaluate_expression
 from rbnics.backends.dolfin.wrapping.evaluate_sparse_function_at_dofs import evaluate_sparse_function_at_dofs
+from rbnics.backends.dolfin.wrapping.evaluate_sparse_tensors_at_dofs import evaluate_sparse_tensors_at_dofs
 from rbnics.backends.dolfin.wrapping.evaluate_sparse_vector_at_dofs import evaluate_sparse_vector_at_dofs
 from rbnics.backends.dolfin.wrapping.expand_sum_product import expand_sum_product
 from rbnics.backends.dolfin.wrapping.expression_description import expression_description
@@ -85,6 +87,8 @@ __all__ = [
     'basis_functions_matrix_mul_online_vector',
     'build_dof_map_reader_mapping',
     'build_dof_map_writer_mapping',
+    'compile_cpp_code',
+    'compile_extension_module',
     'compute_theta_for_derivative',
     'compute_theta_for_restriction',
     'counterclockwise',
@@ -96,6 +100,7 @@ __all__ = [
     'evaluate_basis_functions_matrix_at_dofs',
     'evaluate_expression',
     'evaluate_sparse_function_at_dofs',
+    'evaluate_sparse_tensors_at_dofs',
     'evaluate_sparse_vector_at_dofs',
     'expand_sum_product',
     'expression_description',
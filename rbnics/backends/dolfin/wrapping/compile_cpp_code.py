@@ -0,0 +1,44 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+import hashlib
+from dolfin import has_pybind11
+if has_pybind11():
+    from dolfin import compile_cpp_code as dolfin_compile_cpp_code
+else:
+    from dolfin import compile_extension_module as dolfin_compile_extension_module
+
+# Compile (or load from the DOLFIN JIT cache on disk) the C++ helpers only once per process:
+# modules are stored in a registry indexed by a digest of their code, which is also the
+# key DOLFIN uses to store them in its persistent cache
+def compile_cpp_code(cpp_code, **kwargs):
+    key = _compiled_modules_key("compile_cpp_code", cpp_code, kwargs)
+    if key not in _compiled_modules:
+        _compiled_modules[key] = dolfin_compile_cpp_code(cpp_code, **kwargs)
+    return _compiled_modules[key]
+    
+def compile_extension_module(cpp_code, **kwargs):
+    key = _compiled_modules_key("compile_extension_module", cpp_code, kwargs)
+    if key not in _compiled_modules:
+        _compiled_modules[key] = dolfin_compile_extension_module(cpp_code, **kwargs)
+    return _compiled_modules[key]
+    
+def _compiled_modules_key(compiler, cpp_code, kwargs):
+    return (compiler, hashlib.sha1((cpp_code + str(sorted(kwargs.items()))).encode("utf-8")).hexdigest())
+    
+_compiled_modules = dict()
@@ -21,12 +21,13 @@ from scipy.spatial.ckdtree import cKDTree as KDTree
 from mpi4py.MPI import SUM
 from dolfin import Cell, cells, Facet, facets, FunctionSpace, has_pybind11, Mesh, MeshEditor, MeshFunction, Vertex, vertices
 if has_pybind11():
-    from dolfin import compile_cpp_code
     from dolfin.cpp.log import log, LogLevel
     from dolfin.cpp.mesh import MeshFunctionBool
     DEBUG = LogLevel.DEBUG
 else:
-    from dolfin import compile_extension_module, DEBUG, log, MeshFunctionBool
+    from dolfin import DEBUG, log, MeshFunctionBool
+from rbnics.backends.dolfin.wrapping.compile_cpp_code import compile_cpp_code, compile_extension_module
+from rbnics.utils.profiler import profiler
 
 # Implement an extended version of cbcpost create_submesh that:
 # a) as cbcpost version (and in contrast to standard dolfin) also works in parallel
@@ -76,12 +77,12 @@ def create_submesh(mesh, markers):
     # ... first of all collect all vertices from all processors
     allgathered_mesh_global_vertex_indices__non_empty_processors = list()
     allgathered_mesh_global_vertex_indices__empty_processors = list()
-    for r in range(mpi_comm.size):
-        backup_first_marker_id_r = mpi_comm.bcast(backup_first_marker_id, root=r)
+    profiler.increment("MPI collectives")
+    for (backup_first_marker_id_r, mesh_global_vertex_indices_r) in mpi_comm.allgather((backup_first_marker_id, mesh_global_vertex_indices)):
         if backup_first_marker_id_r is None:
-            allgathered_mesh_global_vertex_indices__non_empty_processors.extend(mpi_comm.bcast(mesh_global_vertex_indices, root=r))
+            allgathered_mesh_global_vertex_indices__non_empty_processors.extend(mesh_global_vertex_indices_r)
         else:
-            allgathered_mesh_global_vertex_indices__empty_processors.extend(mpi_comm.bcast(mesh_global_vertex_indices, root=r))
+            allgathered_mesh_global_vertex_indices__empty_processors.extend(mesh_global_vertex_indices_r)
     allgathered_mesh_global_vertex_indices__non_empty_processors = sorted(unique(allgathered_mesh_global_vertex_indices__non_empty_processors))
     allgathered_mesh_global_vertex_indices__empty_processors = sorted(unique(allgathered_mesh_global_vertex_indices__empty_processors))
     # ... then create a dict that will contain the map from mesh global vertex index to submesh global vertex index.
@@ -101,12 +102,12 @@ def create_submesh(mesh, markers):
     # ... first of all collect all cells from all processors
     allgathered_mesh_global_cell_indices__non_empty_processors = list()
     allgathered_mesh_global_cell_indices__empty_processors = list()
-    for r in range(mpi_comm.size):
-        backup_first_marker_id_r = mpi_comm.bcast(backup_first_marker_id, root=r)
+    profiler.increment("MPI collectives")
+    for (backup_first_marker_id_r, mesh_global_cell_indices_r) in mpi_comm.allgather((backup_first_marker_id, mesh_global_cell_indices)):
         if backup_first_marker_id_r is None:
-            allgathered_mesh_global_cell_indices__non_empty_processors.extend(mpi_comm.bcast(mesh_global_cell_indices, root=r))
+            allgathered_mesh_global_cell_indices__non_empty_processors.extend(mesh_global_cell_indices_r)
         else:
-            allgathered_mesh_global_cell_indices__empty_processors.extend(mpi_comm.bcast(mesh_global_cell_indices, root=r))
+            allgathered_mesh_global_cell_indices__empty_processors.extend(mesh_global_cell_indices_r)
     allgathered_mesh_global_cell_indices__non_empty_processors = sorted(unique(allgathered_mesh_global_cell_indices__non_empty_processors))
     allgathered_mesh_global_cell_indices__empty_processors = sorted(unique(allgathered_mesh_global_cell_indices__empty_processors))
     # ... then create a dict that will contain the map from mesh global cell index to submesh global cell index.
@@ -139,6 +140,7 @@ def create_submesh(mesh, markers):
         )
     # Collect the global number of vertices and cells
     global_num_cells = mpi_comm.allreduce(len(submesh_cells), op=SUM)
+    profiler.increment("MPI collectives")
     global_num_vertices = len(allgathered_mesh_to_submesh_vertex_global_indices)
     # Fill in mesh_editor
     mesh_editor.init_vertices_global(len(submesh_vertices), global_num_vertices)
@@ -252,8 +254,9 @@ def create_submesh(mesh, markers):
     for mesh_facet_local_index in mesh_to_submesh_facets_local_indices.keys():
         mesh_facets_global_indices_in_submesh.append(mesh_facets_local_to_global_indices[mesh_facet_local_index])
     allgathered__mesh_facets_global_indices_in_submesh = list()
-    for r in range(mpi_comm.size):
-        allgathered__mesh_facets_global_indices_in_submesh.extend(mpi_comm.bcast(mesh_facets_global_indices_in_submesh, root=r))
+    profiler.increment("MPI collectives")
+    for mesh_facets_global_indices_in_submesh_r in mpi_comm.allgather(mesh_facets_global_indices_in_submesh):
+        allgathered__mesh_facets_global_indices_in_submesh.extend(mesh_facets_global_indices_in_submesh_r)
     allgathered__mesh_facets_global_indices_in_submesh = sorted(set(allgathered__mesh_facets_global_indices_in_submesh))
     mesh_to_submesh_facets_global_indices = dict()
     for (submesh_facet_global_index, mesh_facet_global_index) in enumerate(allgathered__mesh_facets_global_indices_in_submesh):
@@ -309,9 +312,8 @@ def create_submesh(mesh, markers):
                 submesh_local_entities_global_index.append(global_entity_index)
                 submesh_local_entities_global_to_local_index[global_entity_index] = local_entity_index
             # ... then gather all global indices from all processors
-            gathered__submesh_local_entities_global_index = list() # over processor id
-            for r in range(mpi_comm.size):
-                gathered__submesh_local_entities_global_index.append(mpi_comm.bcast(submesh_local_entities_global_index, root=r))
+            gathered__submesh_local_entities_global_index = mpi_comm.allgather(submesh_local_entities_global_index) # over processor id
+            profiler.increment("MPI collectives")
             # ... then create dict from global index to processors sharing it
             submesh_shared_entities__global = dict()
             for r in range(mpi_comm.size):
@@ -472,11 +474,12 @@ def map_functionspaces_between_mesh_and_submesh(functionspace_on_mesh, mesh, fun
             mpi_comm = mesh.mpi_comm()
             if not has_pybind11():
                 mpi_comm = mpi_comm.tompi4py()
-            allgathered_mesh_dofs_to_submesh_dofs = mpi_comm.bcast(mesh_dofs_to_submesh_dofs, root=0)
-            allgathered_submesh_dofs_to_mesh_dofs = mpi_comm.bcast(submesh_dofs_to_mesh_dofs, root=0)
-            for r in range(1, mpi_comm.size):
-                allgathered_mesh_dofs_to_submesh_dofs.update(mpi_comm.bcast(mesh_dofs_to_submesh_dofs, root=r))
-                allgathered_submesh_dofs_to_mesh_dofs.update(mpi_comm.bcast(submesh_dofs_to_mesh_dofs, root=r))
+            allgathered_mesh_dofs_to_submesh_dofs = dict()
+            allgathered_submesh_dofs_to_mesh_dofs = dict()
+            profiler.increment("MPI collectives")
+            for (mesh_dofs_to_submesh_dofs_r, submesh_dofs_to_mesh_dofs_r) in mpi_comm.allgather((mesh_dofs_to_submesh_dofs, submesh_dofs_to_mesh_dofs)):
+                allgathered_mesh_dofs_to_submesh_dofs.update(mesh_dofs_to_submesh_dofs_r)
+                allgathered_submesh_dofs_to_mesh_dofs.update(submesh_dofs_to_mesh_dofs_r)
         else:
             allgathered_mesh_dofs_to_submesh_dofs = mesh_dofs_to_submesh_dofs
             allgathered_submesh_dofs_to_mesh_dofs = submesh_dofs_to_mesh_dofs
@@ -25,25 +25,14 @@
 # and _get_local_dofmap is
 # Copyright (C) 2011 Garth N. Wells
 
-from dolfin import cells, has_pybind11
+from numpy import arange, array, empty, int64, lexsort, ones, repeat, tile
+from dolfin import has_pybind11
 
 def build_dof_map_writer_mapping(V, local_dofmap=None):
-    def extract_first_cell(mapping_output):
-        (min_global_cell_index, min_cell_dof) = mapping_output[0]
-        for i in range(1, len(mapping_output)):
-            (current_global_cell_index, current_cell_dof) = mapping_output[i]
-            if current_global_cell_index < min_global_cell_index:
-                min_global_cell_index = current_global_cell_index
-                min_cell_dof = current_cell_dof
-        return (min_global_cell_index, min_cell_dof)
     if V not in build_dof_map_writer_mapping._storage:
         if local_dofmap is None:
             local_dofmap = _get_local_dofmap(V)
-        dof_map_writer_mapping_original = _build_dof_map_writer_mapping(V, local_dofmap)
-        dof_map_writer_mapping_storage = dict()
-        for (key, value) in dof_map_writer_mapping_original.items():
-            dof_map_writer_mapping_storage[key] = extract_first_cell(value)
-        build_dof_map_writer_mapping._storage[V] = dof_map_writer_mapping_storage
+        build_dof_map_writer_mapping._storage[V] = _build_dof_map_writer_mapping(V, local_dofmap)
     return build_dof_map_writer_mapping._storage[V]
 build_dof_map_writer_mapping._storage = dict()
 
@@ -56,48 +45,30 @@ def build_dof_map_reader_mapping(V, local_dofmap=None):
 build_dof_map_reader_mapping._storage = dict()
 
 def _build_dof_map_writer_mapping(V, gathered_dofmap): # was build_global_to_cell_dof in dolfin
-    mpi_comm = V.mesh().mpi_comm()
-    if not has_pybind11():
-        mpi_comm = mpi_comm.tompi4py()
+    (global_cell_indices, cells_global_dofs) = gathered_dofmap
+    num_cell_dofs = cells_global_dofs.shape[1]
     
-    # Build global dof -> (global cell, local dof) map on root process
-    global_dof_to_cell_dof = dict()
-    if mpi_comm.rank == 0:
-        i = 0
-        while i < len(gathered_dofmap):
-            global_cell_index = gathered_dofmap[i]
-            i += 1
-            num_dofs = gathered_dofmap[i]
-            i += 1
-            for j in range(num_dofs):
-                if gathered_dofmap[i] not in global_dof_to_cell_dof:
-                    global_dof_to_cell_dof[gathered_dofmap[i]] = list()
-                global_dof_to_cell_dof[gathered_dofmap[i]].append([global_cell_index, j])
-                i += 1
-    global_dof_to_cell_dof = mpi_comm.bcast(global_dof_to_cell_dof, root=0)
+    # Build global dof -> (global cell, local dof) array, where the global cell is the one with
+    # minimum index among the cells containing the global dof
+    global_dofs = cells_global_dofs.flatten()
+    cells = repeat(global_cell_indices, num_cell_dofs)
+    cell_dofs = tile(arange(num_cell_dofs, dtype=int64), len(global_cell_indices))
+    sorting = lexsort((cells, global_dofs)) # sort by global dof first, and then by global cell index
+    first_occurrence = ones(len(sorting), dtype=bool)
+    first_occurrence[1:] = global_dofs[sorting][1:] != global_dofs[sorting][:-1]
+    sorting = sorting[first_occurrence]
+    global_dof_to_cell_dof = empty((global_dofs.max() + 1 if len(global_dofs) > 0 else 0, 2), dtype=int64)
+    global_dof_to_cell_dof.fill(-1) # for dofs which do not belong to V (e.g. in case of subspaces)
+    global_dof_to_cell_dof[global_dofs[sorting], 0] = cells[sorting]
+    global_dof_to_cell_dof[global_dofs[sorting], 1] = cell_dofs[sorting]
     return global_dof_to_cell_dof
     
 def _build_dof_map_reader_mapping(V, gathered_dofmap): # was build_dof_map in dolfin
-    mesh = V.mesh()
-    mpi_comm = mesh.mpi_comm()
-    if not has_pybind11():
-        mpi_comm = mpi_comm.tompi4py()
-
-    # Build global dofmap on root process
-    dof_map = dict()
-    if mpi_comm.rank == 0:
-        i = 0
-        while i < len(gathered_dofmap):
-            global_cell_index = gathered_dofmap[i]
-            i += 1
-            num_dofs = gathered_dofmap[i]
-            i += 1
-            assert global_cell_index not in dof_map
-            dof_map[global_cell_index] = list()
-            for j in range(num_dofs):
-                dof_map[global_cell_index].append(gathered_dofmap[i])
-                i += 1
-    dof_map = mpi_comm.bcast(dof_map, root=0)
+    (global_cell_indices, cells_global_dofs) = gathered_dofmap
+    
+    # Build global cell -> global dofs array
+    dof_map = empty((global_cell_indices.max() + 1 if len(global_cell_indices) > 0 else 0, cells_global_dofs.shape[1]), dtype=int64)
+    dof_map[global_cell_indices] = cells_global_dofs
     return dof_map
 
 def _get_local_dofmap(V):
@@ -107,35 +78,24 @@ def _get_local_dofmap(V):
     if not has_pybind11():
         mpi_comm = mpi_comm.tompi4py()
     
-    local_dofmap = list() # of integers
-    
     # Check that local-to-global cell numbering is available
-    assert mesh.topology().have_global_indices(mesh.topology().dim())
+    dim = mesh.topology().dim()
+    assert mesh.topology().have_global_indices(dim)
     
     # Get local-to-global map
     local_to_global_dof = dofmap.tabulate_local_to_global_dofs()
     
-    # Build dof map data with global cell indices
-    for cell in cells(mesh):
-        local_cell_index = cell.index()
-        global_cell_index = cell.global_index()
-        cell_dofs = dofmap.cell_dofs(local_cell_index)
-
-        cell_dofs_global = list()
-        for cell_dof in cell_dofs:
-            cell_dofs_global.append(local_to_global_dof[cell_dof])
-        
-        # Store information as follows: global_cell_index, size of dofs, cell dof global 1, ...., cell dof global end
-        local_dofmap.append(global_cell_index)
-        local_dofmap.append(len(cell_dofs))
-        local_dofmap.extend(cell_dofs_global)
-
-    # Gather dof map data on root process
-    gathered_dofmap = mpi_comm.gather(local_dofmap, root=0)
-    if mpi_comm.rank == 0:
-        gathered_dofmap_flattened = list()
-        for proc_map in gathered_dofmap:
-            gathered_dofmap_flattened.extend(proc_map)
-        return gathered_dofmap_flattened
-    else:
-        return list()
+    # Build dof map data with global cell indices for all (non ghost) cells
+    num_cells = mesh.topology().ghost_offset(dim)
+    num_cell_dofs = dofmap.max_element_dofs()
+    global_cell_indices = array(mesh.topology().global_indices(dim)[:num_cells], dtype=int64)
+    cells_local_dofs = array([dofmap.cell_dofs(local_cell_index) for local_cell_index in range(num_cells)], dtype=int64).reshape((num_cells, num_cell_dofs))
+    cells_global_dofs = array(local_to_global_dof[cells_local_dofs], dtype=int64)
+    
+    # Gather dof map data on all processes
+    num_cells_per_process = array(mpi_comm.allgather(num_cells), dtype=int64)
+    gathered_global_cell_indices = empty(num_cells_per_process.sum(), dtype=int64)
+    mpi_comm.Allgatherv(global_cell_indices, [gathered_global_cell_indices, num_cells_per_process])
+    gathered_cells_global_dofs = empty((num_cells_per_process.sum(), num_cell_dofs), dtype=int64)
+    mpi_comm.Allgatherv(cells_global_dofs, [gathered_cells_global_dofs, num_cells_per_process*num_cell_dofs])
+    return (gathered_global_cell_indices, gathered_cells_global_dofs)
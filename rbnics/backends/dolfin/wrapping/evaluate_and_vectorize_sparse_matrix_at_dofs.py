@@ -16,9 +16,11 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
-from mpi4py.MPI import MAX
+from numpy import zeros
+from mpi4py.MPI import SUM
 from rbnics.backends.online import OnlineVector
 from rbnics.backends.dolfin.wrapping.to_petsc4py import to_petsc4py
+from rbnics.utils.profiler import profiler
 
 def evaluate_and_vectorize_sparse_matrix_at_dofs(sparse_matrix, dofs_list):
     mat = to_petsc4py(sparse_matrix)
@@ -26,16 +28,21 @@ def evaluate_and_vectorize_sparse_matrix_at_dofs(sparse_matrix, dofs_list):
     out_size = len(dofs_list)
     out = OnlineVector(out_size)
     mpi_comm = mat.comm.tompi4py()
+    # Pack values of locally owned rows (first row) and a flag marking them as found (second row) ...
+    local_values = zeros((2, out_size))
     for (index, dofs) in enumerate(dofs_list):
         assert len(dofs) == 2
         i = dofs[0]
-        out_index = None
-        mat_ij_processor = -1
         if i >= row_start and i < row_end:
             j = dofs[1]
-            out_index = mat.getValue(i, j)
-            mat_ij_processor = mpi_comm.rank
-        mat_ij_processor = mpi_comm.allreduce(mat_ij_processor, op=MAX)
-        assert mat_ij_processor >= 0
-        out[index] = mpi_comm.bcast(out_index, root=mat_ij_processor)
+            local_values[0, index] = mat.getValue(i, j)
+            local_values[1, index] = 1.
+    # ... exchange them with a single collective, since each row is owned by exactly one processor ...
+    global_values = zeros((2, out_size))
+    mpi_comm.Allreduce(local_values, global_values, op=SUM)
+    profiler.increment("MPI collectives")
+    assert (global_values[1] == 1.).all()
+    # ... and unpack them
+    for index in range(out_size):
+        out[index] = global_values[0, index]
     return out
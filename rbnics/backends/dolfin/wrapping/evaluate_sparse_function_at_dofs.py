@@ -16,11 +16,13 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
-from mpi4py.MPI import MAX
+from numpy import array, bincount, cumsum, searchsorted, zeros
+from mpi4py.MPI import SUM
 from petsc4py import PETSc
 from dolfin import Function
 from rbnics.backends.dolfin.wrapping.evaluate_sparse_vector_at_dofs import evaluate_sparse_vector_at_dofs
 from rbnics.backends.dolfin.wrapping.to_petsc4py import to_petsc4py
+from rbnics.utils.profiler import profiler
 
 def evaluate_sparse_function_at_dofs(input_function, dofs_list, output_V=None, reduced_dofs_list=None):
     assert (
@@ -39,27 +41,34 @@ def evaluate_sparse_function_at_dofs(input_function, dofs_list, output_V=None, r
     
 def _evaluate_sparse_function_at_dofs(vec, dofs_list, out, reduced_dofs_list):
     vec_row_start, vec_row_end = vec.getOwnershipRange()
-    out_row_start, out_row_end = out.getOwnershipRange()
+    out_ownership_ranges = out.getOwnershipRanges()
     mpi_comm = vec.comm.tompi4py()
-    for (i, reduced_i) in zip(dofs_list, reduced_dofs_list):
-        out_index = None
-        vec_i_processor = -1
-        if i >= vec_row_start and i < vec_row_end:
-            out_index = vec.getValue(i)
-            vec_i_processor = mpi_comm.rank
-        vec_i_processor = mpi_comm.allreduce(vec_i_processor, op=MAX)
-        assert vec_i_processor >= 0
-        out_reduced_i_processor = -1
-        if reduced_i >= out_row_start and reduced_i < out_row_end:
-            out_reduced_i_processor = mpi_comm.rank
-        out_reduced_i_processor = mpi_comm.allreduce(vec_i_processor, op=MAX)
-        assert out_reduced_i_processor >= 0
-        if vec_i_processor != out_reduced_i_processor:
-            if mpi_comm.rank == vec_i_processor:
-                mpi_comm.send(out_index, dest=out_reduced_i_processor)
-            if mpi_comm.rank == out_reduced_i_processor:
-                out_index = mpi_comm.recv(source=vec_i_processor)
-        if mpi_comm.rank == out_reduced_i_processor:
-            out.setValues(reduced_i, out_index, addv=PETSc.InsertMode.INSERT)
+    # Pack values of locally owned dofs, sorted by the processor owning the corresponding reduced dof ...
+    dofs = array(dofs_list, dtype=PETSc.IntType).reshape(-1)
+    reduced_dofs = array(reduced_dofs_list, dtype=PETSc.IntType).reshape(-1)
+    assert dofs.shape == reduced_dofs.shape
+    owned = (dofs >= vec_row_start) & (dofs < vec_row_end)
+    found = mpi_comm.allreduce(int(owned.sum()), op=SUM)
+    assert found == len(dofs)
+    send_reduced_dofs = reduced_dofs[owned]
+    send_values = vec.getValues(dofs[owned]) if len(send_reduced_dofs) > 0 else zeros(0)
+    send_processors = searchsorted(out_ownership_ranges, send_reduced_dofs, side="right") - 1
+    order = send_processors.argsort(kind="mergesort")
+    send_reduced_dofs = send_reduced_dofs[order]
+    send_values = send_values[order]
+    send_counts = bincount(send_processors, minlength=mpi_comm.size).astype(PETSc.IntType)
+    # ... exchange them with a single all-to-all communication ...
+    recv_counts = zeros(mpi_comm.size, dtype=PETSc.IntType)
+    mpi_comm.Alltoall(send_counts, recv_counts)
+    send_displacements = cumsum(send_counts) - send_counts
+    recv_displacements = cumsum(recv_counts) - recv_counts
+    recv_reduced_dofs = zeros(recv_counts.sum(), dtype=PETSc.IntType)
+    mpi_comm.Alltoallv((send_reduced_dofs, (send_counts, send_displacements)), (recv_reduced_dofs, (recv_counts, recv_displacements)))
+    recv_values = zeros(recv_counts.sum(), dtype=send_values.dtype)
+    mpi_comm.Alltoallv((send_values, (send_counts, send_displacements)), (recv_values, (recv_counts, recv_displacements)))
+    profiler.increment("MPI collectives", 4) # ownership check, counts and two all-to-all exchanges
+    # ... and unpack them
+    if len(recv_reduced_dofs) > 0:
+        out.setValues(recv_reduced_dofs, recv_values, addv=PETSc.InsertMode.INSERT)
     out.assemble()
     out.ghostUpdate()
@@ -0,0 +1,62 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from numpy import array, nonzero, zeros
+from mpi4py.MPI import SUM
+from petsc4py import PETSc
+from rbnics.backends.dolfin.wrapping.to_petsc4py import to_petsc4py
+from rbnics.backends.online import OnlineMatrix
+from rbnics.utils.profiler import profiler
+
+# Evaluate several vectors (or matrices, to be vectorized) with the same parallel layout at the same dofs (or pairs of dofs),
+# exchanging the values of all of them with a single collective. Returns a matrix with a row for each entry of dofs_list
+# and a column for each tensor
+def evaluate_sparse_tensors_at_dofs(sparse_tensors, dofs_list):
+    tensors = [to_petsc4py(sparse_tensor) for sparse_tensor in sparse_tensors]
+    out_size = len(dofs_list)
+    out = OnlineMatrix(out_size, len(tensors))
+    if len(tensors) == 0:
+        return out
+    row_start, row_end = tensors[0].getOwnershipRange()
+    mpi_comm = tensors[0].comm.tompi4py()
+    # Pack values of locally owned dofs (a column for each tensor) and a flag marking them as found (last column) ...
+    assert all(len(dofs) == len(dofs_list[0]) for dofs in dofs_list)
+    i = array([dofs[0] for dofs in dofs_list], dtype=PETSc.IntType).reshape(-1)
+    local_values = zeros((out_size, len(tensors) + 1))
+    owned = (i >= row_start) & (i < row_end)
+    if owned.any():
+        if len(dofs_list[0]) == 1:
+            for (t, tensor) in enumerate(tensors):
+                assert tensor.getOwnershipRange() == (row_start, row_end)
+                local_values[owned, t] = tensor.getValues(i[owned])
+        else:
+            assert len(dofs_list[0]) == 2
+            j = array([dofs[1] for dofs in dofs_list], dtype=PETSc.IntType).reshape(-1)
+            for (t, tensor) in enumerate(tensors):
+                assert tensor.getOwnershipRange() == (row_start, row_end)
+                for index in nonzero(owned)[0]:
+                    local_values[index, t] = tensor.getValue(i[index], j[index])
+        local_values[owned, -1] = 1.
+    # ... exchange them with a single collective, since each dof is owned by exactly one processor ...
+    global_values = zeros((out_size, len(tensors) + 1))
+    mpi_comm.Allreduce(local_values, global_values, op=SUM)
+    profiler.increment("MPI collectives")
+    assert (global_values[:, -1] == 1.).all()
+    # ... and unpack them
+    out[:, :] = global_values[:, :-1]
+    return out
@@ -16,9 +16,12 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
-from mpi4py.MPI import MAX
+from numpy import array, zeros
+from mpi4py.MPI import SUM
+from petsc4py import PETSc
 from rbnics.backends.dolfin.wrapping.to_petsc4py import to_petsc4py
 from rbnics.backends.online import OnlineVector
+from rbnics.utils.profiler import profiler
 
 def evaluate_sparse_vector_at_dofs(sparse_vector, dofs_list):
     vec = to_petsc4py(sparse_vector)
@@ -26,15 +29,20 @@ def evaluate_sparse_vector_at_dofs(sparse_vector, dofs_list):
     out_size = len(dofs_list)
     out = OnlineVector(out_size)
     mpi_comm = vec.comm.tompi4py()
-    for (index, dofs) in enumerate(dofs_list):
-        assert len(dofs) == 1
-        i = dofs[0]
-        out_index = None
-        vec_i_processor = -1
-        if i >= row_start and i < row_end:
-            out_index = vec.getValue(i)
-            vec_i_processor = mpi_comm.rank
-        vec_i_processor = mpi_comm.allreduce(vec_i_processor, op=MAX)
-        assert vec_i_processor >= 0
-        out[index] = mpi_comm.bcast(out_index, root=vec_i_processor)
+    # Pack values of locally owned dofs (first row) and a flag marking them as found (second row) ...
+    assert all(len(dofs) == 1 for dofs in dofs_list)
+    i = array([dofs[0] for dofs in dofs_list], dtype=PETSc.IntType).reshape(-1)
+    local_values = zeros((2, out_size))
+    owned = (i >= row_start) & (i < row_end)
+    if owned.any():
+        local_values[0, owned] = vec.getValues(i[owned])
+        local_values[1, owned] = 1.
+    # ... exchange them with a single collective, since each dof is owned by exactly one processor ...
+    global_values = zeros((2, out_size))
+    mpi_comm.Allreduce(local_values, global_values, op=SUM)
+    profiler.increment("MPI collectives")
+    assert (global_values[1] == 1.).all()
+    # ... and unpack them
+    for index in range(out_size):
+        out[index] = global_values[0, index]
     return out
@@ -253,8 +253,10 @@ def basic_form_on_reduced_function_space(backend, wrapping, online_backend, onli
                 solution_from = reduced_basis_functions[:solution_from_N]*solution_from
                 backend.assign(solution_to, solution_from)
         
-        # Assemble and return
-        assembled_replaced_form = wrapping.assemble(replaced_form_with_replaced_measures)
+        # Assemble and return. The tensor of a previous assembly is reused, so that its sparsity pattern is not
+        # recomputed when evaluating the same form for many parameters
+        assembled_replaced_form = wrapping.assemble(replaced_form_with_replaced_measures, form_on_reduced_function_space__tensor_cache.get((form_name, reduced_V)))
+        form_on_reduced_function_space__tensor_cache[(form_name, reduced_V)] = assembled_replaced_form
         form_rank = assembled_replaced_form.rank()
         return (assembled_replaced_form, form_rank)
         
@@ -267,6 +269,7 @@ def basic_form_on_reduced_function_space(backend, wrapping, online_backend, onli
     form_on_reduced_function_space__reduced_problem_to_components_cache = dict()
     form_on_reduced_function_space__reduced_problem_to_reduced_mesh_solution_cache = dict()
     form_on_reduced_function_space__reduced_problem_to_reduced_basis_functions_cache = dict()
+    form_on_reduced_function_space__tensor_cache = dict()
     
     return _basic_form_on_reduced_function_space
 
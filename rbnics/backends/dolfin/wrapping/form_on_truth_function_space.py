@@ -16,7 +16,17 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
+from petsc4py import PETSc
+from ufl.classes import ConstantValue, Product
+from ufl.corealg.traversal import pre_traversal, traverse_unique_terminals
+from dolfin import assemble, Constant, has_pybind11
+if has_pybind11():
+    from dolfin.function.expression import BaseExpression
+else:
+    from dolfin import Expression as BaseExpression
 from rbnics.backends.dolfin.wrapping.function_extend_or_restrict import _sub_from_tuple
+from rbnics.backends.dolfin.wrapping.parametrized_constant import is_parametrized_constant
+from rbnics.backends.dolfin.wrapping.to_petsc4py import to_petsc4py
 from rbnics.eim.utils.decorators import get_problem_from_parametrized_operator, get_problem_from_solution, get_reduced_problem_from_problem, is_training_finished, is_training_started
 from rbnics.utils.decorators import exact_problem
 from rbnics.utils.mpi import log, PROGRESS
@@ -68,6 +78,13 @@ def basic_form_on_truth_function_space(backend, wrapping):
             form_on_truth_function_space__reduced_problem_to_components_cache[form_name] = reduced_problem_to_components
             form_on_truth_function_space__reduced_problem_to_truth_solution_cache[form_name] = reduced_problem_to_truth_solution
             
+            # Forms which only depend on the parameters through parametrized constants are decomposed once,
+            # so that subsequent evaluations only require a linear combination of the assembled sub-forms
+            if len(truth_problems) == 0:
+                form_on_truth_function_space__affine_decomposition_cache[form_name] = _affine_decomposition(form, wrapping)
+            else:
+                form_on_truth_function_space__affine_decomposition_cache[form_name] = None
+            
         # Extract from cache
         truth_problems = form_on_truth_function_space__truth_problems_cache[form_name]
         truth_problem_to_components = form_on_truth_function_space__truth_problem_to_components_cache[form_name]
@@ -75,6 +92,7 @@ def basic_form_on_truth_function_space(backend, wrapping):
         truth_problem_to_truth_solution = form_on_truth_function_space__truth_problem_to_truth_solution_cache[form_name]
         reduced_problem_to_components = form_on_truth_function_space__reduced_problem_to_components_cache[form_name]
         reduced_problem_to_truth_solution = form_on_truth_function_space__reduced_problem_to_truth_solution_cache[form_name]
+        affine_decomposition = form_on_truth_function_space__affine_decomposition_cache[form_name]
         
         # Get list of truth and reduced problems that need to be solved, possibly updating cache
         required_truth_problems = list()
@@ -175,7 +193,10 @@ def basic_form_on_truth_function_space(backend, wrapping):
                 backend.assign(solution_to, solution_from)
         
         # Assemble
-        assembled_form = wrapping.assemble(form, tensor)
+        if affine_decomposition is not None:
+            assembled_form = _assemble_from_affine_decomposition(form_wrapper, affine_decomposition, tensor)
+        else:
+            assembled_form = wrapping.assemble(form, tensor)
         assembled_form.generator = form_wrapper # for I/O
         form_rank = assembled_form.rank()
         
@@ -206,9 +227,73 @@ def basic_form_on_truth_function_space(backend, wrapping):
     form_on_truth_function_space__truth_problem_to_truth_solution_cache = dict()
     form_on_truth_function_space__reduced_problem_to_components_cache = dict()
     form_on_truth_function_space__reduced_problem_to_truth_solution_cache = dict()
+    form_on_truth_function_space__affine_decomposition_cache = dict()
     
     return _basic_form_on_truth_function_space
 
+def _affine_decomposition(form, wrapping):
+    """
+    Return a list of pairs (coefficients, assembled sub-form) such that the form is equal to the sum
+    of the products of each coefficient list times the corresponding sub-form, or None if the form
+    depends on the parameters (or on time) through anything else than scalar parametrized constants.
+    """
+    from rbnics.backends.dolfin.separated_parametrized_form import SeparatedParametrizedForm # cannot import at global scope due to cyclic dependence
+    # Quick check on expressions in the form
+    for node in wrapping.form_iterator(form):
+        if isinstance(node, BaseExpression):
+            if has_pybind11():
+                parameters = node._parameters
+            else:
+                parameters = node.user_parameters
+            if "t" in parameters:
+                return None
+            if "mu_0" in parameters and not is_parametrized_constant(node):
+                return None
+    # Separate the form
+    separated_form = SeparatedParametrizedForm(form)
+    separated_form.separate()
+    affine_decomposition = list()
+    for (addend_index, addend) in enumerate(separated_form.coefficients):
+        # Each coefficient must be a scalar which can be evaluated without a mesh, and must appear linearly in the form
+        for factor in addend:
+            if factor.ufl_shape != ():
+                return None
+            for terminal in traverse_unique_terminals(factor):
+                if not (is_parametrized_constant(terminal) or isinstance(terminal, (Constant, ConstantValue))):
+                    return None
+        form_with_placeholders = separated_form._form_with_placeholders[addend_index]
+        for placeholder in separated_form._placeholders[addend_index]:
+            occurrences = 0
+            for integral in form_with_placeholders.integrals():
+                for node in pre_traversal(integral.integrand()):
+                    for operand in node.ufl_operands:
+                        if operand == placeholder:
+                            if not isinstance(node, Product):
+                                return None
+                            occurrences += 1
+            if occurrences != 1:
+                return None
+        affine_decomposition.append((addend, assemble(separated_form.replace_placeholders(addend_index, [1]*len(addend)), keep_diagonal=True)))
+    if len(separated_form.unchanged_forms) > 0:
+        affine_decomposition.append(([], assemble(sum(separated_form.unchanged_forms), keep_diagonal=True)))
+    return affine_decomposition
+    
+def _assemble_from_affine_decomposition(form_wrapper, affine_decomposition, tensor=None):
+    if tensor is None:
+        tensor = form_wrapper.create_empty_snapshot()
+    else:
+        tensor.zero()
+    for (coefficients, assembled_sub_form) in affine_decomposition:
+        theta = 1.
+        for coefficient in coefficients:
+            theta *= float(coefficient)
+        if assembled_sub_form.rank() == 2:
+            # The sparsity pattern of each sub-form is contained in the one of the whole form
+            to_petsc4py(tensor).axpy(theta, to_petsc4py(assembled_sub_form), PETSc.Mat.Structure.SUBSET_NONZERO_PATTERN)
+        else:
+            tensor.axpy(theta, assembled_sub_form)
+    return tensor
+    
 # No explicit instantiation for backend = rbnics.backends.dolfin to avoid
 # circular dependencies. The concrete instatiation will be carried out in
 # rbnics.backends.dolfin.evaluate
@@ -17,7 +17,7 @@
 #
 
 from collections import OrderedDict
-from dolfin import assign, Function
+from dolfin import Function, FunctionAssigner
 
 def function_extend_or_restrict(function, function_components, V, V_components, weight, copy, extended_or_restricted_function=None):
     function_V = function.function_space()
@@ -62,7 +62,7 @@ def function_extend_or_restrict(function, function_components, V, V_components,
             else:
                 output = extended_or_restricted_function
                 assert output.function_space() == V
-            assign(_sub_from_tuple(output, V_index), _sub_from_tuple(function, function_V_index))
+            _assign(output, V_index, function, function_V_index)
             if weight is not None:
                 output.vector()[:] *= weight
             return output
@@ -78,7 +78,7 @@ def function_extend_or_restrict(function, function_components, V, V_components,
             extended_function = extended_or_restricted_function
             assert extended_function.function_space() == V
         for (index_V_as_tuple, index_function_V_as_tuple) in V_to_function_V_mapping.items():
-            assign(_sub_from_tuple(extended_function, index_V_as_tuple), _sub_from_tuple(function, index_function_V_as_tuple))
+            _assign(extended_function, index_V_as_tuple, function, index_function_V_as_tuple)
         if weight is not None:
             extended_function.vector()[:] *= weight
         return extended_function
@@ -94,11 +94,22 @@ def function_extend_or_restrict(function, function_components, V, V_components,
             restricted_function = extended_or_restricted_function
             assert restricted_function.function_space() == V
         for (index_function_V_as_tuple, index_V_as_tuple) in function_V_to_V_mapping.items():
-            assign(_sub_from_tuple(restricted_function, index_V_as_tuple), _sub_from_tuple(function, index_function_V_as_tuple))
+            _assign(restricted_function, index_V_as_tuple, function, index_function_V_as_tuple)
         if weight is not None:
             restricted_function.vector()[:] *= weight
         return restricted_function
     
+def _assign(receiving_function, receiving_index, assigning_function, assigning_index):
+    receiving_V = receiving_function.function_space()
+    assigning_V = assigning_function.function_space()
+    # Cache function assigners, since their construction requires to build a map between dofs of the two spaces
+    key = (receiving_V, receiving_index, assigning_V, assigning_index)
+    if key not in _assign._storage:
+        _assign._storage[key] = FunctionAssigner(_sub_from_tuple(receiving_V, receiving_index), _sub_from_tuple(assigning_V, assigning_index))
+    assigner = _assign._storage[key]
+    assigner.assign(_sub_from_tuple(receiving_function, receiving_index), _sub_from_tuple(assigning_function, assigning_index))
+_assign._storage = dict()
+    
 def _function_spaces_eq(V, W, index_V, index_W): # V == W
     V = _sub_from_tuple(V, index_V)
     W = _sub_from_tuple(W, index_W)
@@ -23,7 +23,7 @@ from rbnics.backends.dolfin.wrapping.function_extend_or_restrict import function
 from rbnics.backends.dolfin.wrapping.get_function_subspace import get_function_subspace
 from rbnics.backends.dolfin.wrapping.function_save import _all_xdmf_latest_suffix, _all_xdmf_files
 from rbnics.utils.mpi import is_io_process
-from rbnics.utils.io import TextIO as SuffixIO
+from rbnics.utils.io import BinaryIO as SuffixIO
 
 def function_load(fun, directory, filename, suffix=None):
     fun_V = fun.function_space()
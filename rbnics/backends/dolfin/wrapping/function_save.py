@@ -27,7 +27,7 @@ else:
 from rbnics.backends.dolfin.wrapping.function_extend_or_restrict import function_extend_or_restrict
 from rbnics.backends.dolfin.wrapping.get_function_subspace import get_function_subspace
 from rbnics.utils.mpi import is_io_process
-from rbnics.utils.io import TextIO as SuffixIO
+from rbnics.utils.io import BinaryIO as SuffixIO
 
 def function_save(fun, directory, filename, suffix=None):
     fun_V = fun.function_space()
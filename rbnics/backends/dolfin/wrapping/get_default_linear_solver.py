@@ -17,10 +17,7 @@
 #
 
 from dolfin import has_pybind11
-if has_pybind11():
-    from dolfin import compile_cpp_code
-else:
-    from dolfin import compile_extension_module
+from rbnics.backends.dolfin.wrapping.compile_cpp_code import compile_cpp_code, compile_extension_module
 
 cpp_code = """
         std::string get_default_linear_solver()
@@ -18,8 +18,7 @@
 
 from mpi4py.MPI import MAX
 from dolfin import has_pybind11
-if has_pybind11():
-    from dolfin import compile_cpp_code
+from rbnics.backends.dolfin.wrapping.compile_cpp_code import compile_cpp_code
 from rbnics.backends.dolfin.wrapping.get_global_dof_to_local_dof_map import get_global_dof_to_local_dof_map
 
 def get_global_dof_component(global_dof, V, global_to_local=None, local_dof_to_component=None):
@@ -18,7 +18,7 @@
 
 from dolfin import as_backend_type, has_pybind11
 if has_pybind11():
-    from dolfin import compile_cpp_code
+    from rbnics.backends.dolfin.wrapping.compile_cpp_code import compile_cpp_code
 else: # legacy tr(A^T B) code, to be removed
     from rbnics.backends.dolfin.wrapping.to_petsc4py import to_petsc4py
     
@@ -17,11 +17,13 @@
 #
 
 from collections import defaultdict, namedtuple, OrderedDict
+import hashlib
 import itertools
+import os
 import re
 from numpy import allclose, isclose, ones as numpy_ones, zeros as numpy_zeros
 from mpi4py.MPI import Op
-from sympy import Basic as SympyBase, ccode, collect, Float, ImmutableMatrix, Integer, Matrix as SympyMatrix, Number, preorder_traversal, simplify, symbols, sympify
+from sympy import Basic as SympyBase, ccode, collect, Float, ImmutableMatrix, Integer, Matrix as SympyMatrix, Number, preorder_traversal, simplify, srepr, symbols, sympify
 from ufl import as_tensor, FiniteElement, Form, Measure, sqrt, TensorElement, VectorElement
 from ufl.algorithms import apply_transformer, expand_derivatives, Transformer
 from ufl.algorithms.apply_derivatives import apply_derivatives
@@ -35,15 +37,18 @@ from ufl.corealg.traversal import pre_traversal, traverse_unique_terminals
 from ufl.indexed import Indexed
 from dolfin import assemble, cells, Constant, Expression, facets, has_pybind11
 if has_pybind11():
-    from dolfin import compile_cpp_code, CompiledExpression
+    from dolfin import CompiledExpression
     from dolfin.cpp.la import GenericMatrix, GenericVector
     from dolfin.function.expression import BaseExpression
 else:
     from dolfin import Expression as BaseExpression, GenericMatrix, GenericVector
+from rbnics.backends.dolfin.wrapping.compile_cpp_code import compile_cpp_code
 from rbnics.backends.dolfin.wrapping.expand_sum_product import expand_sum_product
 import rbnics.backends.dolfin.wrapping.form_mul # enable form multiplication and division  # noqa
 from rbnics.backends.dolfin.wrapping.parametrized_expression import ParametrizedExpression
+from rbnics.utils.config import config
 from rbnics.utils.decorators import overload, PreserveClassName, ProblemDecoratorFor, ReducedProblemDecoratorFor, ReductionMethodDecoratorFor
+from rbnics.utils.io import BinaryIO, Folders
 from rbnics.utils.test import PatchInstanceMethod
 
 # ===== Helper function for sympy/ufl conversion ===== #
@@ -52,7 +57,10 @@ def sympy_to_parametrized_expression(sympy_expression: SympyBase, problem: objec
     """
     Convert a sympy scalar expression to a ParametrizedExpression
     """
-    cpp_expression = ccode(sympy_expression).replace(", 0]", "]")
+    cpp_expression = problem._pull_back_disk_cache.get(
+        "ccode" + srepr(sympy_expression),
+        lambda: ccode(sympy_expression).replace(", 0]", "]")
+    )
     element = FiniteElement("CG", problem.V.mesh().ufl_cell(), 1)
     return ParametrizedExpression(problem, cpp_expression, mu=problem.mu, element=element)
     
@@ -63,23 +71,28 @@ def sympy_to_parametrized_expression(sympy_expression: (ImmutableMatrix, SympyMa
     """
     dim = problem.V.mesh().geometry().dim()
     if sympy_expression.shape[1] is 1:
-        cpp_expression = list()
-        for i in range(dim):
-            cpp_expression.append(
-                ccode(sympy_expression[i]).replace(", 0]", "]")
-            )
+        def generate_cpp_expression():
+            cpp_expression = list()
+            for i in range(dim):
+                cpp_expression.append(
+                    ccode(sympy_expression[i]).replace(", 0]", "]")
+                )
+            return tuple(cpp_expression)
         element = VectorElement("CG", problem.V.mesh().ufl_cell(), 1)
     else:
-        cpp_expression = list()
-        for i in range(dim):
-            cpp_expression_i = list()
-            for j in range(dim):
-                cpp_expression_i.append(
-                    ccode(sympy_expression[i, j]).replace(", 0]", "]")
-                )
-            cpp_expression.append(tuple(cpp_expression_i))
+        def generate_cpp_expression():
+            cpp_expression = list()
+            for i in range(dim):
+                cpp_expression_i = list()
+                for j in range(dim):
+                    cpp_expression_i.append(
+                        ccode(sympy_expression[i, j]).replace(", 0]", "]")
+                    )
+                cpp_expression.append(tuple(cpp_expression_i))
+            return tuple(cpp_expression)
         element = TensorElement("CG", problem.V.mesh().ufl_cell(), 1)
-    return ParametrizedExpression(problem, tuple(cpp_expression), mu=problem.mu, element=element)
+    cpp_expression = problem._pull_back_disk_cache.get("ccode" + str(dim) + srepr(sympy_expression), generate_cpp_expression)
+    return ParametrizedExpression(problem, cpp_expression, mu=problem.mu, element=element)
     
 # ===== Memoization for shape parametrization objects: inspired by ufl/corealg/multifunction.py ===== #
 def shape_parametrization_cache(function):
@@ -93,6 +106,39 @@ def shape_parametrization_cache(function):
         return output
     return _memoized_function
 
+# ===== Persistent cache for symbolic computations, so that they are not repeated by each new run ===== #
+class PullBackDiskCache(object):
+    """
+    Store to disk, in binary format, the text representation (e.g. srepr of a sympy expression, or generated C++ code)
+    of the results of symbolic computations carried out while pulling back forms, indexed by a digest
+    of a string which describes their input.
+    
+    :param folder: the folder where results are stored.
+    :param enabled: if False, results are always computed and never stored.
+    """
+    
+    def __init__(self, folder, enabled=True):
+        self._folder = folder
+        self._enabled = enabled
+        self._folder_created = False
+        self._cache = dict()
+        
+    def get(self, key, compute):
+        if key not in self._cache:
+            if self._enabled:
+                filename = "pull_back_" + hashlib.sha1(key.encode("utf-8")).hexdigest()
+                if BinaryIO.exists_file(self._folder, filename):
+                    self._cache[key] = BinaryIO.load_file(self._folder, filename)
+                else:
+                    self._cache[key] = compute()
+                    if not self._folder_created:
+                        self._folder.create()
+                        self._folder_created = True
+                    BinaryIO.save_file(self._cache[key], self._folder, filename)
+            else:
+                self._cache[key] = compute()
+        return self._cache[key]
+    
 ShapeParametrizationResult = namedtuple("ShapeParametrizationResult", "sympy ufl")
     
 # ===== Shape parametrization classes related to jacobian, inspired by ufl/geometry.py ===== #
@@ -558,6 +604,7 @@ def PullBackFormsToReferenceDomainDecoratedProblem(**decorator_kwargs):
                 self._is_affine_parameter_dependent_regex = re.compile(r"\bx\[[0-9]+\]")
                 self._shape_parametrization_expressions_sympy_to_ufl = dict()
                 self._shape_parametrization_expressions_ufl_to_sympy = dict()
+                self._pull_back_disk_cache = PullBackDiskCache(Folders.Folder(os.path.join(self.folder_prefix, "cache")), "Disk" in config.get("problems", "cache"))
                 self.debug = decorator_kwargs.get("debug", False)
                 # Customize EIM and DEIM decorators so that forms are pulled back to the reference domain before applying EIM or DEIM.
                 if hasattr(self, "_init_EIM_approximations"):
@@ -598,7 +645,7 @@ def PullBackFormsToReferenceDomainDecoratedProblem(**decorator_kwargs):
                                     postprocessed_pulled_back_theta_factors.append(self._get_affine_parameter_dependent_theta_factors(separated_pulled_back_form))
                                     assert len(postprocessed_pulled_back_forms) == q + 1
                                     assert len(postprocessed_pulled_back_theta_factors) == q + 1
-                                    (postprocessed_pulled_back_forms[q], postprocessed_pulled_back_theta_factors[q]) = collect_common_forms_theta_factors(postprocessed_pulled_back_forms[q], postprocessed_pulled_back_theta_factors[q])
+                                    (postprocessed_pulled_back_forms[q], postprocessed_pulled_back_theta_factors[q]) = collect_common_forms_theta_factors(postprocessed_pulled_back_forms[q], postprocessed_pulled_back_theta_factors[q], self._pull_back_disk_cache)
                                     pull_back_is_affine.append((True, )*len(postprocessed_pulled_back_forms[q]))
                                 else:
                                     assert any([Algorithm in self.ProblemDecorators for Algorithm in (DEIM, EIM, ExactParametrizedFunctions)]), "Non affine parametric dependence detected. Please use one among DEIM, EIM and ExactParametrizedFunctions"
@@ -889,11 +936,14 @@ def PullBackFormsToReferenceDomainDecoratedProblem(**decorator_kwargs):
                     raise NotImplementedError("compute_affine_parameter_dependent_theta_factor has not been implemented yet for interior_facet")
                 else:
                     raise ValueError("Unknown integral type {}, don't know how to check for affinity.".format(integral_type))
-                # ... carry out conversion
-                theta_factor_sympy = theta_factor
-                theta_factor_sympy = simplify(sympify(str(theta_factor_sympy), locals=locals))
-                theta_factor_sympy = simplify(convert_float_to_int_if_possible(theta_factor_sympy))
-                return theta_factor_sympy
+                # ... carry out conversion, or load its result from a previous run
+                def convert_theta_factor():
+                    theta_factor_sympy = theta_factor
+                    theta_factor_sympy = simplify(sympify(str(theta_factor_sympy), locals=locals))
+                    theta_factor_sympy = simplify(convert_float_to_int_if_possible(theta_factor_sympy))
+                    return srepr(theta_factor_sympy)
+                theta_factor_key = str(theta_factor) + str(sorted((key, str(value)) for (key, value) in locals.items()))
+                return sympify(self._pull_back_disk_cache.get("theta_factor" + theta_factor_key, convert_theta_factor))
         
         # return value (a class) for the decorator
         return PullBackFormsToReferenceDomainDecoratedProblem_Class
@@ -991,7 +1041,7 @@ def convert_float_to_int_if_possible(theta_factor):
             theta_factor = theta_factor.subs(node, Integer(int(node)))
     return theta_factor
     
-def collect_common_forms_theta_factors(postprocessed_pulled_back_forms, postprocessed_pulled_back_theta_factors):
+def collect_common_forms_theta_factors(postprocessed_pulled_back_forms, postprocessed_pulled_back_theta_factors, disk_cache):
     from rbnics.shape_parametrization.utils.symbolic import sympy_eval
     # Remove all zero theta factors
     postprocessed_pulled_back_forms_non_zero = list()
@@ -1017,7 +1067,10 @@ def collect_common_forms_theta_factors(postprocessed_pulled_back_forms, postproc
     for postprocessed_pulled_back_theta_factor in postprocessed_pulled_back_theta_factors_non_zero:
         if postprocessed_pulled_back_theta_factor not in postprocessed_pulled_back_theta_factors_ufl_to_sympy:
             for (previous_theta_factor_ufl, previous_theta_factor_sympy) in postprocessed_pulled_back_theta_factors_ufl_to_sympy.items():
-                ratio = simplify(postprocessed_pulled_back_theta_factor/previous_theta_factor_ufl)
+                ratio = sympify(disk_cache.get(
+                    "ratio" + srepr(postprocessed_pulled_back_theta_factor) + srepr(previous_theta_factor_ufl),
+                    lambda: srepr(simplify(postprocessed_pulled_back_theta_factor/previous_theta_factor_ufl))
+                ))
                 if isinstance(ratio, Number):
                     postprocessed_pulled_back_theta_factors_ufl_to_sympy[postprocessed_pulled_back_theta_factor] = ratio*previous_theta_factor_sympy
                     break
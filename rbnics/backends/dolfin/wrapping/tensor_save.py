@@ -19,7 +19,6 @@
 import os
 from petsc4py import PETSc
 from dolfin import has_pybind11
-from mpi4py.MPI import Op
 from rbnics.utils.mpi import is_io_process
 from rbnics.utils.io import Folders, PickleIO
 from rbnics.utils.decorators import overload
@@ -50,49 +49,28 @@ def basic_tensor_save(backend, wrapping):
     @overload(backend.Matrix.Type(), (Folders.Folder, str), object, str, object)
     def _permutation_save(tensor, directory, form, form_name, mpi_comm):
         if not PickleIO.exists_file(directory, "." + form_name):
+            # Processor dependent row and col indices coincide with global dofs, and dof map writer mappings
+            # are available on every process: save them without any further communication
             V_0 = wrapping.form_argument_space(form, 0)
             V_1 = wrapping.form_argument_space(form, 1)
             V_0__dof_map_writer_mapping = wrapping.build_dof_map_writer_mapping(V_0)
             V_1__dof_map_writer_mapping = wrapping.build_dof_map_writer_mapping(V_1)
-            matrix_row_mapping = dict() # from processor dependent row indices to processor independent tuple
-            matrix_col_mapping = dict() # from processor dependent col indices to processor independent tuple
-            mat = wrapping.to_petsc4py(tensor)
-            row_start, row_end = mat.getOwnershipRange()
-            for row in range(row_start, row_end):
-                matrix_row_mapping[row] = V_0__dof_map_writer_mapping[row]
-                cols, _ = mat.getRow(row)
-                for col in cols:
-                    if col not in matrix_col_mapping:
-                        matrix_col_mapping[col] = V_1__dof_map_writer_mapping[col]
-            gathered_matrix_row_mapping = mpi_comm.reduce(matrix_row_mapping, root=is_io_process.root, op=_dict_update_op)
-            gathered_matrix_col_mapping = mpi_comm.reduce(matrix_col_mapping, root=is_io_process.root, op=_dict_update_op)
-            gathered_matrix_mapping = (gathered_matrix_row_mapping, gathered_matrix_col_mapping)
-            PickleIO.save_file(gathered_matrix_mapping, directory, "." + form_name)
+            PickleIO.save_file((V_0__dof_map_writer_mapping, V_1__dof_map_writer_mapping), directory, "." + form_name)
                 
     @overload(backend.Vector.Type(), (Folders.Folder, str), object, str, object)
     def _permutation_save(tensor, directory, form, form_name, mpi_comm):
         if not PickleIO.exists_file(directory, "." + form_name):
+            # Processor dependent indices coincide with global dofs, and dof map writer mapping
+            # is available on every process: save it without any further communication
             V_0 = wrapping.form_argument_space(form, 0)
             V_0__dof_map_writer_mapping = wrapping.build_dof_map_writer_mapping(V_0)
-            vector_mapping = dict() # from processor dependent indices to processor independent tuple
-            vec = wrapping.to_petsc4py(tensor)
-            row_start, row_end = vec.getOwnershipRange()
-            for row in range(row_start, row_end):
-                vector_mapping[row] = V_0__dof_map_writer_mapping[row]
-            gathered_vector_mapping = mpi_comm.reduce(vector_mapping, root=is_io_process.root, op=_dict_update_op)
-            PickleIO.save_file(gathered_vector_mapping, directory, "." + form_name)
+            PickleIO.save_file(V_0__dof_map_writer_mapping, directory, "." + form_name)
     
     def _tensor_save(tensor, directory, filename):
         tensor = wrapping.to_petsc4py(tensor)
         viewer = PETSc.Viewer().createBinary(os.path.join(str(directory), filename + ".dat"), "w")
         viewer.view(tensor)
         
-    def _dict_update(dict1, dict2, datatype):
-        dict1.update(dict2)
-        return dict1
-
-    _dict_update_op = Op.Create(_dict_update, commute=True)
-    
     return _basic_tensor_save
 
 # No explicit instantiation for backend = rbnics.backends.dolfin for symmetry
@@ -21,8 +21,10 @@ from numbers import Number
 from numpy import empty as AffineExpansionStorageContent_Base, nditer as AffineExpansionStorageContent_Iterator
 from rbnics.backends.abstract import AffineExpansionStorage as AbstractAffineExpansionStorage, BasisFunctionsMatrix as AbstractBasisFunctionsMatrix, FunctionsList as AbstractFunctionsList
 from rbnics.backends.online.basic.wrapping import slice_to_array
+from rbnics.utils.config import config
 from rbnics.utils.decorators import overload, tuple_of
-from rbnics.utils.io import ComponentNameToBasisComponentIndexDict, Folders, OnlineSizeDict, TextIO as ContentItemShapeIO, TextIO as ContentItemTypeIO, TextIO as DictIO, TextIO as ScalarContentIO
+from rbnics.utils.io import BinaryIO as ContentItemShapeIO, BinaryIO as ContentItemTypeIO, BinaryIO as DictIO, BinaryIO as ScalarContentIO, ComponentNameToBasisComponentIndexDict, Folders, OnlineSizeDict
+from rbnics.utils.profiler import memory_profiler
 
 def AffineExpansionStorage(backend, wrapping):
     class _AffineExpansionStorage(AbstractAffineExpansionStorage):
@@ -37,6 +39,7 @@ def AffineExpansionStorage(backend, wrapping):
             self._component_name_to_basis_component_length = None # will be filled in in __setitem__, if required
             # Initialize arguments from inputs
             self._init(arg1, arg2)
+            memory_profiler.track("affine expansion storages", self)
             
         @overload((tuple_of(backend.Matrix.Type()), tuple_of(backend.Vector.Type())), None)
         def _init(self, arg1, arg2):
@@ -111,15 +114,32 @@ def AffineExpansionStorage(backend, wrapping):
         
         @overload(backend.Matrix.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
         def _save_content(self, item, it, full_directory):
-            while not it.finished:
-                wrapping.tensor_save(self._content[it.multi_index], full_directory, "content_item_" + str(it.index))
-                it.iternext()
+            self._save_tensors_content(it, full_directory)
         
         @overload(backend.Vector.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
         def _save_content(self, item, it, full_directory):
-            while not it.finished:
-                wrapping.tensor_save(self._content[it.multi_index], full_directory, "content_item_" + str(it.index))
-                it.iternext()
+            self._save_tensors_content(it, full_directory)
+            
+        def _save_tensors_content(self, it, full_directory):
+            storage_format = config.get("backends", "online storage format")
+            assert storage_format in ("files", "stacked")
+            # Files in the other format are removed, so that stale content (e.g. from a previous run
+            # with a different storage format) is never loaded in place of the content being saved
+            if storage_format == "files": # one file per affine expansion term
+                while not it.finished:
+                    wrapping.tensor_save(self._content[it.multi_index], full_directory, "content_item_" + str(it.index))
+                    it.iternext()
+                wrapping.tensor_remove(full_directory, "content")
+            elif storage_format == "stacked": # a single file for the whole affine expansion
+                tensors = list()
+                while not it.finished:
+                    tensors.append(self._content[it.multi_index])
+                    it.iternext()
+                wrapping.tensors_save(tensors, full_directory, "content")
+                for index in range(len(tensors)):
+                    wrapping.tensor_remove(full_directory, "content_item_" + str(index))
+            else:
+                raise ValueError("Invalid online storage format")
         
         @overload(backend.Function.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
         def _save_content(self, item, it, full_directory):
@@ -216,19 +236,24 @@ def AffineExpansionStorage(backend, wrapping):
         
         @overload(backend.Matrix.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
         def _load_content(self, item, it, full_directory):
-            while not it.finished:
-                self._content[it.multi_index] = wrapping.tensor_copy(item)
-                tensor_loaded = wrapping.tensor_load(self._content[it.multi_index], full_directory, "content_item_" + str(it.index))
-                assert tensor_loaded
-                it.iternext()
+            self._load_tensors_content(item, it, full_directory)
         
         @overload(backend.Vector.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
         def _load_content(self, item, it, full_directory):
+            self._load_tensors_content(item, it, full_directory)
+            
+        def _load_tensors_content(self, item, it, full_directory):
+            tensors = list()
             while not it.finished:
                 self._content[it.multi_index] = wrapping.tensor_copy(item)
-                tensor_loaded = wrapping.tensor_load(self._content[it.multi_index], full_directory, "content_item_" + str(it.index))
-                assert tensor_loaded
+                tensors.append(self._content[it.multi_index])
                 it.iternext()
+            # Load from a single file if the affine expansion was saved in stacked format, ...
+            if not wrapping.tensors_load(tensors, full_directory, "content"):
+                # ... otherwise load one file per affine expansion term
+                for (index, tensor) in enumerate(tensors):
+                    tensor_loaded = wrapping.tensor_load(tensor, full_directory, "content_item_" + str(index))
+                    assert tensor_loaded
         
         @overload(backend.Function.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
         def _load_content(self, item, it, full_directory):
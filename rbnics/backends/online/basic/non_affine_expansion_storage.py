@@ -24,7 +24,7 @@ from rbnics.backends.basic.wrapping import DelayedBasisFunctionsMatrix, DelayedF
 from rbnics.backends.online.basic.wrapping import slice_to_array
 from rbnics.eim.utils.decorators import get_problem_from_parametrized_operator, get_problem_from_problem_name, get_reduced_problem_from_basis_functions, get_reduced_problem_from_error_estimation_inner_product, get_reduced_problem_from_problem, get_term_and_index_from_parametrized_operator
 from rbnics.utils.decorators import overload, tuple_of
-from rbnics.utils.io import Folders, TextIO as BasisFunctionsContentLengthIO, TextIO as BasisFunctionsProblemNameIO, TextIO as DelayedFunctionsProblemNameIO, TextIO as DelayedFunctionsTypeIO, TextIO as ErrorEstimationInnerProductIO, TextIO as TruthContentItemIO, TextIO as TypeIO
+from rbnics.utils.io import BinaryIO as BasisFunctionsContentLengthIO, BinaryIO as BasisFunctionsProblemNameIO, BinaryIO as DelayedFunctionsProblemNameIO, BinaryIO as DelayedFunctionsTypeIO, BinaryIO as ErrorEstimationInnerProductIO, BinaryIO as TruthContentItemIO, BinaryIO as TypeIO, Folders
 
 class NonAffineExpansionStorage(AbstractNonAffineExpansionStorage):
     def __init__(self, *shape):
@@ -30,6 +30,7 @@ from rbnics.backends.online.numpy.functions_list import FunctionsList
 from rbnics.backends.online.numpy.gram_schmidt import GramSchmidt
 from rbnics.backends.online.numpy.high_order_proper_orthogonal_decomposition import HighOrderProperOrthogonalDecomposition
 from rbnics.backends.online.numpy.import_ import import_
+from rbnics.backends.online.numpy.is_replicated import is_replicated
 from rbnics.backends.online.numpy.linear_solver import LinearSolver
 from rbnics.backends.online.numpy.matrix import Matrix
 from rbnics.backends.online.numpy.max import max
@@ -62,6 +63,7 @@ __all__ = [
     'GramSchmidt',
     'HighOrderProperOrthogonalDecomposition',
     'import_',
+    'is_replicated',
     'LinearSolver',
     'Matrix',
     'max',
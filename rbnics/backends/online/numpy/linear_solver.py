@@ -16,7 +16,9 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
-from numpy.linalg import solve
+from numpy import absolute, allclose, amax, asarray, eye, finfo, inf, isfinite, outer, tril, triu
+from numpy.linalg import cholesky, LinAlgError, norm, solve
+from scipy.linalg import solve_triangular
 from rbnics.backends.online.basic import LinearSolver as BasicLinearSolver
 from rbnics.backends.online.numpy.matrix import Matrix
 from rbnics.backends.online.numpy.vector import Vector
@@ -34,3 +36,56 @@ class LinearSolver(LinearSolver_Base):
         solution = solve(self.lhs, self.rhs)
         self.solution.vector()[:] = solution
         return self.solution
+        
+    def solve_nested(self, solutions):
+        """
+        Solve the leading subsystems of the linear system, the size of each of them being given by the size of the
+        corresponding function in solutions. A single factorization of the whole matrix is computed, since the Cholesky
+        factors (for symmetric positive definite matrices) or the LU factors without pivoting of a leading block are the
+        leading blocks of the factors of the whole matrix. Independent solves are carried out in case the factorization breaks down,
+        or in case the residual of a nested solve is too large (e.g., due to pivot growth in the LU factorization without pivoting).
+        """
+        lhs = asarray(self.lhs)
+        rhs = asarray(self.rhs)
+        factors = _nested_factorization(lhs)
+        for solution in solutions:
+            N = solution.vector().content.shape[0]
+            if factors is not None:
+                (L, U) = factors
+                y = solve_triangular(L[:N, :N], rhs[:N], lower=True)
+                x = solve_triangular(U[:N, :N], y, lower=False)
+                if not _is_backward_stable(lhs[:N, :N], x, rhs[:N]):
+                    x = solve(lhs[:N, :N], rhs[:N])
+            else:
+                x = solve(lhs[:N, :N], rhs[:N])
+            solution.vector()[:] = x
+        return solutions
+        
+def _nested_factorization(A):
+    # Symmetry is checked with a relative tolerance only, since Cholesky factorization only reads the lower triangle
+    if allclose(A, A.T, rtol=_symmetry_rtol, atol=0.):
+        try:
+            L = cholesky(A)
+        except LinAlgError:
+            pass
+        else:
+            return (L, L.T)
+    # LU factorization without pivoting, which is only carried out if no small pivots are found
+    LU = A.astype(float)
+    tol = finfo(float).eps*amax(absolute(A))
+    for k in range(LU.shape[0]):
+        if not isfinite(LU[k, k]) or absolute(LU[k, k]) <= tol:
+            return None
+        LU[k + 1:, k] /= LU[k, k]
+        LU[k + 1:, k + 1:] -= outer(LU[k + 1:, k], LU[k, k + 1:])
+    return (tril(LU, -1) + eye(LU.shape[0]), triu(LU))
+    
+# Check the normwise backward error of the solution x of A x = b
+def _is_backward_stable(A, x, b):
+    if not all(isfinite(x)):
+        return False
+    residual = norm(A.dot(x) - b, inf)
+    return residual <= _backward_error_tol*A.shape[0]*(norm(A, inf)*norm(x, inf) + norm(b, inf))
+    
+_symmetry_rtol = 1.e-12
+_backward_error_tol = 1.e3*finfo(float).eps
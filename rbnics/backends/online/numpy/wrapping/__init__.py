@@ -26,7 +26,10 @@ from rbnics.backends.online.numpy.wrapping.get_mpi_comm import get_mpi_comm
 from rbnics.backends.online.numpy.wrapping.gram_schmidt_projection_step import gram_schmidt_projection_step
 from rbnics.backends.online.numpy.wrapping.matrix_mul import matrix_mul_vector, vectorized_matrix_inner_vectorized_matrix
 from rbnics.backends.online.numpy.wrapping.tensor_load import tensor_load
+from rbnics.backends.online.numpy.wrapping.tensor_remove import tensor_remove
 from rbnics.backends.online.numpy.wrapping.tensor_save import tensor_save
+from rbnics.backends.online.numpy.wrapping.tensors_load import tensors_load
+from rbnics.backends.online.numpy.wrapping.tensors_save import tensors_save
 from rbnics.backends.online.numpy.wrapping.vector_mul import vector_mul_vector
 
 __all__ = [
@@ -42,7 +45,10 @@ __all__ = [
     'matrix_mul_vector',
     'Slicer',
     'tensor_load',
+    'tensor_remove',
     'tensor_save',
+    'tensors_load',
+    'tensors_save',
     'vector_mul_vector',
     'vectorized_matrix_inner_vectorized_matrix'
 ]
@@ -0,0 +1,38 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from rbnics.utils.io import NumpyIO
+
+def tensors_load(tensors, directory, filename):
+    if NumpyIO.exists_file(directory, filename):
+        # Memory map the stacked file, so that each tensor is read from disk directly into its storage,
+        # rather than first reading the whole stack into a temporary array
+        loaded = NumpyIO.load_file(directory, filename, mmap_mode="r")
+        assert loaded.shape[0] == len(tensors)
+        assert len(loaded.shape) in (2, 3)
+        for (index, tensor) in enumerate(tensors):
+            if len(loaded.shape) == 2:
+                tensor[:] = loaded[index]
+            elif len(loaded.shape) == 3:
+                tensor[:, :] = loaded[index]
+            else:
+                raise ValueError("Invalid tensor shape")
+        del loaded # close the memory map, so that the file can be later overwritten or removed
+        return True
+    else:
+        return False
@@ -149,6 +149,10 @@ def DEIMDecoratedReducedProblem(ParametrizedReducedDifferentialProblem_DerivedCl
             self._update_N_DEIM(**kwargs)
             ParametrizedReducedDifferentialProblem_DerivedClass._solve(self, N, **kwargs)
             
+        def _solve_nested(self, Ns, **kwargs):
+            self._update_N_DEIM(**kwargs)
+            return ParametrizedReducedDifferentialProblem_DerivedClass._solve_nested(self, Ns, **kwargs)
+            
         def _update_N_DEIM(self, **kwargs):
             self.truth_problem._update_N_DEIM(**kwargs)
             
@@ -20,9 +20,11 @@ import os
 import hashlib
 from rbnics.problems.base import ParametrizedProblem
 from rbnics.backends import abs, copy, evaluate, export, import_, max
-from rbnics.backends.online import OnlineAffineExpansionStorage, OnlineFunction, OnlineLinearSolver
+from rbnics.backends.online import OnlineAffineExpansionStorage, OnlineFunction, OnlineLinearSolver, OnlineVector
 from rbnics.utils.config import config
 from rbnics.utils.decorators import sync_setters
+from rbnics.utils.io import CacheIndex
+from rbnics.utils.profiler import memory_profiler, profiler
 from rbnics.eim.utils.decorators import StoreMapFromParametrizedExpressionToProblem
 
 # Empirical interpolation method for the interpolation of parametrized functions
@@ -60,6 +62,8 @@ class EIMApproximation(ParametrizedProblem):
         self.folder["cache"] = os.path.join(self.folder_prefix, "cache")
         self.folder["reduced_operators"] = os.path.join(self.folder_prefix, "reduced_operators")
         self.cache_config = config.get("EIM", "cache")
+        self.disk_cache_size = config.get("EIM", "disk cache size")
+        memory_profiler.track_cache("EIM snapshot caches", self, "snapshot_cache")
         
     # Initialize data structures required for the online phase
     def init(self, current_stage="online"):
@@ -79,15 +83,20 @@ class EIMApproximation(ParametrizedProblem):
     def evaluate_parametrized_expression(self):
         (cache_key, cache_file) = self._cache_key_and_file()
         if "RAM" in self.cache_config and cache_key in self.snapshot_cache:
+            profiler.increment("EIM snapshot cache hits")
             self.snapshot = self.snapshot_cache[cache_key]
-        elif "Disk" in self.cache_config and self.import_solution(self.folder["cache"], cache_file):
+        elif "Disk" in self.cache_config and cache_file in CacheIndex(self.folder["cache"], self.disk_cache_size) and self.import_solution(self.folder["cache"], cache_file):
+            profiler.increment("EIM snapshot cache hits")
             if "RAM" in self.cache_config:
                 self.snapshot_cache[cache_key] = copy(self.snapshot)
         else:
+            profiler.increment("EIM snapshot cache misses")
             self.snapshot = evaluate(self.parametrized_expression)
             if "RAM" in self.cache_config:
                 self.snapshot_cache[cache_key] = copy(self.snapshot)
             self.export_solution(self.folder["cache"], cache_file) # Note that we export to file regardless of config options, because they may change across different runs
+            CacheIndex(self.folder["cache"], self.disk_cache_size).add(cache_file)
+            memory_profiler.check()
         
     def _cache_key_and_file(self):
         cache_key = self.mu
@@ -107,25 +116,48 @@ class EIMApproximation(ParametrizedProblem):
             N = self.N
             
         if N > 0:
-            self._interpolation_coefficients = OnlineFunction(N)
-                
             # Evaluate the parametrized expression at interpolation locations
             rhs = evaluate(rhs_, self.interpolation_locations[:N])
             
-            (max_abs_rhs, _) = max(abs(rhs))
-            if max_abs_rhs == 0.:
-                # If the rhs is zero, then we are interpolating the zero function
-                # and the default zero coefficients are enough.
-                pass
-            else:
-                # Extract the interpolation matrix
-                lhs = self.interpolation_matrix[0][:N, :N]
-                
-                # Solve the interpolation problem
-                solver = OnlineLinearSolver(lhs, self._interpolation_coefficients, rhs)
-                solver.solve()
+            # Solve the interpolation problem
+            self._interpolation_coefficients = self._solve_interpolation(rhs, N)
         else:
             self._interpolation_coefficients = None # OnlineFunction
+            
+    # Perform an online solve for a batch of functions (or tensors), e.g. the snapshots of all parameters in the training set.
+    # All functions are evaluated at interpolation locations at once, resulting in a N x len(rhs_batch) matrix, the columns
+    # of which are the right-hand sides of the interpolation problems. Returns a list of interpolation coefficients
+    def solve_batch(self, rhs_batch, N=None):
+        if N is None:
+            N = self.N
+            
+        if N > 0:
+            rhs_matrix = evaluate(rhs_batch, self.interpolation_locations[:N])
+            interpolation_coefficients_batch = list()
+            for p in range(len(rhs_batch)):
+                rhs = OnlineVector(N)
+                for n in range(N):
+                    rhs[n] = rhs_matrix[n, p]
+                interpolation_coefficients_batch.append(self._solve_interpolation(rhs, N))
+            return interpolation_coefficients_batch
+        else:
+            return [None]*len(rhs_batch)
+            
+    def _solve_interpolation(self, rhs, N):
+        interpolation_coefficients = OnlineFunction(N)
+        (max_abs_rhs, _) = max(abs(rhs))
+        if max_abs_rhs == 0.:
+            # If the rhs is zero, then we are interpolating the zero function
+            # and the default zero coefficients are enough.
+            pass
+        else:
+            # Extract the interpolation matrix
+            lhs = self.interpolation_matrix[0][:N, :N]
+            
+            # Solve the interpolation problem
+            solver = OnlineLinearSolver(lhs, interpolation_coefficients, rhs)
+            solver.solve()
+        return interpolation_coefficients
         
     # Call online_solve and then convert the result of online solve from OnlineVector to a tuple
     def compute_interpolated_theta(self, N=None):
@@ -149,6 +149,10 @@ def EIMDecoratedReducedProblem(ParametrizedReducedDifferentialProblem_DerivedCla
             self._update_N_EIM(**kwargs)
             ParametrizedReducedDifferentialProblem_DerivedClass._solve(self, N, **kwargs)
             
+        def _solve_nested(self, Ns, **kwargs):
+            self._update_N_EIM(**kwargs)
+            return ParametrizedReducedDifferentialProblem_DerivedClass._solve_nested(self, Ns, **kwargs)
+            
         def _update_N_EIM(self, **kwargs):
             self.truth_problem._update_N_EIM(**kwargs)
             
@@ -19,7 +19,8 @@
 import os
 from rbnics.reduction_methods.base import ReductionMethod
 from rbnics.backends import abs, evaluate, max
-from rbnics.utils.io import ErrorAnalysisTable, Folders, GreedySelectedParametersList, GreedyErrorEstimatorsList, SpeedupAnalysisTable, TextBox, TextLine, Timer
+from rbnics.utils.io import CacheIndex, ErrorAnalysisTable, Folders, GreedySelectedParametersList, GreedyErrorEstimatorsList, SpeedupAnalysisTable, TextBox, TextLine, Timer
+from rbnics.utils.profiler import memory_profiler, profiler
 from rbnics.utils.test import PatchInstanceMethod
 
 # Empirical interpolation method for the interpolation of parametrized functions
@@ -74,13 +75,21 @@ class EIMApproximationReductionMethod(ReductionMethod):
         all_folders.pop("testing_set") # this is required only in the error/speedup analysis
         all_folders.pop("error_analysis") # this is required only in the error analysis
         all_folders.pop("speedup_analysis") # this is required only in the speedup analysis
+        all_folders.pop("checkpoints") # this is required only to resume an interrupted offline construction
         at_least_one_folder_created = all_folders.create()
-        if not at_least_one_folder_created:
+        self._checkpoint_state = self._init_checkpoints(all_folders)
+        if not at_least_one_folder_created and self._checkpoint_state is None:
             return False # offline construction should be skipped, since data are already available
-        else:
+        elif self._checkpoint_state is None or self._checkpoint_state["iteration"] == 0:
+            self._checkpoint_state = {"iteration": 0}
+            self._save_checkpoint(self._checkpoint_state)
             self.EIM_approximation.init("offline")
             return True # offline construction should be carried out
+        else:
+            self.EIM_approximation.init("online")
+            return True # offline construction should be resumed from the latest checkpoint
         
+    @profiler.span("EIM offline")
     def _offline(self):
         interpolation_method_name = self.EIM_approximation.parametrized_expression.interpolation_method_name()
         description = self.EIM_approximation.parametrized_expression.description()
@@ -96,13 +105,15 @@ class EIMApproximationReductionMethod(ReductionMethod):
             
             print("evaluate parametrized expression at mu =", mu)
             self.EIM_approximation.evaluate_parametrized_expression()
-            self.EIM_approximation.export_solution(self.folder["snapshots"], "truth_" + str(mu_index))
+            self.export_queue.put(self.EIM_approximation, self.folder["snapshots"], "truth_" + str(mu_index))
             
             print("add to snapshots")
             self.add_to_snapshots(self.EIM_approximation.snapshot)
 
             print("")
             
+        self.export_queue.flush()
+        
         # If basis generation is POD, compute the first POD modes of the snapshots
         if self.EIM_approximation.basis_generation == "POD":
             print("compute basis")
@@ -121,6 +132,14 @@ class EIMApproximationReductionMethod(ReductionMethod):
             
             # Carry out greedy selection
             relative_error_max = 2.*self.tol
+            if self._checkpoint_state["iteration"] > 0:
+                self.greedy_selected_parameters.load(self.folder["post_processing"], "mu_greedy")
+                self.greedy_errors.load(self.folder["post_processing"], "error_max")
+                assert len(self.greedy_errors) == self._checkpoint_state["iteration"]
+                self.EIM_approximation.set_mu(self._checkpoint_state["mu"])
+                relative_error_max = self._checkpoint_state["relative_error_max"]
+                print("resume from the checkpoint at N = " + str(self.EIM_approximation.N))
+                print("")
             while self.EIM_approximation.N < self.Nmax and relative_error_max >= self.tol:
                 print(TextLine(interpolation_method_name + " N = " + str(self.EIM_approximation.N), fill=":"))
                 
@@ -144,6 +163,8 @@ class EIMApproximationReductionMethod(ReductionMethod):
                 print("maximum interpolation error =", error_max)
                 print("maximum interpolation relative error =", relative_error_max)
                 
+                self._save_checkpoint({"iteration": len(self.greedy_errors), "mu": self.EIM_approximation.mu, "relative_error_max": relative_error_max})
+                
                 print("")
         else:
             while self.EIM_approximation.N < N_POD:
@@ -171,7 +192,10 @@ class EIMApproximationReductionMethod(ReductionMethod):
         
     # Finalize data structures required after the offline phase
     def _finalize_offline(self):
+        self._remove_checkpoints()
         self.EIM_approximation.init("online")
+        CacheIndex.flush_all()
+        memory_profiler.record(self.folder_prefix + " offline")
         
     def _print_greedy_interpolation_solve_message(self):
         print("solve interpolation for mu =", self.EIM_approximation.mu)
@@ -216,10 +240,14 @@ class EIMApproximationReductionMethod(ReductionMethod):
     # Load the precomputed snapshot
     def load_snapshot(self):
         assert self.EIM_approximation.basis_generation == "Greedy"
+        return self.snapshots_container[self._snapshots_container_index()]
+        
+    # Get the index of the precomputed snapshot for the current parameter
+    def _snapshots_container_index(self):
         mu = self.EIM_approximation.mu
         mu_index = self._training_set_parameters_to_snapshots_container_index[mu]
         assert mu == self.training_set[mu_index]
-        return self.snapshots_container[mu_index]
+        return mu_index
         
     # Choose the next parameter in the offline stage in a greedy fashion
     def greedy(self):
@@ -235,11 +263,15 @@ class EIMApproximationReductionMethod(ReductionMethod):
         print("interpolation error for current mu =", abs(maximum_error))
         print("interpolation error on interpolation locations for current mu =", abs(maximum_error_on_interpolation_locations))
         
-        # Carry out the actual greedy search
+        # Carry out the actual greedy search. Since snapshots are already available for every parameter in the training set,
+        # interpolation problems are solved for all parameters at once, evaluating all snapshots at interpolation locations
+        # together rather than evaluating the parametrized expression at each parameter
+        interpolation_coefficients_batch = self.EIM_approximation.solve_batch(self.snapshots_container)
+        
         def solve_and_computer_error(mu):
             self.EIM_approximation.set_mu(mu)
             
-            self.EIM_approximation.solve()
+            self.EIM_approximation._interpolation_coefficients = interpolation_coefficients_batch[self._snapshots_container_index()]
             self.EIM_approximation.snapshot = self.load_snapshot()
             (_, maximum_error, _) = self.EIM_approximation.compute_maximum_interpolation_error()
             return abs(maximum_error)
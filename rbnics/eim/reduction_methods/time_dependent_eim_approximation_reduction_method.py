@@ -86,12 +86,11 @@ class TimeDependentEIMApproximationReductionMethod(EIMApproximationReductionMeth
     def _print_greedy_interpolation_solve_message(self):
         print("solve interpolation for mu =", self.EIM_approximation.mu, "and t =", self.EIM_approximation.t)
         
-    # Load the precomputed snapshot. Overridden to correct the assert
-    def load_snapshot(self):
-        assert self.EIM_approximation.basis_generation == "Greedy"
+    # Get the index of the precomputed snapshot for the current parameter and time. Overridden to correct the assert
+    def _snapshots_container_index(self):
         mu = self.EIM_approximation.mu
         t = self.EIM_approximation.t
         mu_index = self._training_set_parameters_to_snapshots_container_index[(mu, t)]
         assert mu == self.training_set[mu_index]["mu"]
         assert t == self.training_set[mu_index]["t"]
-        return self.snapshots_container[mu_index]
+        return mu_index
@@ -17,6 +17,7 @@
 #
 
 from rbnics.backends import LinearProblemWrapper, LinearSolver
+from rbnics.backends.online import OnlineFunction
 from rbnics.utils.decorators import PreserveClassName, RequiredBaseDecorators
 
 @RequiredBaseDecorators(None)
@@ -32,6 +33,15 @@ def LinearReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             
             # Nonlinear solver parameters
             self._linear_solver_parameters = dict()
+            
+        # Perform nested online solves (internal), reusing the system assembled for the largest dimension
+        def _solve_nested(self, Ns, **kwargs):
+            if len(self.components) > 1:
+                return None # leading blocks of the reduced system are not associated to smaller reduced spaces
+            component = self.components[0]
+            N_max = max(Ns, key=lambda N: N[component])
+            problem_solver = self.ProblemSolver(self, N_max)
+            return problem_solver.solve_nested([OnlineFunction(N) for N in Ns])
         
         class ProblemSolver(ParametrizedReducedDifferentialProblem_DerivedClass.ProblemSolver, LinearProblemWrapper):
             def solve(self):
@@ -39,6 +49,12 @@ def LinearReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
                 solver = LinearSolver(self.matrix_eval(), problem._solution, self.vector_eval(), self.bc_eval())
                 solver.set_parameters(problem._linear_solver_parameters)
                 solver.solve()
+                
+            def solve_nested(self, solutions):
+                problem = self.problem
+                solver = LinearSolver(self.matrix_eval(), OnlineFunction(self.N), self.vector_eval(), self.bc_eval())
+                solver.set_parameters(problem._linear_solver_parameters)
+                return solver.solve_nested(solutions)
             
     # return value (a class) for the decorator
     return LinearReducedProblem_Class
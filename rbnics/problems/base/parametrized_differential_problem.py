@@ -22,7 +22,9 @@ import hashlib
 from rbnics.problems.base.parametrized_problem import ParametrizedProblem
 from rbnics.backends import AffineExpansionStorage, assign, copy, export, Function, import_, product, sum
 from rbnics.utils.config import config
+from rbnics.utils.io import CacheIndex
 from rbnics.utils.mpi import log, PROGRESS
+from rbnics.utils.profiler import memory_profiler, profiler
 from rbnics.utils.test import PatchInstanceMethod
 
 # Base class containing the definition of elliptic coercive problems
@@ -66,6 +68,11 @@ class ParametrizedDifferentialProblem(ParametrizedProblem, metaclass=ABCMeta):
         # I/O
         self.folder["cache"] = os.path.join(self.folder_prefix, "cache")
         self.cache_config = config.get("problems", "cache")
+        self.disk_cache_size = config.get("problems", "disk cache size")
+        memory_profiler.track_cache("truth solution caches", self, "_solution_cache")
+        # Profiling of user defined methods
+        PatchInstanceMethod(self, "assemble_operator", profiler.span("assemble_operator")(type(self).assemble_operator)).patch()
+        PatchInstanceMethod(self, "compute_theta", profiler.span("compute_theta")(type(self).compute_theta)).patch()
         
     def name(self):
         return type(self).__name__
@@ -240,21 +247,30 @@ class ParametrizedDifferentialProblem(ParametrizedProblem, metaclass=ABCMeta):
         (cache_key, cache_file) = self._cache_key_and_file_from_kwargs(**kwargs)
         if "RAM" in self.cache_config and cache_key in self._solution_cache:
             log(PROGRESS, "Loading truth solution from cache")
+            profiler.increment("truth solution cache hits")
             assign(self._solution, self._solution_cache[cache_key])
-        elif "Disk" in self.cache_config and self.import_solution(self.folder["cache"], cache_file):
+        elif "Disk" in self.cache_config and cache_file in CacheIndex(self.folder["cache"], self.disk_cache_size) and self.import_solution(self.folder["cache"], cache_file):
             log(PROGRESS, "Loading truth solution from file")
+            profiler.increment("truth solution cache hits")
             if "RAM" in self.cache_config:
                 self._solution_cache[cache_key] = copy(self._solution)
         else: # No precomputed solution available. Truth solve is performed.
             log(PROGRESS, "Solving truth problem")
+            profiler.increment("truth solution cache misses")
             assert not hasattr(self, "_is_solving")
             self._is_solving = True
             assign(self._solution, Function(self.V))
-            self._solve(**kwargs)
+            profiler.start("truth solve")
+            try:
+                self._solve(**kwargs)
+            finally:
+                profiler.stop("truth solve")
             delattr(self, "_is_solving")
             if "RAM" in self.cache_config:
                 self._solution_cache[cache_key] = copy(self._solution)
             self.export_solution(self.folder["cache"], cache_file) # Note that we export to file regardless of config options, because they may change across different runs
+            CacheIndex(self.folder["cache"], self.disk_cache_size).add(cache_file)
+            memory_profiler.check()
         return self._solution
     
     class ProblemSolver(object, metaclass=ABCMeta):
@@ -27,6 +27,7 @@ from rbnics.utils.config import config
 from rbnics.utils.decorators import sync_setters
 from rbnics.utils.io import OnlineSizeDict
 from rbnics.utils.mpi import log, PROGRESS
+from rbnics.utils.profiler import memory_profiler, profiler
 from rbnics.utils.test import PatchInstanceMethod
 
 class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCMeta):
@@ -80,6 +81,9 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         self.folder["basis"] = os.path.join(self.folder_prefix, "basis")
         self.folder["reduced_operators"] = os.path.join(self.folder_prefix, "reduced_operators")
         self.cache_config = config.get("reduced problems", "cache")
+        memory_profiler.track_cache("reduced solution caches", self, "_solution_cache")
+        # Profiling of methods which may be overridden by decorators
+        PatchInstanceMethod(self, "build_reduced_operators", profiler.span("build_reduced_operators")(type(self).build_reduced_operators)).patch()
     
     def init(self, current_stage="online"):
         """
@@ -304,17 +308,51 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         self._solution = OnlineFunction(N)
         if "RAM" in self.cache_config and cache_key in self._solution_cache:
             log(PROGRESS, "Loading reduced solution from cache")
+            profiler.increment("reduced solution cache hits")
             assign(self._solution, self._solution_cache[cache_key])
         else:
             log(PROGRESS, "Solving reduced problem")
+            profiler.increment("reduced solution cache misses")
             assert not hasattr(self, "_is_solving")
             self._is_solving = True
-            self._solve(N, **kwargs)
+            profiler.start("reduced solve")
+            try:
+                self._solve(N, **kwargs)
+            finally:
+                profiler.stop("reduced solve")
             delattr(self, "_is_solving")
             if "RAM" in self.cache_config:
                 self._solution_cache[cache_key] = copy(self._solution)
         return self._solution
         
+    def solve_nested(self, Ns, **kwargs):
+        """
+        Perform online solves for several dimensions of the reduced problem at once, storing the reduced solutions
+        in the cache so that any subsequent solve() for one of these dimensions does not require a further solve.
+        Nothing is done if the RAM cache is disabled or if the reduced problem does not support nested solves.
+        
+        :param Ns : Dimensions of the reduced problem
+        :type Ns : list of integers
+        """
+        if "RAM" not in self.cache_config:
+            return
+        Ns_and_cache_keys = list()
+        for N in Ns:
+            N, kwargs_N = self._online_size_from_kwargs(N, **kwargs)
+            N += self.N_bc
+            cache_key = self._cache_key_from_N_and_kwargs(N, **kwargs_N)
+            if cache_key not in self._solution_cache:
+                Ns_and_cache_keys.append((N, cache_key))
+        if len(Ns_and_cache_keys) > 1:
+            log(PROGRESS, "Solving nested reduced problems")
+            assert not hasattr(self, "_is_solving")
+            self._is_solving = True
+            solutions = self._solve_nested([N for (N, _) in Ns_and_cache_keys], **kwargs)
+            delattr(self, "_is_solving")
+            if solutions is not None:
+                for ((_, cache_key), solution) in zip(Ns_and_cache_keys, solutions):
+                    self._solution_cache[cache_key] = solution
+        
     class ProblemSolver(object, metaclass=ABCMeta):
         def __init__(self, problem, N):
             self.problem = problem
@@ -345,6 +383,10 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         problem_solver = self.ProblemSolver(self, N)
         problem_solver.solve()
         
+    # Perform nested online solves (internal). Return None if not supported, so that solve() will be called for each N
+    def _solve_nested(self, Ns, **kwargs):
+        return None
+        
     def project(self, snapshot, on_dirichlet_bc=True, N=None, **kwargs):
         N, kwargs = self._online_size_from_kwargs(N, **kwargs)
         N += self.N_bc
@@ -22,6 +22,8 @@ from numbers import Number
 from rbnics.backends import BasisFunctionsMatrix, Function, FunctionsList, LinearSolver, transpose
 from rbnics.backends.online import OnlineAffineExpansionStorage
 from rbnics.utils.decorators import overload, PreserveClassName, RequiredBaseDecorators
+from rbnics.utils.profiler import profiler
+from rbnics.utils.test import PatchInstanceMethod
 
 @RequiredBaseDecorators(None)
 def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
@@ -56,6 +58,9 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             self._error_estimation_inner_product = None # setup by init()
             # I/O
             self.folder["error_estimation"] = os.path.join(self.folder_prefix, "error_estimation")
+            # Profiling of methods which may be overridden by decorators
+            PatchInstanceMethod(self, "build_error_estimation_operators", profiler.span("build_error_estimation_operators")(type(self).build_error_estimation_operators)).patch()
+            PatchInstanceMethod(self, "estimate_error", profiler.span("estimate_error")(type(self).estimate_error)).patch()
             
             # Provide a default value for Riesz terms and Riesz product terms
             self.riesz_terms = [term for term in self.terms]
@@ -213,7 +218,11 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
                 problem = self.problem
                 solver = LinearSolver(problem._riesz_solve_inner_product, problem._riesz_solve_storage, rhs, problem._riesz_solve_homogeneous_dirichlet_bc)
                 solver.set_parameters(problem._linear_solver_parameters)
-                return solver.solve()
+                profiler.start("Riesz solve")
+                try:
+                    return solver.solve()
+                finally:
+                    profiler.stop("Riesz solve")
                 
             @overload
             def solve(self, coef: Number, matrix: object, basis_function: object):
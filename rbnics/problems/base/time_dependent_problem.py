@@ -19,7 +19,9 @@
 from numbers import Number
 from rbnics.backends import AffineExpansionStorage, assign, copy, Function, product, sum, TimeDependentProblem1Wrapper, TimeStepping
 from rbnics.utils.decorators import PreserveClassName, RequiredBaseDecorators
+from rbnics.utils.io import CacheIndex
 from rbnics.utils.mpi import log, PROGRESS
+from rbnics.utils.profiler import memory_profiler
 from rbnics.utils.test import PatchInstanceMethod
 
 @RequiredBaseDecorators(None)
@@ -52,6 +54,11 @@ def TimeDependentProblem(ParametrizedDifferentialProblem_DerivedClass):
             self._solution_dot_over_time_cache = dict() # of list of Functions
             self._output_over_time = list() # of numbers
             self._output_over_time_cache = dict() # of list of numbers
+            memory_profiler.track_cache("truth solution caches", self, "_solution_dot_cache")
+            memory_profiler.track("truth solutions over time", self, "_solution_over_time")
+            memory_profiler.track("truth solutions over time", self, "_solution_dot_over_time")
+            memory_profiler.track_cache("truth solution over time caches", self, "_solution_over_time_cache")
+            memory_profiler.track_cache("truth solution over time caches", self, "_solution_dot_over_time_cache")
 
         # Set current time
         def set_time(self, t):
@@ -211,7 +218,7 @@ def TimeDependentProblem(ParametrizedDifferentialProblem_DerivedClass):
                 assign(self._solution_dot, self._solution_dot_cache[cache_key])
                 assign(self._solution_over_time, self._solution_over_time_cache[cache_key])
                 assign(self._solution_dot_over_time, self._solution_dot_over_time_cache[cache_key])
-            elif "Disk" in self.cache_config and (
+            elif "Disk" in self.cache_config and cache_file in CacheIndex(self.folder["cache"], self.disk_cache_size) and (
                 self.import_solution(self.folder["cache"], cache_file + "_solution", self._solution_over_time)
                     and
                 self.import_solution(self.folder["cache"], cache_file + "_solution_dot", self._solution_dot_over_time)
@@ -240,6 +247,8 @@ def TimeDependentProblem(ParametrizedDifferentialProblem_DerivedClass):
                 # Note that we export to file regardless of config options, because they may change across different runs
                 self.export_solution(self.folder["cache"], cache_file + "_solution", self._solution_over_time)
                 self.export_solution(self.folder["cache"], cache_file + "_solution_dot", self._solution_dot_over_time)
+                CacheIndex(self.folder["cache"], self.disk_cache_size).add(cache_file)
+                memory_profiler.check()
             return self._solution_over_time
             
         class ProblemSolver(ParametrizedDifferentialProblem_DerivedClass.ProblemSolver, TimeDependentProblem1Wrapper):
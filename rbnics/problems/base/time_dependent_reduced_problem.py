@@ -21,6 +21,7 @@ from rbnics.backends import assign, copy, product, sum, TimeDependentProblem1Wra
 from rbnics.backends.online import OnlineAffineExpansionStorage, OnlineFunction, OnlineLinearSolver, OnlineTimeStepping
 from rbnics.utils.decorators import PreserveClassName, RequiredBaseDecorators, sync_setters
 from rbnics.utils.mpi import log, PROGRESS
+from rbnics.utils.profiler import memory_profiler
 
 @RequiredBaseDecorators(None)
 def TimeDependentReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
@@ -64,6 +65,9 @@ def TimeDependentReducedProblem(ParametrizedReducedDifferentialProblem_DerivedCl
             self._solution_dot_over_time_cache = dict() # of list of Functions
             self._output_over_time = list() # of numbers
             self._output_over_time_cache = dict() # of list of numbers
+            memory_profiler.track_cache("reduced solution caches", self, "_solution_dot_cache")
+            memory_profiler.track_cache("reduced solution over time caches", self, "_solution_over_time_cache")
+            memory_profiler.track_cache("reduced solution over time caches", self, "_solution_dot_over_time_cache")
             
         # Set current time
         def set_time(self, t):
@@ -195,6 +199,10 @@ def TimeDependentReducedProblem(ParametrizedReducedDifferentialProblem_DerivedCl
             else:
                 return ParametrizedReducedDifferentialProblem_DerivedClass.assemble_operator(self, term, current_stage)
                 
+        # Nested online solves are not supported, since reduced solutions are stored over time by solve()
+        def _solve_nested(self, Ns, **kwargs):
+            return None
+            
         def solve(self, N=None, **kwargs):
             N, kwargs = self._online_size_from_kwargs(N, **kwargs)
             N += self.N_bc
@@ -75,6 +75,12 @@ class ParabolicCoerciveRBReducedProblem(ParabolicCoerciveRBReducedProblem_Base):
     # Return the numerator of the error bound for the current solution
     def get_residual_norm_squared(self):
         residual_norm_squared_over_time = list() # of numbers
+        # The affine combinations of error estimation operators only depend on thetas, which are often
+        # constant (or piecewise constant) in time: compute thetas first, and assemble each distinct
+        # combination only once for the whole trajectory, rather than once per time step. The remaining contractions
+        # with the reduced solution are carried out one time step at a time through the backend agnostic online
+        # interface, since their cost is negligible compared to the assembly of the affine combinations
+        residual_operators_cache = dict() # from tuple of thetas to tuple of assembled operators
         for (k, (solution, solution_dot)) in enumerate(zip(self._solution_over_time, self._solution_dot_over_time)):
             if k > 0:
                 # Set current time
@@ -82,21 +88,41 @@ class ParabolicCoerciveRBReducedProblem(ParabolicCoerciveRBReducedProblem_Base):
                 # Set current solution and solution_dot
                 self._solution = solution
                 self._solution_dot = solution_dot
-                # Compute the numerator of the error bound at the current time, first
-                # by computing residual of elliptic part
-                elliptic_residual_norm_squared = ParabolicCoerciveRBReducedProblem_Base.get_residual_norm_squared(self)
-                # ... and then adding terms related to time derivative
+                # Get (possibly cached) assembled operators at the current time
                 N = self._solution.N
                 theta_m = self.compute_theta("m")
                 theta_a = self.compute_theta("a")
                 theta_f = self.compute_theta("f")
+                thetas = (theta_m, theta_a, theta_f)
+                if thetas not in residual_operators_cache:
+                    residual_operators_cache[thetas] = self._assemble_residual_norm_squared_operators(N, theta_m, theta_a, theta_f)
+                (ff_product, af_product, aa_product, mf_product, ma_product, mm_product) = residual_operators_cache[thetas]
+                # Compute the numerator of the error bound at the current time, first
+                # by computing residual of elliptic part
+                elliptic_residual_norm_squared = (
+                      ff_product
+                    + 2.0*(transpose(self._solution)*af_product)
+                    + transpose(self._solution)*aa_product*self._solution
+                )
+                # ... and then adding terms related to time derivative
                 residual_norm_squared_over_time.append(
                       elliptic_residual_norm_squared
-                    + 2.0*(transpose(self._solution_dot)*sum(product(theta_m, self.error_estimation_operator["m", "f"][:N], theta_f)))
-                    + 2.0*(transpose(self._solution_dot)*sum(product(theta_m, self.error_estimation_operator["m", "a"][:N, :N], theta_a))*self._solution)
-                    + transpose(self._solution_dot)*sum(product(theta_m, self.error_estimation_operator["m", "m"][:N, :N], theta_m))*self._solution_dot
+                    + 2.0*(transpose(self._solution_dot)*mf_product)
+                    + 2.0*(transpose(self._solution_dot)*ma_product*self._solution)
+                    + transpose(self._solution_dot)*mm_product*self._solution_dot
                 )
             else:
                 # Error estimator on initial condition does not use the residual
                 residual_norm_squared_over_time.append(0.)
         return residual_norm_squared_over_time
+        
+    # Assemble the affine combinations of error estimation operators for the given thetas
+    def _assemble_residual_norm_squared_operators(self, N, theta_m, theta_a, theta_f):
+        return (
+            sum(product(theta_f, self.error_estimation_operator["f", "f"], theta_f)),
+            sum(product(theta_a, self.error_estimation_operator["a", "f"][:N], theta_f)),
+            sum(product(theta_a, self.error_estimation_operator["a", "a"][:N, :N], theta_a)),
+            sum(product(theta_m, self.error_estimation_operator["m", "f"][:N], theta_f)),
+            sum(product(theta_m, self.error_estimation_operator["m", "a"][:N, :N], theta_a)),
+            sum(product(theta_m, self.error_estimation_operator["m", "m"][:N, :N], theta_m))
+        )
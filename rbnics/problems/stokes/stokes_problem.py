@@ -18,6 +18,7 @@
 
 from rbnics.problems.base import LinearProblem, ParametrizedDifferentialProblem
 from rbnics.backends import assign, copy, export, Function, import_, LinearSolver, product, sum
+from rbnics.utils.io import CacheIndex
 from rbnics.utils.mpi import log, PROGRESS
 
 StokesProblem_Base = LinearProblem(ParametrizedDifferentialProblem)
@@ -79,7 +80,7 @@ class StokesProblem(StokesProblem_Base):
         if "RAM" in self.cache_config and cache_key in self._supremizer_cache:
             log(PROGRESS, "Loading supremizer from cache")
             assign(self._supremizer, self._supremizer_cache[cache_key])
-        elif "Disk" in self.cache_config and self.import_supremizer(self.folder["cache"], cache_file):
+        elif "Disk" in self.cache_config and cache_file in CacheIndex(self.folder["cache"], self.disk_cache_size) and self.import_supremizer(self.folder["cache"], cache_file):
             log(PROGRESS, "Loading supremizer from file")
             if "RAM" in self.cache_config:
                 self._supremizer_cache[cache_key] = copy(self._supremizer)
@@ -89,8 +90,55 @@ class StokesProblem(StokesProblem_Base):
             if "RAM" in self.cache_config:
                 self._supremizer_cache[cache_key] = copy(self._supremizer)
             self.export_supremizer(self.folder["cache"], cache_file) # Note that we export to file regardless of config options, because they may change across different runs
+            CacheIndex(self.folder["cache"], self.disk_cache_size).add(cache_file)
         return self._supremizer
     
+    def solve_supremizers(self, mus, solutions):
+        """
+        Solve the supremizer problems associated to several parameters at once. Supremizers which are
+        available in cache are loaded, while the remaining ones are computed with a single linear solver
+        for multiple right-hand sides, so that the inner product matrix is factorized only once.
+        """
+        mu_bak = self.mu
+        supremizers = list()
+        pending_supremizers = list() # of (index, cache key, cache file, right-hand side, BCs)
+        for (index, (mu, solution)) in enumerate(zip(mus, solutions)):
+            self.set_mu(mu)
+            (cache_key, cache_file) = self._supremizer_cache_key_and_file()
+            if "RAM" in self.cache_config and cache_key in self._supremizer_cache:
+                log(PROGRESS, "Loading supremizer from cache")
+                supremizers.append(copy(self._supremizer_cache[cache_key]))
+            elif "Disk" in self.cache_config and cache_file in CacheIndex(self.folder["cache"], self.disk_cache_size) and self.import_supremizer(self.folder["cache"], cache_file):
+                log(PROGRESS, "Loading supremizer from file")
+                if "RAM" in self.cache_config:
+                    self._supremizer_cache[cache_key] = copy(self._supremizer)
+                supremizers.append(copy(self._supremizer))
+            else:
+                supremizers.append(None)
+                assembled_operator_bt = sum(product(self.compute_theta("bt_restricted"), self.operator["bt_restricted"]))
+                if self.dirichlet_bc["s"] is not None:
+                    assembled_dirichlet_bc = sum(product(self.compute_theta("dirichlet_bc_s"), self.dirichlet_bc["s"]))
+                else:
+                    assembled_dirichlet_bc = None
+                pending_supremizers.append((index, cache_key, cache_file, assembled_operator_bt*solution, assembled_dirichlet_bc))
+        if len(pending_supremizers) > 0:
+            log(PROGRESS, "Solving supremizer problems")
+            assert len(self.inner_product["s"]) == 1 # the affine expansion storage contains only the inner product matrix
+            # BCs are applied on the same boundaries for every parameter, so that the left-hand side is the same,
+            # while their (possibly parametrized) values are applied to each right-hand side
+            solver = LinearSolver(self.inner_product["s"][0], self._supremizer, pending_supremizers[0][3], pending_supremizers[0][4])
+            solver.set_parameters(self._linear_solver_parameters)
+            solved_supremizers = solver.solve_many([rhs for (_, _, _, rhs, _) in pending_supremizers], [bcs for (_, _, _, _, bcs) in pending_supremizers])
+            for ((index, cache_key, cache_file, _, _), supremizer) in zip(pending_supremizers, solved_supremizers):
+                self.set_mu(mus[index])
+                supremizers[index] = supremizer
+                if "RAM" in self.cache_config:
+                    self._supremizer_cache[cache_key] = copy(supremizer)
+                self.export_supremizer(self.folder["cache"], cache_file, supremizer) # Note that we export to file regardless of config options, because they may change across different runs
+                CacheIndex(self.folder["cache"], self.disk_cache_size).add(cache_file)
+        self.set_mu(mu_bak)
+        return supremizers
+    
     def _solve_supremizer(self, solution):
         assert len(self.inner_product["s"]) == 1 # the affine expansion storage contains only the inner product matrix
         assembled_operator_lhs = self.inner_product["s"][0]
@@ -18,6 +18,7 @@
 
 from rbnics.problems.base import LinearProblem, ParametrizedDifferentialProblem
 from rbnics.backends import assign, copy, export, Function, import_, LinearSolver, product, sum, transpose
+from rbnics.utils.io import CacheIndex
 from rbnics.utils.mpi import log, PROGRESS
 
 StokesOptimalControlProblem_Base = LinearProblem(ParametrizedDifferentialProblem)
@@ -124,7 +125,7 @@ class StokesOptimalControlProblem(StokesOptimalControlProblem_Base):
         if "RAM" in self.cache_config and cache_key in self._state_supremizer_cache:
             log(PROGRESS, "Loading state supremizer from cache")
             assign(self._state_supremizer, self._state_supremizer_cache[cache_key])
-        elif "Disk" in self.cache_config and self.import_supremizer(self.folder["cache"], cache_file, self._state_supremizer, component="s"):
+        elif "Disk" in self.cache_config and cache_file in CacheIndex(self.folder["cache"], self.disk_cache_size) and self.import_supremizer(self.folder["cache"], cache_file, self._state_supremizer, component="s"):
             log(PROGRESS, "Loading state supremizer from file")
             if "RAM" in self.cache_config:
                 self._state_supremizer_cache[cache_key] = copy(self._state_supremizer)
@@ -134,6 +135,7 @@ class StokesOptimalControlProblem(StokesOptimalControlProblem_Base):
             if "RAM" in self.cache_config:
                 self._state_supremizer_cache[cache_key] = copy(self._state_supremizer)
             self.export_supremizer(self.folder["cache"], cache_file, self._state_supremizer, component="s") # Note that we export to file regardless of config options, because they may change across different runs
+            CacheIndex(self.folder["cache"], self.disk_cache_size).add(cache_file)
         return self._state_supremizer
         
     def _solve_state_supremizer(self, solution):
@@ -159,7 +161,7 @@ class StokesOptimalControlProblem(StokesOptimalControlProblem_Base):
         if "RAM" in self.cache_config and cache_key in self._adjoint_supremizer_cache:
             log(PROGRESS, "Loading adjoint supremizer from cache")
             assign(self._adjoint_supremizer, self._adjoint_supremizer_cache[cache_key])
-        elif "Disk" in self.cache_config and self.import_supremizer(self.folder["cache"], cache_file, self._adjoint_supremizer, component="r"):
+        elif "Disk" in self.cache_config and cache_file in CacheIndex(self.folder["cache"], self.disk_cache_size) and self.import_supremizer(self.folder["cache"], cache_file, self._adjoint_supremizer, component="r"):
             log(PROGRESS, "Loading adjoint supremizer from file")
             if "RAM" in self.cache_config:
                 self._adjoint_supremizer_cache[cache_key] = copy(self._adjoint_supremizer)
@@ -169,6 +171,7 @@ class StokesOptimalControlProblem(StokesOptimalControlProblem_Base):
             if "RAM" in self.cache_config:
                 self._adjoint_supremizer_cache[cache_key] = copy(self._adjoint_supremizer)
             self.export_supremizer(self.folder["cache"], cache_file, self._adjoint_supremizer, component="r") # Note that we export to file regardless of config options, because they may change across different runs
+            CacheIndex(self.folder["cache"], self.disk_cache_size).add(cache_file)
         return self._adjoint_supremizer
         
     def _solve_adjoint_supremizer(self, solution):
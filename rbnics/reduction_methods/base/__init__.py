@@ -17,6 +17,7 @@
 #
 
 from rbnics.reduction_methods.base.differential_problem_reduction_method import DifferentialProblemReductionMethod
+from rbnics.reduction_methods.base.hp_rb_reduction import HPRBReduction
 from rbnics.reduction_methods.base.linear_pod_galerkin_reduction import LinearPODGalerkinReduction
 from rbnics.reduction_methods.base.linear_rb_reduction import LinearRBReduction
 from rbnics.reduction_methods.base.linear_reduction_method import LinearReductionMethod
@@ -39,6 +40,7 @@ from rbnics.reduction_methods.base.time_dependent_reduction_method import TimeDe
 
 __all__ = [
     'DifferentialProblemReductionMethod',
+    'HPRBReduction',
     'LinearPODGalerkinReduction',
     'LinearRBReduction',
     'LinearReductionMethod',
@@ -17,9 +17,12 @@
 #
 
 import inspect
-from rbnics.backends import assign
+from rbnics.backends import assign, is_replicated
 from rbnics.reduction_methods.base.reduction_method import ReductionMethod
-from rbnics.utils.io import Folders
+from rbnics.utils.config import config
+from rbnics.utils.io import CacheIndex, Folders
+from rbnics.utils.mpi import io_on_each_process, is_io_process, log, WARNING
+from rbnics.utils.profiler import memory_profiler
 from rbnics.utils.factories import ReducedProblemFactory
 from rbnics.utils.test import PatchInstanceMethod
 
@@ -53,7 +56,7 @@ class DifferentialProblemReductionMethod(ReductionMethod):
         self.truth_problem.init()
         
         # Initialize reduced order data structures in the reduced problem
-        self.reduced_problem = ReducedProblemFactory(self.truth_problem, self, **self._init_kwargs)
+        self.reduced_problem = self._create_reduced_problem()
         
         # Prepare folders and init reduced problem
         all_folders = Folders()
@@ -63,12 +66,22 @@ class DifferentialProblemReductionMethod(ReductionMethod):
         all_folders.pop("testing_set") # this is required only in the error/speedup analysis
         all_folders.pop("error_analysis") # this is required only in the error analysis
         all_folders.pop("speedup_analysis") # this is required only in the speedup analysis
+        all_folders.pop("checkpoints") # this is required only to resume an interrupted offline construction
         at_least_one_folder_created = all_folders.create()
-        if not at_least_one_folder_created:
+        self._checkpoint_state = self._init_checkpoints(all_folders)
+        if not at_least_one_folder_created and self._checkpoint_state is None:
             return False # offline construction should be skipped, since data are already available
-        else:
+        elif self._checkpoint_state is None or self._checkpoint_state["iteration"] == 0:
+            self._checkpoint_state = {"iteration": 0}
+            self._save_checkpoint(self._checkpoint_state)
             self.reduced_problem.init("offline")
             return True # offline construction should be carried out
+        else:
+            self.reduced_problem.init("online")
+            return True # offline construction should be resumed from the latest checkpoint
+        
+    def _create_reduced_problem(self):
+        return ReducedProblemFactory(self.truth_problem, self, **self._init_kwargs)
         
     def postprocess_snapshot(self, snapshot, snapshot_index):
         """
@@ -102,7 +115,10 @@ class DifferentialProblemReductionMethod(ReductionMethod):
             
     # Finalize data structures required after the offline phase
     def _finalize_offline(self):
+        self._remove_checkpoints()
         self.reduced_problem.init("online")
+        CacheIndex.flush_all()
+        memory_profiler.record(self.folder_prefix + " offline")
     
     # Initialize data structures required for the error analysis phase
     def _init_error_analysis(self, **kwargs):
@@ -121,7 +137,75 @@ class DifferentialProblemReductionMethod(ReductionMethod):
     def _finalize_error_analysis(self, **kwargs):
         # Undo patch to truth solve in case with_respect_to kwarg was provided
         self._undo_patch_truth_solve(False, **kwargs)
+        CacheIndex.flush_all()
+        memory_profiler.record(self.folder_prefix + " error analysis")
+        
+    def _loop_over_testing_set(self, table, analysis_for_mu, distribute=False):
+        """
+        Call analysis_for_mu(mu_index, mu, table) for each parameter in the testing set, where table is the
+        performance table to be filled in. If distribute is True, the testing set is split among MPI processes
+        as in _distributed_indices (using the "analysis processes" configuration option), and the tables
+        filled in by each process are merged. Speedup analyses should not be distributed, since timings would
+        be affected by processes competing for the same resources.
+        
+        The truth solution is computed only once for each parameter, and reused for all reduced dimensions.
+        """
+        mu_indices = None
+        if distribute:
+            mu_indices = self._distributed_indices(len(self.testing_set), "analysis processes")
+        if mu_indices is not None:
+            with io_on_each_process(), CacheIndex.writes_disabled():
+                for mu_index in mu_indices:
+                    self._analysis_for_mu(table, analysis_for_mu, mu_index, self.testing_set[mu_index])
+            table.merge_across_processes(mu_indices, is_io_process.mpi_comm)
+            # Other processes may have added entries to disk caches
+            CacheIndex.refresh_all()
+        else:
+            for (mu_index, mu) in enumerate(self.testing_set):
+                self._analysis_for_mu(table, analysis_for_mu, mu_index, mu)
+                
+    def _distributed_indices(self, size, processes_option):
+        """
+        Split range(size) among MPI processes, if more than one process is requested by the processes_option
+        entry of the "reduction methods" configuration section. Returns the indices assigned to the current
+        process (possibly none), or None if work should rather be carried out by all processes together.
+        Processes work independently of each other on their own indices: they should carry out their own I/O,
+        and refresh disk cache indices only at the end.
         
+        Concurrency only applies if the truth problem is replicated on every MPI process: truth problems
+        defined on a distributed mesh always run serially, and a message is logged once in such case.
+        """
+        is_io_process() # make sure that is_io_process.mpi_comm is the default I/O communicator
+        mpi_comm = is_io_process.mpi_comm
+        processes = min(config.get("reduction methods", processes_option), mpi_comm.size, size)
+        if processes > 1:
+            if is_replicated(self.truth_problem._solution):
+                if mpi_comm.rank < processes:
+                    return list(range(mpi_comm.rank, size, processes))
+                else:
+                    return list()
+            elif not DifferentialProblemReductionMethod._distributed_indices_warned:
+                log(WARNING, "The truth problem is distributed among MPI processes: option \"" + processes_option + "\" is ignored")
+                DifferentialProblemReductionMethod._distributed_indices_warned = True
+        return None
+        
+    _distributed_indices_warned = False
+    
+    def _analysis_for_mu(self, table, analysis_for_mu, mu_index, mu):
+        # Make sure that the truth solution is kept in RAM for all reduced dimensions, even if RAM cache is disabled
+        # (only entries added for the current parameter are then removed, so that other cached entries are preserved)
+        cache_config = self.truth_problem.cache_config
+        if "RAM" not in cache_config:
+            self.truth_problem.cache_config = cache_config | {"RAM"}
+            caches = [getattr(self.truth_problem, cache) for cache in ("_solution_cache", "_solution_dot_cache", "_solution_over_time_cache", "_solution_dot_over_time_cache", "_output_cache", "_output_over_time_cache") if hasattr(self.truth_problem, cache)]
+            cached_keys = [set(cache.keys()) for cache in caches]
+        analysis_for_mu(mu_index, mu, table)
+        if "RAM" not in cache_config:
+            self.truth_problem.cache_config = cache_config
+            for (cache, keys) in zip(caches, cached_keys):
+                for key in set(cache.keys()) - keys:
+                    del cache[key]
+    
     # Initialize data structures required for the speedup analysis phase
     def _init_speedup_analysis(self, **kwargs):
         # Initialize the affine expansion in the truth problem
@@ -140,6 +224,8 @@ class DifferentialProblemReductionMethod(ReductionMethod):
     def _finalize_speedup_analysis(self, **kwargs):
         # Undo patch to truth solve in case with_respect_to kwarg was provided
         self._undo_patch_truth_solve(True, **kwargs)
+        CacheIndex.flush_all()
+        memory_profiler.record(self.folder_prefix + " speedup analysis")
         
     def _patch_truth_solve(self, force, **kwargs):
         if "with_respect_to" in kwargs:
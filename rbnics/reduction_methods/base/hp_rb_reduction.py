@@ -0,0 +1,229 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+import os
+from rbnics.sampling import ParameterSpacePartition
+from rbnics.utils.decorators import PreserveClassName
+from rbnics.utils.io import TextBox, TextLine
+from rbnics.utils.test import PatchInstanceMethod
+
+def HPRBReduction(DifferentialProblemReductionMethod_DerivedClass):
+
+    @PreserveClassName
+    class HPRBReduction_Class(DifferentialProblemReductionMethod_DerivedClass):
+        """
+        hp reduced basis method: the parameter box is recursively bisected as long as the local greedy does not
+        reach the tolerance with at most Nmax basis functions, and a separate reduced problem is built on each
+        subdomain of the resulting partition. Online, each parameter is dispatched to the reduced problem of the
+        subdomain it belongs to.
+        
+        :param truth_problem: class of the truth problem to be solved.
+        """
+        
+        def __init__(self, truth_problem, **kwargs):
+            # Call the parent initialization
+            DifferentialProblemReductionMethod_DerivedClass.__init__(self, truth_problem, **kwargs)
+            # Local reduced problems are stored in separate folders, and must thus be the only ones associated
+            # to the truth problem
+            from rbnics.eim.problems import DEIM, EIM, ExactParametrizedFunctions
+            if hasattr(type(truth_problem), "ProblemDecorators"):
+                assert all([Algorithm not in type(truth_problem).ProblemDecorators for Algorithm in (DEIM, EIM, ExactParametrizedFunctions)]), "hp reduced basis method is not available for problems decorated with DEIM, EIM or ExactParametrizedFunctions"
+                
+            # Partition of the parameter box, and reduction method on each of its subdomains
+            self.partition = None # ParameterSpacePartition
+            self.local_reduction_methods = dict() # from subdomain to reduction method
+            # Arguments of setters, to be propagated to local reduction methods
+            self._set_Nmax_kwargs = dict()
+            self._set_tolerance_kwargs = dict()
+            self._initialize_training_set_args = None
+            self._initialize_testing_set_args = None
+            # I/O
+            self.folder["partition"] = os.path.join(self.folder_prefix, "partition")
+            self.label = "hp-" + self.label
+            
+        # OFFLINE: set maximum reduced space dimension (stopping criterion) on each subdomain
+        def set_Nmax(self, Nmax, **kwargs):
+            DifferentialProblemReductionMethod_DerivedClass.set_Nmax(self, Nmax, **kwargs)
+            self._set_Nmax_kwargs = kwargs
+            
+        # OFFLINE: set tolerance (stopping criterion) on each subdomain
+        def set_tolerance(self, tol, **kwargs):
+            DifferentialProblemReductionMethod_DerivedClass.set_tolerance(self, tol, **kwargs)
+            self._set_tolerance_kwargs = kwargs
+            
+        # OFFLINE: set the elements in the training set, which will then be split among subdomains
+        def initialize_training_set(self, ntrain, enable_import=True, sampling=None, **kwargs):
+            self._initialize_training_set_args = (enable_import, sampling, kwargs)
+            return DifferentialProblemReductionMethod_DerivedClass.initialize_training_set(self, ntrain, enable_import, sampling, **kwargs)
+            
+        # ERROR ANALYSIS: set the elements in the testing set, which will then be split among subdomains
+        def initialize_testing_set(self, ntest, enable_import=False, sampling=None, **kwargs):
+            self._initialize_testing_set_args = (enable_import, sampling, kwargs)
+            return DifferentialProblemReductionMethod_DerivedClass.initialize_testing_set(self, ntest, enable_import, sampling, **kwargs)
+            
+        def offline(self):
+            """
+            It performs the offline phase of the reduced order model, building the partition of the parameter box
+            and a local reduced basis on each of its subdomains.
+            
+            :return: reduced_problem which dispatches each parameter to the local reduced problem.
+            """
+            print(TextBox(self.truth_problem.name() + " " + self.label + " offline phase begins", fill="="))
+            print("")
+            
+            # The partition is built only once: if available from a previous run, local reduction methods
+            # are only required to load their data
+            self.partition = ParameterSpacePartition(self.truth_problem.mu_range)
+            self.folder["partition"].create()
+            partition_available = self.partition.load(self.folder["partition"], "partition")
+            self.local_reduction_methods.clear()
+            
+            nodes = self.partition.leaves()
+            first_mu = self.truth_problem.mu
+            while len(nodes) > 0:
+                node = nodes.pop(0)
+                print(TextLine("subdomain " + str(self.partition.subdomain(node)), fill="~"))
+                local_reduction_method = self._init_local_reduction_method(node)
+                if node == "":
+                    self.truth_problem.set_mu(first_mu)
+                else:
+                    self.truth_problem.set_mu(tuple([(mu_p_min + mu_p_max)/2. for (mu_p_min, mu_p_max) in self.partition.subdomain(node)]))
+                local_reduction_method.offline()
+                if not partition_available and not self._local_tolerance_reached(local_reduction_method):
+                    children = self.partition.split(node)
+                    if all(len(self.partition.subset(self.training_set, child)) >= self.Nmax for child in children):
+                        print("local tolerance not reached with Nmax basis functions, split subdomain")
+                        nodes.extend(children)
+                        continue
+                    else:
+                        self.partition.merge(node)
+                self.local_reduction_methods[node] = local_reduction_method
+            self.partition.save(self.folder["partition"], "partition")
+            
+            self.reduced_problem = HPReducedProblem(self.partition, {node: local_reduction_method.reduced_problem for (node, local_reduction_method) in self.local_reduction_methods.items()}, first_mu)
+            
+            print(TextBox(self.truth_problem.name() + " " + self.label + " offline phase ends", fill="="))
+            print("")
+            
+            return self.reduced_problem
+            
+        def _init_local_reduction_method(self, node):
+            local_reduction_method = DifferentialProblemReductionMethod_DerivedClass(self.truth_problem, **self._init_kwargs)
+            reduction_methods = [(self, local_reduction_method)]
+            local_folder_prefix = os.path.join(str(self.folder["partition"]), "subdomain" + node)
+            _change_folder_prefix(local_reduction_method, local_folder_prefix)
+            if hasattr(self, "dual_reduction_method"):
+                reduction_methods.append((self.dual_reduction_method, local_reduction_method.dual_reduction_method))
+                _change_folder_prefix(local_reduction_method.dual_reduction_method, os.path.join(local_folder_prefix, "dual"))
+            # Propagate setters
+            local_reduction_method.set_Nmax(self.Nmax, **self._set_Nmax_kwargs)
+            local_reduction_method.set_tolerance(self.tol, **self._set_tolerance_kwargs)
+            local_reduction_method.set_batch_size(self.batch_size, self.batch_minimum_distance)
+            assert self._initialize_training_set_args is not None, "Please initialize the training set before calling offline()"
+            (enable_import, sampling, kwargs) = self._initialize_training_set_args
+            local_reduction_method.initialize_training_set(len(self.training_set), enable_import, sampling, **kwargs)
+            # Restrict training sets to the subdomain
+            for (reduction_method, local_reduction_method_) in reduction_methods:
+                local_reduction_method_.training_set._list = self.partition.subset(reduction_method.training_set, node)._list
+                local_reduction_method_.training_set.save(local_reduction_method_.folder["training_set"], "training_set")
+            return local_reduction_method
+            
+        def _local_tolerance_reached(self, local_reduction_method):
+            # Compare the relative error estimator of the last iteration rather than the error estimators stored for
+            # the last batch, since the batch may have been shortened by the minimum distance or by Nmax
+            greedy_relative_error_estimators = local_reduction_method.greedy_relative_error_estimators
+            greedy_relative_error_estimators.load(local_reduction_method.folder["post_processing"], "relative_error_estimator_max")
+            return len(greedy_relative_error_estimators) > 0 and greedy_relative_error_estimators[-1] < self.tol
+            
+        def _init_local_testing_sets(self):
+            assert len(self.local_reduction_methods) > 0, "Please call offline() before carrying out the error or speedup analysis"
+            assert self._initialize_testing_set_args is not None, "Please initialize the testing set before carrying out the error or speedup analysis"
+            (enable_import, sampling, kwargs) = self._initialize_testing_set_args
+            nodes = list()
+            for (node, local_reduction_method) in sorted(self.local_reduction_methods.items()):
+                reduction_methods = [(self, local_reduction_method)]
+                if hasattr(self, "dual_reduction_method"):
+                    reduction_methods.append((self.dual_reduction_method, local_reduction_method.dual_reduction_method))
+                local_reduction_method.initialize_testing_set(len(self.testing_set), False, sampling, **kwargs)
+                for (reduction_method, local_reduction_method_) in reduction_methods:
+                    local_reduction_method_.testing_set._list = self.partition.subset(reduction_method.testing_set, node)._list
+                    local_reduction_method_.testing_set.save(local_reduction_method_.folder["testing_set"], "testing_set")
+                if len(local_reduction_method.testing_set) > 0:
+                    nodes.append(node)
+            return nodes
+            
+        # Compute the error of the reduced order approximation with respect to the full order one
+        # over the testing set, separately on each subdomain
+        def error_analysis(self, N_generator=None, filename=None, **kwargs):
+            for node in self._init_local_testing_sets():
+                print(TextLine("subdomain " + str(self.partition.subdomain(node)), fill="~"))
+                self.local_reduction_methods[node].error_analysis(N_generator, filename, **kwargs)
+                
+        # Compute the speedup of the reduced order approximation with respect to the full order one
+        # over the testing set, separately on each subdomain
+        def speedup_analysis(self, N_generator=None, filename=None, **kwargs):
+            for node in self._init_local_testing_sets():
+                print(TextLine("subdomain " + str(self.partition.subdomain(node)), fill="~"))
+                self.local_reduction_methods[node].speedup_analysis(N_generator, filename, **kwargs)
+                
+    # return value (a class) for the decorator
+    return HPRBReduction_Class
+
+class HPReducedProblem(object):
+    """
+    Reduced problem of the hp reduced basis method. Setting the parameter selects the local reduced problem
+    of the subdomain the parameter belongs to, and any other attribute is looked up in the selected local reduced problem.
+    
+    :param partition: the partition of the parameter box.
+    :param local_reduced_problems: dict from subdomain to local reduced problem.
+    :param mu: the current parameter.
+    """
+    
+    def __init__(self, partition, local_reduced_problems, mu):
+        self.partition = partition
+        self.local_reduced_problems = local_reduced_problems
+        self.local_reduced_problem = local_reduced_problems[partition.find(mu)]
+        
+    def set_mu(self, mu):
+        self.local_reduced_problem = self.local_reduced_problems[self.partition.find(mu)]
+        self.local_reduced_problem.set_mu(mu)
+        
+    def set_mu_range(self, mu_range):
+        for local_reduced_problem in self.local_reduced_problems.values():
+            local_reduced_problem.set_mu_range(mu_range)
+        self.local_reduced_problem = self.local_reduced_problems[self.partition.find(self.local_reduced_problem.mu)]
+        
+    def __getattr__(self, name):
+        if name in ("partition", "local_reduced_problems", "local_reduced_problem"): # not initialized yet
+            raise AttributeError(name)
+        return getattr(self.local_reduced_problem, name)
+
+def _change_folder_prefix(reduction_method, new_folder_prefix):
+    # Change the folder names in reduction method ...
+    for (key, name) in reduction_method.folder.items():
+        reduction_method.folder[key] = name.replace(reduction_method.folder_prefix, new_folder_prefix)
+    reduction_method.folder_prefix = new_folder_prefix
+    # ... and in the reduced problem it will create
+    create_reduced_problem = reduction_method._create_reduced_problem
+    def patched_create_reduced_problem(self_):
+        reduced_problem = create_reduced_problem()
+        for (key, name) in reduced_problem.folder.items():
+            reduced_problem.folder[key] = name.replace(reduced_problem.folder_prefix, new_folder_prefix)
+        reduced_problem.folder_prefix = new_folder_prefix
+        return reduced_problem
+    PatchInstanceMethod(reduction_method, "_create_reduced_problem", patched_create_reduced_problem).patch()
@@ -17,10 +17,12 @@
 #
 
 import os
+from math import sqrt
 from numbers import Number
 from rbnics.backends import ProperOrthogonalDecomposition
 from rbnics.utils.decorators import PreserveClassName, RequiredBaseDecorators
 from rbnics.utils.io import ErrorAnalysisTable, SpeedupAnalysisTable, TextBox, TextLine, Timer
+from rbnics.utils.profiler import memory_profiler, profiler
 
 @RequiredBaseDecorators(None)
 def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
@@ -120,6 +122,7 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             self._finalize_offline()
             return self.reduced_problem
             
+        @profiler.span("offline")
         def _offline(self):
             print(TextBox(self.truth_problem.name() + " " + self.label + " offline phase begins", fill="="))
             print("")
@@ -131,15 +134,20 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
                 
                 print("truth solve for mu =", self.truth_problem.mu)
                 snapshot = self.truth_problem.solve()
-                self.truth_problem.export_solution(self.folder["snapshots"], "truth_" + str(mu_index), snapshot)
+                self.export_queue.put(self.truth_problem, self.folder["snapshots"], "truth_" + str(mu_index), snapshot)
                 snapshot = self.postprocess_snapshot(snapshot, mu_index)
                 
                 print("update snapshots matrix")
                 self.update_snapshots_matrix(snapshot)
+                if memory_profiler.check():
+                    print("memory budget exceeded: compress snapshots matrix")
+                    self.compress_snapshots_matrix()
 
                 print("")
                 mu_index += 1
                 
+            self.export_queue.flush()
+            
             print(TextLine("perform POD", fill="#"))
             self.compute_basis_functions()
             
@@ -162,6 +170,24 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
                     self.POD[component].store_snapshot(snapshot, component=component)
             else:
                 self.POD.store_snapshot(snapshot)
+                
+        def compress_snapshots_matrix(self):
+            """
+            It replaces the snapshots matrix by its POD modes, weighted by the square root of the corresponding eigenvalues.
+            This allows to process further snapshots in a streaming fashion when the memory budget is exceeded, at the
+            cost of an additional truncation error.
+            Eigenvalues which are slightly negative due to round-off errors are replaced by zero.
+            """
+            if len(self.truth_problem.components) > 1:
+                for component in self.truth_problem.components:
+                    POD = self.POD[component]
+                    (eigs, _, basis_functions, _) = POD.apply(self.Nmax, self.tol[component])
+                    POD.clear()
+                    POD.store_snapshot(basis_functions, weight=[sqrt(max(e, 0.)) for e in eigs], component=component)
+            else:
+                (eigs, _, basis_functions, _) = self.POD.apply(self.Nmax, self.tol)
+                self.POD.clear()
+                self.POD.store_snapshot(basis_functions, weight=[sqrt(max(e, 0.)) for e in eigs])
             
         def compute_basis_functions(self):
             """
@@ -223,11 +249,14 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             error_analysis_table.add_column("error_output", group_name="output", operations=("mean", "max"))
             error_analysis_table.add_column("relative_error_output", group_name="output", operations=("mean", "max"))
             
-            for (mu_index, mu) in enumerate(self.testing_set):
+            def error_analysis_for_mu(mu_index, mu, error_analysis_table):
                 print(TextLine(str(mu_index), fill="#"))
                 
                 self.reduced_problem.set_mu(mu)
-                            
+                
+                # Solve the reduced problem for all dimensions at once (if supported)
+                self.reduced_problem.solve_nested([N_generator(n) for n in range(1, N + 1) if N_generator(n) is not None], **kwargs)
+                
                 for n in range(1, N + 1): # n = 1, ... N
                     n_arg = N_generator(n)
                     
@@ -262,6 +291,8 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
                     error_analysis_table["error_output", n, mu_index] = error_output
                     error_analysis_table["relative_error_output", n, mu_index] = relative_error_output
             
+            self._loop_over_testing_set(error_analysis_table, error_analysis_for_mu, distribute=True)
+            
             # Print
             print("")
             print(error_analysis_table)
@@ -304,7 +335,7 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             truth_timer = Timer("parallel")
             reduced_timer = Timer("serial")
                         
-            for (mu_index, mu) in enumerate(self.testing_set):
+            def speedup_analysis_for_mu(mu_index, mu, speedup_analysis_table):
                 print(TextLine(str(mu_index), fill="#"))
                 
                 self.reduced_problem.set_mu(mu)
@@ -341,6 +372,8 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
                     else:
                         speedup_analysis_table["speedup_output", n, mu_index] = NotImplemented
             
+            self._loop_over_testing_set(speedup_analysis_table, speedup_analysis_for_mu)
+            
             # Print
             print("")
             print(speedup_analysis_table)
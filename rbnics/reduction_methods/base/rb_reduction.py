@@ -19,9 +19,11 @@
 import os
 from math import sqrt
 from rbnics.backends import GramSchmidt
+from rbnics.sampling import AdaptiveParameterSpaceSubset
 from rbnics.utils.decorators import PreserveClassName, RequiredBaseDecorators
-from rbnics.utils.io import ErrorAnalysisTable, GreedySelectedParametersList, GreedyErrorEstimatorsList, SpeedupAnalysisTable, TextBox, TextLine, Timer
-from rbnics.utils.mpi import log, DEBUG
+from rbnics.utils.io import CacheIndex, ErrorAnalysisTable, GreedySelectedParametersList, GreedyErrorEstimatorsList, SpeedupAnalysisTable, TextBox, TextLine, Timer
+from rbnics.utils.mpi import io_on_each_process, log, DEBUG
+from rbnics.utils.profiler import profiler
 
 @RequiredBaseDecorators(None)
 def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
@@ -47,7 +49,44 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             self.folder["post_processing"] = os.path.join(self.folder_prefix, "post_processing")
             self.greedy_selected_parameters = GreedySelectedParametersList()
             self.greedy_error_estimators = GreedyErrorEstimatorsList()
+            self.greedy_relative_error_estimators = GreedyErrorEstimatorsList() # of the largest relative error estimator at each iteration
             self.label = "RB"
+            # Batch greedy
+            self.batch_size = 1
+            self.batch_minimum_distance = 0.
+            self._greedy_batch = list() # of parameters selected by the greedy in addition to the one with the largest error estimator
+            self._greedy_batch_error_estimators = list() # of error estimators of the parameters in self._greedy_batch
+            
+        def set_batch_size(self, batch_size, minimum_distance=0., **kwargs):
+            """
+            It sets the number of parameters selected at each greedy iteration. The corresponding truth problems are
+            solved concurrently (if allowed by the configuration and the truth problem is replicated on every MPI
+            process), and reduced operators and error estimation operators are updated only once per iteration.
+            Error estimators of all selected parameters are stored, in the same order as the selected parameters.
+            
+            :param batch_size: number of parameters selected at each greedy iteration.
+            :param minimum_distance: parameters closer than minimum_distance to a parameter with a larger error estimator are not selected.
+            """
+            assert batch_size >= 1
+            self.batch_size = batch_size
+            self.batch_minimum_distance = minimum_distance
+            
+        def initialize_training_set(self, ntrain, enable_import=True, sampling=None, saturation_constant=None, enrichment_size=0, **kwargs):
+            """
+            It initializes the training set. If a saturation constant or an enrichment size is provided, the
+            training set is adaptive: at each greedy iteration, parameters which cannot be the maximizer of the error
+            estimator (under the saturation assumption) are skipped, and new parameters are sampled close to the ones with
+            the largest error estimator.
+            
+            :param ntrain: size of the (initial) training set.
+            :param enable_import: whether to import the training set from file.
+            :param sampling: the distribution used to sample the training set.
+            :param saturation_constant: saturation constant (larger than or equal to one) for error estimators from one greedy iteration to the next.
+            :param enrichment_size: number of parameters added to the training set at each greedy iteration.
+            """
+            if saturation_constant is not None or enrichment_size > 0:
+                self.training_set = AdaptiveParameterSpaceSubset(self.truth_problem.mu_range, sampling, saturation_constant, enrichment_size)
+            return DifferentialProblemReductionMethod_DerivedClass.initialize_training_set(self, ntrain, enable_import, sampling, **kwargs)
             
         def _init_offline(self):
             # Call parent to initialize inner product and reduced problem
@@ -105,23 +144,36 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             self._finalize_offline()
             return self.reduced_problem
             
+        @profiler.span("offline")
         def _offline(self):
             print(TextBox(self.truth_problem.name() + " " + self.label + " offline phase begins", fill="="))
             print("")
             
             iteration = 0
             relative_error_estimator_max = 2.*self.tol
+            if self._checkpoint_state["iteration"] > 0:
+                (iteration, relative_error_estimator_max) = self._restore_checkpoint_state(self._checkpoint_state)
+                print("resume from the checkpoint at N = " + str(self.reduced_problem.N))
+                print("")
             while self.reduced_problem.N < self.Nmax and relative_error_estimator_max >= self.tol:
                 print(TextLine("N = " + str(self.reduced_problem.N), fill="#"))
                 
-                print("truth solve for mu =", self.truth_problem.mu)
-                snapshot = self.truth_problem.solve()
-                self.truth_problem.export_solution(self.folder["snapshots"], "truth_" + str(iteration), snapshot)
-                snapshot = self.postprocess_snapshot(snapshot, iteration)
-                
-                print("update basis matrix")
-                self.update_basis_matrix(snapshot)
-                iteration += 1
+                batch = [self.truth_problem.mu] + self._greedy_batch
+                self._init_batch_truth_solves(batch)
+                for mu in batch:
+                    if mu != batch[0] and self.reduced_problem.N >= self.Nmax:
+                        break
+                    self.truth_problem.set_mu(mu)
+                    
+                    print("truth solve for mu =", self.truth_problem.mu)
+                    snapshot = self.truth_problem.solve()
+                    self.export_queue.put(self.truth_problem, self.folder["snapshots"], "truth_" + str(iteration), snapshot)
+                    snapshot = self.postprocess_snapshot(snapshot, iteration)
+                    
+                    print("update basis matrix")
+                    self.update_basis_matrix(snapshot)
+                    iteration += 1
+                self._finalize_batch_truth_solves(batch)
                 
                 print("build reduced operators")
                 self.reduced_problem.build_reduced_operators()
@@ -135,12 +187,42 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
                 (absolute_error_estimator_max, relative_error_estimator_max) = self.greedy()
                 print("maximum absolute error estimator over training set =", absolute_error_estimator_max)
                 print("maximum relative error estimator over training set =", relative_error_estimator_max)
+                
+                self._save_checkpoint(self._get_checkpoint_state(iteration, relative_error_estimator_max))
 
                 print("")
                 
+            self.export_queue.flush()
             print(TextBox(self.truth_problem.name() + " " + self.label + " offline phase ends", fill="="))
             print("")
             
+        # State of the greedy algorithm to be stored in checkpoints, in addition to the offline data
+        # which have been already saved to file
+        def _get_checkpoint_state(self, snapshot_index, relative_error_estimator_max):
+            state = {
+                "iteration": len(self.greedy_error_estimators),
+                "snapshot_index": snapshot_index,
+                "mu": self.truth_problem.mu,
+                "relative_error_estimator_max": relative_error_estimator_max,
+                "greedy_batch": self._greedy_batch,
+                "training_set": self.training_set._list
+            }
+            if isinstance(self.training_set, AdaptiveParameterSpaceSubset):
+                state["training_set_previous_values"] = self.training_set._previous_values
+            return state
+            
+        def _restore_checkpoint_state(self, state):
+            self.greedy_selected_parameters.load(self.folder["post_processing"], "mu_greedy")
+            self.greedy_error_estimators.load(self.folder["post_processing"], "error_estimator_max")
+            assert len(self.greedy_error_estimators) == state["iteration"]
+            self.greedy_relative_error_estimators.load(self.folder["post_processing"], "relative_error_estimator_max")
+            self.truth_problem.set_mu(state["mu"])
+            self._greedy_batch = state["greedy_batch"]
+            self.training_set._list = state["training_set"]
+            if isinstance(self.training_set, AdaptiveParameterSpaceSubset):
+                self.training_set._previous_values = state["training_set_previous_values"]
+            return (state["snapshot_index"], state["relative_error_estimator_max"])
+            
         def update_basis_matrix(self, snapshot):
             """
             It updates basis matrix.
@@ -168,10 +250,17 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             (error_estimator_max, error_estimator_argmax) = self._greedy()
             self.truth_problem.set_mu(self.training_set[error_estimator_argmax])
             self.greedy_selected_parameters.append(self.training_set[error_estimator_argmax])
+            for mu in self._greedy_batch:
+                self.greedy_selected_parameters.append(mu)
             self.greedy_selected_parameters.save(self.folder["post_processing"], "mu_greedy")
             self.greedy_error_estimators.append(error_estimator_max)
+            for error_estimator in self._greedy_batch_error_estimators:
+                self.greedy_error_estimators.append(error_estimator)
             self.greedy_error_estimators.save(self.folder["post_processing"], "error_estimator_max")
-            return (error_estimator_max, error_estimator_max/self.greedy_error_estimators[0])
+            relative_error_estimator_max = error_estimator_max/self.greedy_error_estimators[0]
+            self.greedy_relative_error_estimators.append(relative_error_estimator_max)
+            self.greedy_relative_error_estimators.save(self.folder["post_processing"], "relative_error_estimator_max")
+            return (error_estimator_max, relative_error_estimator_max)
             
         def _greedy(self):
             """
@@ -193,8 +282,47 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
                 return error_estimator
             
             print("find next mu")
-            return self.training_set.max(solve_and_estimate_error)
+            return self._greedy_max(solve_and_estimate_error)
             
+        def _greedy_max(self, error_estimator_generator):
+            """
+            It finds the parameter in the training set with the largest error estimator and, in case of batch greedy,
+            stores the further parameters to be added to the basis at the next iteration.
+            
+            :return: max error estimator and the respective parameter index.
+            """
+            if self.batch_size > 1:
+                (error_estimators, error_estimators_args) = self.training_set.max_batch(error_estimator_generator, self.batch_size, self.batch_minimum_distance)
+                self._greedy_batch = [self.training_set[mu_index] for mu_index in error_estimators_args[1:]]
+                self._greedy_batch_error_estimators = error_estimators[1:]
+                return (error_estimators[0], error_estimators_args[0])
+            else:
+                return self.training_set.max(error_estimator_generator)
+                
+        def _init_batch_truth_solves(self, batch):
+            """
+            Split the truth solves for the parameters in the batch among MPI processes as in _distributed_indices
+            (using the "offline processes" configuration option). Truth solutions will then be loaded from the disk cache.
+            """
+            mu_indices = self._distributed_indices(len(batch), "offline processes")
+            if mu_indices is not None:
+                with io_on_each_process(), CacheIndex.writes_disabled():
+                    for mu_index in mu_indices:
+                        self.truth_problem.set_mu(batch[mu_index])
+                        self.truth_problem.solve()
+                # Other processes have added entries to disk caches
+                CacheIndex.refresh_all()
+                # Make sure that truth solutions are loaded from the disk cache, even if disk cache is disabled
+                cache_config = self.truth_problem.cache_config
+                if "Disk" not in cache_config:
+                    self.truth_problem.cache_config = cache_config | {"Disk"}
+                    self._batch_truth_solves_cache_config = cache_config
+                    
+        def _finalize_batch_truth_solves(self, batch):
+            if hasattr(self, "_batch_truth_solves_cache_config"):
+                self.truth_problem.cache_config = self._batch_truth_solves_cache_config
+                del self._batch_truth_solves_cache_config
+                
         def error_analysis(self, N_generator=None, filename=None, **kwargs):
             """
             It computes the error of the reduced order approximation with respect to the full order one over the testing set.
@@ -250,11 +378,14 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             error_analysis_table.add_column("relative_error_estimator_output", group_name="output_relative_error", operations=("mean", "max"))
             error_analysis_table.add_column("relative_effectivity_output", group_name="output_relative_error", operations=("min", "mean", "max"))
             
-            for (mu_index, mu) in enumerate(self.testing_set):
+            def error_analysis_for_mu(mu_index, mu, error_analysis_table):
                 print(TextLine(str(mu_index), fill="#"))
                 
                 self.reduced_problem.set_mu(mu)
-                            
+                
+                # Solve the reduced problem for all dimensions at once (if supported)
+                self.reduced_problem.solve_nested([N_generator(n) for n in range(1, N + 1) if N_generator(n) is not None], **kwargs)
+                
                 for n in range(1, N + 1): # n = 1, ... N
                     n_arg = N_generator(n)
                     
@@ -319,6 +450,8 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
                     error_analysis_table["relative_error_estimator_output", n, mu_index] = relative_error_output_estimator
                     error_analysis_table["relative_effectivity_output", n, mu_index] = error_analysis_table["relative_error_estimator_output", n, mu_index]/error_analysis_table["relative_error_output", n, mu_index]
             
+            self._loop_over_testing_set(error_analysis_table, error_analysis_for_mu, distribute=True)
+            
             # Print
             print("")
             print(error_analysis_table)
@@ -364,7 +497,7 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             truth_timer = Timer("parallel")
             reduced_timer = Timer("serial")
                         
-            for (mu_index, mu) in enumerate(self.testing_set):
+            def speedup_analysis_for_mu(mu_index, mu, speedup_analysis_table):
                 print(TextLine(str(mu_index), fill="#"))
                 
                 self.reduced_problem.set_mu(mu)
@@ -456,6 +589,8 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
                     else:
                         speedup_analysis_table["speedup_output_and_estimate_relative_error_output", n, mu_index] = NotImplemented
             
+            self._loop_over_testing_set(speedup_analysis_table, speedup_analysis_for_mu)
+            
             # Print
             print("")
             print(speedup_analysis_table)
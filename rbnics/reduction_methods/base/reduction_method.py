@@ -17,9 +17,13 @@
 #
 
 import os
+import shutil
 from abc import ABCMeta, abstractmethod
 from rbnics.sampling import ParameterSpaceSubset
-from rbnics.utils.io import Folders
+from rbnics.utils.config import config
+from rbnics.utils.io import ExportQueue, Folders, PickleIO
+from rbnics.utils.mpi import is_io_process
+from rbnics.utils.profiler import memory_profiler
 
 # Implementation of a class containing an offline/online decomposition of ROM for parametrized problems
 class ReductionMethod(object, metaclass=ABCMeta):
@@ -37,6 +41,12 @@ class ReductionMethod(object, metaclass=ABCMeta):
         self.training_set = ParameterSpaceSubset()
         # I/O
         self.folder["training_set"] = os.path.join(self.folder_prefix, "training_set")
+        self.export_queue = ExportQueue(config.get("reduction methods", "export staging folder"), config.get("reduction methods", "export queue size"))
+        self.folder["checkpoints"] = os.path.join(self.folder_prefix, "checkpoints")
+        self._checkpoint_folders = Folders() # folders to be stored in checkpoints, set by _init_checkpoints
+        # Memory budget (in megabytes per process, 0 for no budget)
+        memory_profiler.set_budget(config.get("reduction methods", "memory budget"))
+        memory_profiler.set_check_interval(config.get("reduction methods", "memory check interval"))
         
         # $$ ERROR ANALYSIS AND SPEEDUP ANALYSIS DATA STRUCTURES $$ #
         # Testing set
@@ -94,6 +104,85 @@ class ReductionMethod(object, metaclass=ABCMeta):
     # Finalize data structures required after the offline phase
     def _finalize_offline(self):
         pass
+        
+    # Restore the offline data from the latest checkpoint, if any. Checkpoints store a copy of the given folders
+    # (except the ones containing snapshots, which are not needed to resume the offline phase) and of a state dict,
+    # which must contain the iteration at which the checkpoint was saved. Returns the state of the latest
+    # checkpoint, or None if no checkpoint is available (i.e., the offline phase has either never been started
+    # or been completed).
+    def _init_checkpoints(self, all_folders):
+        self._checkpoint_folders = Folders()
+        for (key, folder) in all_folders.items():
+            if key not in ("cache", "checkpoints", "partition") and not key.endswith("snapshots"):
+                self._checkpoint_folders[key] = folder
+        state = None
+        if is_io_process():
+            iterations = self._checkpoint_iterations()
+            if len(iterations) > 0:
+                checkpoint = os.path.join(str(self.folder["checkpoints"]), str(iterations[-1]))
+                for (key, folder) in self._checkpoint_folders.items():
+                    shutil.rmtree(str(folder))
+                    shutil.copytree(os.path.join(checkpoint, key), str(folder))
+                state = PickleIO.load_file(checkpoint, "state")
+        state = is_io_process.mpi_comm.bcast(state, root=is_io_process.root)
+        return state
+        
+    # Save a checkpoint at the end of an offline iteration. Checkpoints are disabled by default, and are otherwise
+    # saved at iteration 0 (i.e., before the first iteration, so that an offline phase interrupted early is restarted
+    # from scratch) and then every "checkpoint interval" iterations. Only the latest checkpoint is kept. Checkpoints
+    # are incremental: files which have not changed since the previous checkpoint are hardlinked to it rather than
+    # copied, so that the cost of saving a checkpoint is proportional to the files written since the previous one.
+    # Each checkpoint is first written to a temporary folder, and then renamed, so that an interruption while saving
+    # does not corrupt the previous checkpoint
+    def _save_checkpoint(self, state):
+        interval = config.get("reduction methods", "checkpoint interval")
+        if interval == 0:
+            return
+        iteration = state["iteration"]
+        if iteration > 0 and iteration % interval > 0:
+            return
+        self.export_queue.flush() # exported snapshots should be in place before they are stored in the checkpoint
+        checkpoint = os.path.join(str(self.folder["checkpoints"]), str(iteration))
+        checkpoint_tmp = checkpoint + "_tmp"
+        checkpoint_exists = None
+        if is_io_process():
+            checkpoint_exists = os.path.exists(checkpoint) # e.g. when resuming from this checkpoint
+            if not checkpoint_exists:
+                if os.path.exists(checkpoint_tmp):
+                    shutil.rmtree(checkpoint_tmp)
+                previous_iterations = self._checkpoint_iterations()
+                if len(previous_iterations) > 0:
+                    previous_checkpoint = os.path.join(str(self.folder["checkpoints"]), str(previous_iterations[-1]))
+                else:
+                    previous_checkpoint = None
+                for (key, folder) in self._checkpoint_folders.items():
+                    _copy_folder_incrementally(
+                        str(folder), os.path.join(checkpoint_tmp, key),
+                        os.path.join(previous_checkpoint, key) if previous_checkpoint is not None else None
+                    )
+        checkpoint_exists = is_io_process.mpi_comm.bcast(checkpoint_exists, root=is_io_process.root)
+        if checkpoint_exists:
+            return
+        PickleIO.save_file(state, checkpoint_tmp, "state")
+        if is_io_process():
+            os.replace(checkpoint_tmp, checkpoint)
+            for previous_iteration in self._checkpoint_iterations():
+                if previous_iteration < iteration:
+                    shutil.rmtree(os.path.join(str(self.folder["checkpoints"]), str(previous_iteration)))
+        is_io_process.mpi_comm.barrier()
+        
+    # Remove all checkpoints after the offline phase has been completed
+    def _remove_checkpoints(self):
+        if is_io_process() and os.path.exists(str(self.folder["checkpoints"])):
+            shutil.rmtree(str(self.folder["checkpoints"]))
+        is_io_process.mpi_comm.barrier()
+        
+    # Iterations at which a (complete) checkpoint is available, sorted in increasing order
+    def _checkpoint_iterations(self):
+        if os.path.exists(str(self.folder["checkpoints"])):
+            return sorted([int(name) for name in os.listdir(str(self.folder["checkpoints"])) if name.isdigit()])
+        else:
+            return list()
     
     # Compute the error of the reduced order approximation with respect to the full order one
     # over the testing set
@@ -122,3 +211,27 @@ class ReductionMethod(object, metaclass=ABCMeta):
     # Finalize data structures required after the speedup analysis phase
     def _finalize_speedup_analysis(self, **kwargs):
         pass
+
+# Copy the folder source to destination. Files which are unchanged (i.e., same size and modification time) with
+# respect to the corresponding file in the folder previous are hardlinked to the latter, instead of being copied.
+# Files are never hardlinked to source, since files in source may be overwritten in place during the offline phase,
+# while files in previous (i.e., in a checkpoint) are never modified.
+def _copy_folder_incrementally(source, destination, previous):
+    def copy_or_link(source_file, destination_file):
+        if previous is not None:
+            previous_file = os.path.join(previous, os.path.relpath(source_file, source))
+            if os.path.isfile(previous_file):
+                source_stat = os.stat(source_file)
+                previous_stat = os.stat(previous_file)
+                if (
+                    source_stat.st_size == previous_stat.st_size
+                        and source_stat.st_mtime_ns == previous_stat.st_mtime_ns
+                ):
+                    try:
+                        os.link(previous_file, destination_file)
+                    except OSError: # e.g. file system without hardlinks
+                        pass
+                    else:
+                        return destination_file
+        return shutil.copy2(source_file, destination_file)
+    shutil.copytree(source, destination, copy_function=copy_or_link)
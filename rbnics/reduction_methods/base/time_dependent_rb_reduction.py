@@ -148,6 +148,14 @@ def TimeDependentRBReduction(DifferentialProblemReductionMethod_DerivedClass):
             # Return
             return output
             
+        # Save a checkpoint at the end of an offline iteration: the POD-Greedy extension by POD requires the
+        # eigenvalue problem of all previous iterations, which is not stored in checkpoints. In such case, an
+        # interrupted offline phase is restarted from scratch
+        def _save_checkpoint(self, state):
+            if self.POD_greedy_basis_extension == "POD" and state["iteration"] > 0:
+                return
+            DifferentialProblemReductionMethod_DerivedClass._save_checkpoint(self, state)
+            
         # Update basis matrix by POD-Greedy
         def update_basis_matrix(self, snapshot_over_time):
             snapshot_over_time = snapshot_over_time[self.reduction_first_index:self.reduction_last_index:self.reduction_delta_index]
@@ -279,7 +287,7 @@ def TimeDependentRBReduction(DifferentialProblemReductionMethod_DerivedClass):
                 return error_estimator
                 
             print("find next mu")
-            return self.training_set.max(solve_and_estimate_error)
+            return self._greedy_max(solve_and_estimate_error)
             
         # Compute the error of the reduced order approximation with respect to the full order one
         # over the testing set
@@ -46,6 +46,9 @@ class StokesPODGalerkinReduction(StokesPODGalerkinReduction_Base):
             inner_product = self.truth_problem.inner_product[component][0]
             self.POD[component] = ProperOrthogonalDecomposition(self.truth_problem.V, inner_product, component="s")
             
+        # Supremizers do not affect the selection of snapshots: compute all of them at once before POD
+        self._batched_supremizers = list()
+            
         # Return
         return output
         
@@ -57,8 +60,17 @@ class StokesPODGalerkinReduction(StokesPODGalerkinReduction_Base):
         supremizer = snapshot_and_supremizer[1]
         for component in ("u", "p"):
             self.POD[component].store_snapshot(snapshot, component=component)
-        for component in ("s", ):
-            self.POD[component].store_snapshot(supremizer)
+        if supremizer is not None: # otherwise, it will be stored after batched supremizer computation
+            for component in ("s", ):
+                self.POD[component].store_snapshot(supremizer)
+                
+    # Compute basis functions performing POD: overridden version to first compute batched supremizers
+    def compute_basis_functions(self):
+        if self._batched_supremizers is not None:
+            for supremizer in self._solve_batched_supremizers():
+                for component in ("s", ):
+                    self.POD[component].store_snapshot(supremizer)
+        StokesPODGalerkinReduction_Base.compute_basis_functions(self)
             
     # Compute the error of the reduced order approximation with respect to the full order one
     # over the testing set.
@@ -17,6 +17,7 @@
 #
 
 import os
+from rbnics.backends import copy
 from rbnics.reduction_methods.base import LinearReductionMethod
 
 # Base class containing the interface of a projection based ROM
@@ -33,18 +34,41 @@ def StokesReductionMethod(DifferentialProblemReductionMethod_DerivedClass):
             StokesReductionMethod_Base.__init__(self, truth_problem, **kwargs)
             # I/O
             self.folder["supremizer_snapshots"] = os.path.join(self.folder_prefix, "snapshots")
+            # List of (mu, snapshot, snapshot index) for which supremizer computation has been postponed,
+            # or None if supremizers are computed as soon as each snapshot is available
+            self._batched_supremizers = None
             
         # Postprocess a snapshot before adding it to the basis/snapshot matrix: also solve the supremizer problem
         def postprocess_snapshot(self, snapshot, snapshot_index):
-            # Compute supremizer
-            self._print_supremizer_solve_message()
-            supremizer = self.truth_problem.solve_supremizer(snapshot)
-            self.truth_problem.export_supremizer(self.folder["supremizer_snapshots"], "truth_" + str(snapshot_index))
+            if self._batched_supremizers is not None:
+                # Postpone supremizer computation, which will be carried out by _solve_batched_supremizers
+                self._batched_supremizers.append((self.truth_problem.mu, copy(snapshot), snapshot_index))
+                supremizer = None
+            else:
+                # Compute supremizer
+                self._print_supremizer_solve_message()
+                supremizer = self.truth_problem.solve_supremizer(snapshot)
+                self.truth_problem.export_supremizer(self.folder["supremizer_snapshots"], "truth_" + str(snapshot_index))
             # Call parent
             snapshot = StokesReductionMethod_Base.postprocess_snapshot(self, snapshot, snapshot_index)
             # Return a tuple
             return (snapshot, supremizer)
             
+        # Compute all supremizers postponed by postprocess_snapshot, and export them
+        def _solve_batched_supremizers(self):
+            if len(self._batched_supremizers) == 0:
+                return list()
+            (mus, snapshots, snapshot_indices) = zip(*self._batched_supremizers)
+            print("supremizer solve for", len(mus), "parameters")
+            supremizers = self.truth_problem.solve_supremizers(mus, snapshots)
+            mu_bak = self.truth_problem.mu
+            for (mu, supremizer, snapshot_index) in zip(mus, supremizers, snapshot_indices):
+                self.truth_problem.set_mu(mu)
+                self.truth_problem.export_supremizer(self.folder["supremizer_snapshots"], "truth_" + str(snapshot_index), supremizer)
+            self.truth_problem.set_mu(mu_bak)
+            self._batched_supremizers = list()
+            return supremizers
+            
         def _print_supremizer_solve_message(self):
             print("supremizer solve for mu =", self.truth_problem.mu)
     
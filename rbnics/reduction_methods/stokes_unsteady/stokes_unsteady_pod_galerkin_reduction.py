@@ -32,6 +32,9 @@ def AbstractCFDUnsteadyPODGalerkinReduction(AbstractCFDPODGalerkinReduction, Abs
             # Call parent to initialize
             output = AbstractCFDUnsteadyPODGalerkinReduction_Base._init_offline(self)
             
+            # Supremizers are required at each time step by nested POD: do not batch their computation
+            self._batched_supremizers = None
+            
             if self.nested_POD:
                 # Declare new POD object(s)
                 self.POD_time_trajectory = dict()
@@ -16,8 +16,12 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
+from rbnics.sampling.adaptive_parameter_space_subset import AdaptiveParameterSpaceSubset
+from rbnics.sampling.parameter_space_partition import ParameterSpacePartition
 from rbnics.sampling.parameter_space_subset import ParameterSpaceSubset
 
 __all__ = [
+    'AdaptiveParameterSpaceSubset',
+    'ParameterSpacePartition',
     'ParameterSpaceSubset'
 ]
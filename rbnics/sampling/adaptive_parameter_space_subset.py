@@ -0,0 +1,181 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from heapq import heappush, heappushpop
+from math import inf
+from rbnics.sampling.parameter_space_subset import ParameterSpaceSubset
+from rbnics.utils.mpi import parallel_max
+
+class AdaptiveParameterSpaceSubset(ParameterSpaceSubset):
+    """
+    Parameter space subset to be used as training set of greedy algorithms, which stores the values computed
+    by max() (or max_batch()) at each parameter, and employs them to
+    * skip the evaluation at parameters for which the value at the previous call to max(), multiplied by a
+      saturation constant, is already below the current maximum. Under the saturation assumption (i.e., the
+      value at each parameter does not increase by more than the saturation constant from one call to the next)
+      the skipped parameters cannot be the maximizer, so the selected parameter is the same as without skipping.
+      Similarly, max_batch() skips the evaluation at parameters which cannot be part of the selected batch;
+    * enrich the subset after each call to max() (or max_batch()), adding parameters sampled in a neighbourhood
+      of the ones with the largest values.
+      
+    :param box: the parameter range, used to sample new parameters.
+    :param sampling: the distribution used to sample new parameters (uniform by default).
+    :param saturation_constant: the saturation constant (None to disable skipping).
+    :param enrichment_size: number of parameters added after each call to max() or max_batch() (0 to disable enrichment).
+    :param enrichment_radius: size of the neighbourhood in which new parameters are sampled, relative to the parameter range.
+    """
+    
+    def __init__(self, box, sampling=None, saturation_constant=None, enrichment_size=0, enrichment_radius=0.1):
+        ParameterSpaceSubset.__init__(self)
+        assert saturation_constant is None or saturation_constant >= 1.
+        self.box = box
+        self.sampling = sampling
+        self.saturation_constant = saturation_constant
+        self.enrichment_size = enrichment_size
+        self.enrichment_radius = enrichment_radius
+        self._previous_values = dict() # from parameter to (an upper bound of) the latest postprocessed value
+        
+    def generate(self, box, n, sampling=None):
+        ParameterSpaceSubset.generate(self, box, n, sampling)
+        self._previous_values.clear()
+        
+    def load(self, directory, filename):
+        self._previous_values.clear()
+        return ParameterSpaceSubset.load(self, directory, filename)
+        
+    def max(self, generator, postprocessor=None):
+        if postprocessor is None:
+            def postprocessor(value):
+                return value
+        if self.distributed_max:
+            local_list_indices = list(range(self.mpi_comm.rank, len(self._list), self.mpi_comm.size)) # start from index rank and take steps of length equal to size
+        else:
+            local_list_indices = list(range(len(self._list)))
+        # Evaluate first the parameters with the largest previous values (new parameters first of all), so that
+        # as soon as a parameter can be skipped all the remaining ones can be skipped as well
+        local_list_indices.sort(key=lambda i: - self._previous_values.get(self._list[i], inf))
+        local_i_max = None
+        local_value_max = None
+        local_value_max_with_postprocessing = - inf
+        for (n, i) in enumerate(local_list_indices):
+            mu = self._list[i]
+            if (
+                self.saturation_constant is not None
+                    and
+                mu in self._previous_values
+                    and
+                self.saturation_constant*self._previous_values[mu] < local_value_max_with_postprocessing
+            ):
+                # Update the upper bounds of all skipped parameters for the next call
+                for j in local_list_indices[n:]:
+                    self._previous_values[self._list[j]] *= self.saturation_constant
+                break
+            value = generator(mu)
+            value_with_postprocessing = postprocessor(value)
+            self._previous_values[mu] = value_with_postprocessing
+            if (
+                local_i_max is None
+                    or
+                value_with_postprocessing > local_value_max_with_postprocessing
+                    or
+                (value_with_postprocessing == local_value_max_with_postprocessing and i < local_i_max)
+            ):
+                local_i_max = i
+                local_value_max = value
+                local_value_max_with_postprocessing = value_with_postprocessing
+        if self.distributed_max:
+            (global_value_max, global_i_max) = parallel_max(self.mpi_comm, local_value_max, local_i_max, postprocessor)
+            assert isinstance(global_i_max, tuple)
+            assert len(global_i_max) == 1
+            global_i_max = global_i_max[0]
+        else:
+            global_i_max = local_i_max
+            global_value_max = local_value_max
+        if self.enrichment_size > 0:
+            self._enrich()
+        return (global_value_max, global_i_max)
+        
+    def max_batch(self, generator, batch_size, minimum_distance=0., postprocessor=None):
+        if postprocessor is None:
+            def postprocessor(value):
+                return value
+        if self.distributed_max:
+            local_list_indices = list(range(self.mpi_comm.rank, len(self._list), self.mpi_comm.size)) # start from index rank and take steps of length equal to size
+        else:
+            local_list_indices = list(range(len(self._list)))
+        local_list_indices.sort(key=lambda i: - self._previous_values.get(self._list[i], inf))
+        # A parameter can be skipped if its upper bound is smaller than the smallest value in the batch selected
+        # among the parameters evaluated so far, because any parameter with a smaller value would be considered
+        # only after the batch has been filled. When the evaluation is distributed, parameters evaluated on other
+        # processes may discard (if minimum_distance is positive) parameters of the local batch, so that skipping
+        # is only safe if minimum_distance is zero
+        skip = self.saturation_constant is not None and (not self.distributed_max or minimum_distance == 0.)
+        local_values = list()
+        local_largest_values = list() # min heap of the batch_size largest postprocessed values
+        for (n, i) in enumerate(local_list_indices):
+            mu = self._list[i]
+            if (
+                skip
+                    and
+                mu in self._previous_values
+                    and
+                len(local_largest_values) == batch_size
+                    and
+                self.saturation_constant*self._previous_values[mu] < local_largest_values[0] # necessary condition
+            ):
+                (batch_values, batch_indices) = self._select_batch(local_values, batch_size, minimum_distance)
+                if (
+                    len(batch_indices) == batch_size
+                        and
+                    self.saturation_constant*self._previous_values[mu] < postprocessor(batch_values[-1])
+                ):
+                    # Update the upper bounds of all skipped parameters for the next call
+                    for j in local_list_indices[n:]:
+                        self._previous_values[self._list[j]] *= self.saturation_constant
+                    break
+            value = generator(mu)
+            value_with_postprocessing = postprocessor(value)
+            self._previous_values[mu] = value_with_postprocessing
+            local_values.append((value_with_postprocessing, value, i))
+            if len(local_largest_values) < batch_size:
+                heappush(local_largest_values, value_with_postprocessing)
+            else:
+                heappushpop(local_largest_values, value_with_postprocessing)
+        if self.distributed_max:
+            global_values = [value for values in self.mpi_comm.allgather(local_values) for value in values]
+        else:
+            global_values = local_values
+        if self.enrichment_size > 0:
+            self._enrich()
+        return self._select_batch(global_values, batch_size, minimum_distance)
+        
+    def _enrich(self):
+        # Get the parameters with the largest values
+        largest = sorted(self._previous_values.items(), key=lambda mu_and_value: - mu_and_value[1])[:self.enrichment_size]
+        if self.distributed_max:
+            largest = [mu_and_value for local_largest in self.mpi_comm.allgather(largest) for mu_and_value in local_largest]
+            largest = sorted(largest, key=lambda mu_and_value: - mu_and_value[1])[:self.enrichment_size]
+        # Sample a new parameter in a neighbourhood of each of them
+        for (mu, _) in largest:
+            neighbourhood = list()
+            for (mu_p, box_p) in zip(mu, self.box):
+                radius_p = self.enrichment_radius*(box_p[1] - box_p[0])/2.
+                neighbourhood.append((max(box_p[0], mu_p - radius_p), min(box_p[1], mu_p + radius_p)))
+            new_mu = ParameterSpaceSubset()
+            new_mu.generate(neighbourhood, 1, self.sampling)
+            self._list.extend(new_mu._list)
@@ -0,0 +1,125 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from rbnics.sampling.parameter_space_subset import ParameterSpaceSubset
+from rbnics.utils.io.pickle_io import PickleIO
+
+class ParameterSpacePartition(object):
+    """
+    Partition of a parameter box into subdomains, obtained by recursive bisection. Subdomains are the nodes of
+    a binary tree, and are identified by a string which collects the sequence of "0" (lower half) and "1" (upper half)
+    choices from the root (the empty string) to the node. The subdomain a parameter belongs to is found by
+    descending the tree, i.e. with a number of comparisons equal to the depth of the tree.
+    
+    :param box: the parameter range.
+    """
+    
+    def __init__(self, box):
+        self.box = box
+        self._splits = dict() # from node to (parameter index, value at which the node was split)
+        
+    def split(self, node):
+        """
+        Split a leaf at the midpoint of its largest side (relative to the size of the overall box).
+        
+        :param node: the leaf to be split.
+        :return: the two new leaves.
+        """
+        assert node not in self._splits
+        subdomain = self.subdomain(node)
+        def relative_size(p):
+            if self.box[p][1] > self.box[p][0]:
+                return (subdomain[p][1] - subdomain[p][0])/(self.box[p][1] - self.box[p][0])
+            else:
+                return 0.
+        p = max(range(len(subdomain)), key=relative_size)
+        self._splits[node] = (p, (subdomain[p][0] + subdomain[p][1])/2.)
+        return (node + "0", node + "1")
+        
+    def merge(self, node):
+        """
+        Undo the split of a node whose children are both leaves.
+        
+        :param node: the node to be merged.
+        """
+        assert node in self._splits
+        assert node + "0" not in self._splits and node + "1" not in self._splits
+        del self._splits[node]
+        
+    def subdomain(self, node):
+        """
+        :param node: a node of the tree.
+        :return: the parameter range of the node.
+        """
+        subdomain = list(self.box)
+        for d in range(len(node)):
+            (p, value) = self._splits[node[:d]]
+            if node[d] == "0":
+                subdomain[p] = (subdomain[p][0], value)
+            else:
+                subdomain[p] = (value, subdomain[p][1])
+        return subdomain
+        
+    def find(self, mu):
+        """
+        :param mu: a parameter in the box.
+        :return: the leaf the parameter belongs to.
+        """
+        node = ""
+        while node in self._splits:
+            (p, value) = self._splits[node]
+            node += "0" if mu[p] < value else "1"
+        return node
+        
+    def leaves(self):
+        leaves = list()
+        nodes = [""]
+        while len(nodes) > 0:
+            node = nodes.pop()
+            if node in self._splits:
+                nodes.extend([node + "1", node + "0"])
+            else:
+                leaves.append(node)
+        return leaves
+        
+    def subset(self, parameter_space_subset, node):
+        """
+        :param parameter_space_subset: a subset of the box.
+        :param node: a node of the tree.
+        :return: the parameters in the subset which belong to the node.
+        """
+        output = ParameterSpaceSubset()
+        output.mpi_comm = parameter_space_subset.mpi_comm
+        output.distributed_max = parameter_space_subset.distributed_max
+        output._list = [mu for mu in parameter_space_subset if self.find(mu).startswith(node)]
+        return output
+        
+    def save(self, directory, filename):
+        PickleIO.save_file(self._splits, directory, filename)
+        
+    def load(self, directory, filename):
+        if self._splits: # avoid loading multiple times
+            return True
+        if PickleIO.exists_file(directory, filename):
+            self._splits = PickleIO.load_file(directory, filename)
+            return True
+        else:
+            return False
+            
+    def __len__(self):
+        return len(self.leaves())
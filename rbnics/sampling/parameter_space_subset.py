@@ -27,7 +27,7 @@ from rbnics.utils.mpi import is_io_process, parallel_max
 
 class ParameterSpaceSubset(ExportableList): # equivalent to a list of tuples
     def __init__(self):
-        ExportableList.__init__(self, "text")
+        ExportableList.__init__(self, "binary") # falls back to text files written by previous versions
         self.mpi_comm = is_io_process.mpi_comm # default communicator
         self.distributed_max = True
         
@@ -82,7 +82,42 @@ class ParameterSpaceSubset(ExportableList): # equivalent to a list of tuples
             global_i_max = argmax(values_with_postprocessing)
             global_value_max = values[global_i_max]
         return (global_value_max, global_i_max)
-    
+
+    # Largest values and their indices, sorted in decreasing order, discarding parameters which are closer than
+    # minimum_distance to a parameter with a larger value
+    def max_batch(self, generator, batch_size, minimum_distance=0., postprocessor=None):
+        if postprocessor is None:
+            def postprocessor(value):
+                return value
+        if self.distributed_max:
+            local_list_indices = list(range(self.mpi_comm.rank, len(self._list), self.mpi_comm.size)) # start from index rank and take steps of length equal to size
+        else:
+            local_list_indices = list(range(len(self._list)))
+        local_values = list()
+        for i in local_list_indices:
+            value = generator(self._list[i])
+            local_values.append((postprocessor(value), value, i))
+        if self.distributed_max:
+            global_values = [value for values in self.mpi_comm.allgather(local_values) for value in values]
+        else:
+            global_values = local_values
+        return self._select_batch(global_values, batch_size, minimum_distance)
+        
+    # Select (at most) batch_size values, given as a list of (postprocessed value, value, index) tuples, in
+    # decreasing order of postprocessed value, discarding parameters which are closer than minimum_distance
+    # to a parameter with a larger value
+    def _select_batch(self, values_and_indices, batch_size, minimum_distance):
+        values = list()
+        indices = list()
+        for (_, value, i) in sorted(values_and_indices, key=lambda value: (- value[0], value[2])):
+            mu = self._list[i]
+            if all([sqrt(sum([(x - y)**2 for (x, y) in zip(mu, self._list[j])])) >= minimum_distance for j in indices]):
+                values.append(value)
+                indices.append(i)
+                if len(indices) == batch_size:
+                    break
+        return (values, indices)
+
     def diff(self, other_set):
         output = ParameterSpaceSubset()
         output.mpi_comm = self.mpi_comm
@@ -23,6 +23,7 @@ from rbnics.problems.base import ParametrizedProblem
 from rbnics.backends import adjoint, AffineExpansionStorage, assign, copy, EigenSolver, export, Function, import_, product, sum
 from rbnics.utils.config import config
 from rbnics.utils.decorators import sync_setters
+from rbnics.utils.io import CacheIndex
 from rbnics.utils.mpi import log, PROGRESS
 
 class ParametrizedCoercivityConstantEigenProblem(ParametrizedProblem):
@@ -56,6 +57,7 @@ class ParametrizedCoercivityConstantEigenProblem(ParametrizedProblem):
         self._eigenvector_cache = dict()
         self.folder["cache"] = os.path.join(folder_prefix, "cache")
         self.cache_config = config.get("problems", "cache")
+        self.disk_cache_size = config.get("problems", "disk cache size")
     
     def init(self):
         # Store the symmetric part of the required term
@@ -85,7 +87,7 @@ class ParametrizedCoercivityConstantEigenProblem(ParametrizedProblem):
             log(PROGRESS, "Loading coercivity constant from cache")
             self._eigenvalue = self._eigenvalue_cache[cache_key]
             assign(self._eigenvector, self._eigenvector_cache[cache_key])
-        elif "Disk" in self.cache_config and self.import_solution(self.folder["cache"], cache_file):
+        elif "Disk" in self.cache_config and cache_file in CacheIndex(self.folder["cache"], self.disk_cache_size) and self.import_solution(self.folder["cache"], cache_file):
             log(PROGRESS, "Loading coercivity constant from file")
             if "RAM" in self.cache_config:
                 self._eigenvalue_cache[cache_key] = self._eigenvalue
@@ -97,6 +99,7 @@ class ParametrizedCoercivityConstantEigenProblem(ParametrizedProblem):
                 self._eigenvalue_cache[cache_key] = self._eigenvalue
                 self._eigenvector_cache[cache_key] = copy(self._eigenvector)
             self.export_solution(self.folder["cache"], cache_file) # Note that we export to file regardless of config options, because they may change across different runs
+            CacheIndex(self.folder["cache"], self.disk_cache_size).add(cache_file)
         return (self._eigenvalue, self._eigenvector)
         
     def _solve(self):
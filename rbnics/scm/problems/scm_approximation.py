@@ -23,8 +23,9 @@ from rbnics.backends.common.linear_program_solver import Error as LinearProgramS
 from rbnics.problems.base import ParametrizedProblem
 from rbnics.utils.config import config
 from rbnics.utils.decorators import sync_setters
-from rbnics.utils.io import GreedySelectedParametersList
+from rbnics.utils.io import CacheIndex, GreedySelectedParametersList
 from rbnics.utils.mpi import log, PROGRESS
+from rbnics.utils.profiler import profiler
 from rbnics.scm.utils.io import BoundingBoxSideList, UpperBoundsList
 from rbnics.scm.problems.parametrized_coercivity_constant_eigenproblem import ParametrizedCoercivityConstantEigenProblem
 
@@ -54,6 +55,7 @@ class SCMApproximation(ParametrizedProblem):
         # I/O
         self.folder["cache"] = os.path.join(self.folder_prefix, "reduced_cache")
         self.cache_config = config.get("SCM", "cache")
+        self.disk_cache_size = config.get("SCM", "disk cache size")
         self.folder["reduced_operators"] = os.path.join(self.folder_prefix, "reduced_operators")
         
         # Coercivity constant eigen problem
@@ -110,13 +112,16 @@ class SCMApproximation(ParametrizedProblem):
         (cache_key, cache_file) = self._cache_key_and_file(N)
         if "RAM" in self.cache_config and cache_key in self._alpha_LB_cache:
             log(PROGRESS, "Loading stability factor lower bound from cache")
+            profiler.increment("SCM lower bound cache hits")
             self._alpha_LB = self._alpha_LB_cache[cache_key]
-        elif "Disk" in self.cache_config and self.import_stability_factor_lower_bound(self.folder["cache"], cache_file):
+        elif "Disk" in self.cache_config and cache_file in CacheIndex(self.folder["cache"], self.disk_cache_size) and self.import_stability_factor_lower_bound(self.folder["cache"], cache_file):
             log(PROGRESS, "Loading stability factor lower bound from file")
+            profiler.increment("SCM lower bound cache hits")
             if "RAM" in self.cache_config:
                 self._alpha_LB_cache[cache_key] = self._alpha_LB
         else:
             log(PROGRESS, "Solving stability factor lower bound reduced problem")
+            profiler.increment("SCM lower bound cache misses")
             Q = self.truth_problem.Q["a"]
             M_e = min(self.M_e if self.M_e is not None else N, N, len(self.greedy_selected_parameters))
             M_p = min(self.M_p if self.M_p is not None else N, N, len(self.training_set) - len(self.greedy_selected_parameters))
@@ -203,6 +208,7 @@ class SCMApproximation(ParametrizedProblem):
             if "RAM" in self.cache_config:
                 self._alpha_LB_cache[cache_key] = alpha_LB
             self.export_stability_factor_lower_bound(self.folder["cache"], cache_file) # Note that we export to file regardless of config options, because they may change across different runs
+            CacheIndex(self.folder["cache"], self.disk_cache_size).add(cache_file)
         return self._alpha_LB
 
     # Get an upper bound for alpha
@@ -213,7 +219,7 @@ class SCMApproximation(ParametrizedProblem):
         if "RAM" in self.cache_config and cache_key in self._alpha_UB_cache:
             log(PROGRESS, "Loading stability factor upper bound from cache")
             self._alpha_UB = self._alpha_UB_cache[cache_key]
-        elif "Disk" in self.cache_config and self.import_stability_factor_upper_bound(self.folder["cache"], cache_file):
+        elif "Disk" in self.cache_config and cache_file in CacheIndex(self.folder["cache"], self.disk_cache_size) and self.import_stability_factor_upper_bound(self.folder["cache"], cache_file):
             log(PROGRESS, "Loading stability factor upper bound from file")
             if "RAM" in self.cache_config:
                 self._alpha_UB_cache[cache_key] = self._alpha_UB
@@ -241,6 +247,7 @@ class SCMApproximation(ParametrizedProblem):
             if "RAM" in self.cache_config:
                 self._alpha_UB_cache[cache_key] = alpha_UB
             self.export_stability_factor_upper_bound(self.folder["cache"], cache_file) # Note that we export to file regardless of config options, because they may change across different runs
+            CacheIndex(self.folder["cache"], self.disk_cache_size).add(cache_file)
         return self._alpha_UB
             
     def _cache_key_and_file(self, N):
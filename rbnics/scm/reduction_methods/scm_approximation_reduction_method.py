@@ -22,7 +22,8 @@ from rbnics.backends import transpose
 from rbnics.backends.online import OnlineVector
 from rbnics.reduction_methods.base import ReductionMethod
 from rbnics.scm.problems import ParametrizedCoercivityConstantEigenProblem
-from rbnics.utils.io import ErrorAnalysisTable, Folders, GreedyErrorEstimatorsList, SpeedupAnalysisTable, TextBox, TextLine, Timer
+from rbnics.utils.io import CacheIndex, ErrorAnalysisTable, Folders, GreedyErrorEstimatorsList, SpeedupAnalysisTable, TextBox, TextLine, Timer
+from rbnics.utils.profiler import memory_profiler, profiler
 
 # Empirical interpolation method for the interpolation of parametrized functions
 class SCMApproximationReductionMethod(ReductionMethod):
@@ -72,24 +73,43 @@ class SCMApproximationReductionMethod(ReductionMethod):
         all_folders.pop("testing_set") # this is required only in the error/speedup analysis
         all_folders.pop("error_analysis") # this is required only in the error analysis
         all_folders.pop("speedup_analysis") # this is required only in the speedup analysis
+        all_folders.pop("checkpoints") # this is required only to resume an interrupted offline construction
         at_least_one_folder_created = all_folders.create()
-        if not at_least_one_folder_created:
+        self._checkpoint_state = self._init_checkpoints(all_folders)
+        if not at_least_one_folder_created and self._checkpoint_state is None:
             return False # offline construction should be skipped, since data are already available
-        else:
+        elif self._checkpoint_state is None or self._checkpoint_state["iteration"] == 0:
+            self._checkpoint_state = {"iteration": 0}
+            self._save_checkpoint(self._checkpoint_state)
             self.SCM_approximation.init("offline")
             return True # offline construction should be carried out
+        else:
+            self.SCM_approximation.init("online")
+            self.SCM_approximation.truth_problem.init()
+            self.SCM_approximation.exact_coercivity_constant_calculator.init()
+            return True # offline construction should be resumed from the latest checkpoint
             
+    @profiler.span("SCM offline")
     def _offline(self):
         print(TextBox("SCM offline phase begins", fill="="))
         print("")
         
-        # Compute the bounding box \mathcal{B}
-        self.compute_bounding_box()
-        print("")
-        
-        # Arbitrarily start from the first parameter in the training set
-        self.SCM_approximation.set_mu(self.training_set[0])
-        relative_error_estimator_max = 2.*self.tol
+        if self._checkpoint_state["iteration"] == 0:
+            # Compute the bounding box \mathcal{B}
+            self.compute_bounding_box()
+            print("")
+            
+            # Arbitrarily start from the first parameter in the training set
+            self.SCM_approximation.set_mu(self.training_set[0])
+            relative_error_estimator_max = 2.*self.tol
+        else:
+            # Bounding box and greedy selected parameters have been restored from the checkpoint
+            self.greedy_error_estimators.load(self.folder["post_processing"], "error_estimator_max")
+            assert len(self.greedy_error_estimators) == self._checkpoint_state["iteration"]
+            self.SCM_approximation.set_mu(self._checkpoint_state["mu"])
+            relative_error_estimator_max = self._checkpoint_state["relative_error_estimator_max"]
+            print("resume from the checkpoint at N = " + str(self.SCM_approximation.N))
+            print("")
         
         while self.SCM_approximation.N < self.Nmax and relative_error_estimator_max >= self.tol:
             print(TextLine("SCM N = " + str(self.SCM_approximation.N), fill="~"))
@@ -112,6 +132,8 @@ class SCMApproximationReductionMethod(ReductionMethod):
             print("maximum SCM error estimator =", error_estimator_max)
             print("maximum SCM relative error estimator =", relative_error_estimator_max)
             
+            self._save_checkpoint({"iteration": len(self.greedy_error_estimators), "mu": self.SCM_approximation.mu, "relative_error_estimator_max": relative_error_estimator_max})
+            
             print("")
             
         print(TextBox("SCM offline phase ends", fill="="))
@@ -119,7 +141,10 @@ class SCMApproximationReductionMethod(ReductionMethod):
         
     # Finalize data structures required after the offline phase
     def _finalize_offline(self):
+        self._remove_checkpoints()
         self.SCM_approximation.init("online")
+        CacheIndex.flush_all()
+        memory_profiler.record(self.folder_prefix + " offline")
         
     # Compute the bounding box \mathcal{B}
     def compute_bounding_box(self):
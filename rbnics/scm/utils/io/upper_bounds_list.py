@@ -19,7 +19,7 @@
 import os
 from rbnics.backends.online import online_copy, online_export, online_import_, OnlineVector
 from rbnics.utils.decorators import list_of, overload
-from rbnics.utils.io import Folders, TextIO as ItemVectorDimensionIO, TextIO as LenIO
+from rbnics.utils.io import BinaryIO as ItemVectorDimensionIO, BinaryIO as LenIO, Folders
 
 class UpperBoundsList(list):
     def __init__(self):
@@ -28,20 +28,34 @@ class Config(object):
     # Set class defaults
     defaults = {
         "backends": {
+            "linear solver factorization cache size": 0,
             "online backend": "numpy",
+            "online storage format": "files",
             "required backends": None
         },
         "EIM": {
-            "cache": {"Disk", "RAM"}
+            "cache": {"Disk", "RAM"},
+            "disk cache size": 0
         },
         "problems": {
-            "cache": {"Disk", "RAM"}
+            "cache": {"Disk", "RAM"},
+            "disk cache size": 0
         },
         "reduced problems": {
             "cache": {"RAM"}
         },
+        "reduction methods": {
+            "analysis processes": 1,
+            "checkpoint interval": 0,
+            "export queue size": 0,
+            "export staging folder": "",
+            "memory budget": 0,
+            "memory check interval": 10,
+            "offline processes": 1
+        },
         "SCM": {
-            "cache": {"Disk", "RAM"}
+            "cache": {"Disk", "RAM"},
+            "disk cache size": 0
         },
     }
     
@@ -112,6 +126,11 @@ class Config(object):
         assert isinstance(self.defaults[section][option], bool)
         return str(value)
         
+    @overload(str, str, int)
+    def _value_to_parser(self, section, option, value):
+        assert isinstance(self.defaults[section][option], int)
+        return str(value)
+        
     @overload(str, str, set_of(str))
     def _value_to_parser(self, section, option, value):
         default = self.defaults[section][option]
@@ -135,6 +154,8 @@ class Config(object):
             elif value.lower() in ("no", "false", "off"):
                 assert isinstance(self.defaults[section][option], bool)
                 return False
+            elif isinstance(self.defaults[section][option], int) and not isinstance(self.defaults[section][option], bool):
+                return int(value)
             else:
                 assert isinstance(self.defaults[section][option], str)
                 return value
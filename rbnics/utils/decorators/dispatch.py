@@ -23,6 +23,7 @@ from numpy import ndarray as array
 import multipledispatch.conflict
 from multipledispatch.core import dispatch as original_dispatch, ismethod
 from multipledispatch.dispatcher import Dispatcher as OriginalDispatcher
+from rbnics.utils.profiler import profiler
 
 # == Signature to string == #
 def str_signature(sig):
@@ -146,6 +147,8 @@ class Dispatcher(OriginalDispatcher):
         return OriginalDispatcher.reorder(self, on_ambiguity)
     
     def __call__(self, *args, **kwargs):
+        if profiler.enabled:
+            profiler.increment("dispatch calls")
         func = self._get_func(*args)
         return func(*args, **kwargs)
         
@@ -298,6 +301,8 @@ class MethodDispatcher(Dispatcher):
         else: # called as Class.method(instance, ...)
             obj = args[0]
             args = args[1:]
+        if profiler.enabled:
+            profiler.increment("dispatch calls")
         func = self._get_func(*args)
         return func(obj, *args, **kwargs)
         
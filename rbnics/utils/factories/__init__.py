@@ -17,9 +17,10 @@
 #
 
 from rbnics.utils.factories.reduced_problem_factory import ReducedProblemFactory
-from rbnics.utils.factories.reduction_method_factory import ReducedBasis, PODGalerkin, ReductionMethodFactory
+from rbnics.utils.factories.reduction_method_factory import HPReducedBasis, ReducedBasis, PODGalerkin, ReductionMethodFactory
 
 __all__ = [
+    'HPReducedBasis',
     'PODGalerkin',
     'ReducedBasis',
     'ReducedProblemFactory',
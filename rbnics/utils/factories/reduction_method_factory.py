@@ -24,6 +24,14 @@ from rbnics.utils.mpi import log, DEBUG
 # Factory to generate a reduction method corresponding to a category (e.g. RB or POD) and a given truth problem
 def ReductionMethodFactory(truth_problem, category, **kwargs):
     
+    # Generate the reduction method type ...
+    ComposedType = _ReductionMethodType(truth_problem, category, **kwargs)
+    
+    # ... and return an instance of the generated class
+    return ComposedType(truth_problem, **kwargs)
+    
+def _ReductionMethodType(truth_problem, category, **kwargs):
+    
     log(DEBUG,
         "In ReductionMethodFactory with\n" +
         "\ttruth problem = " + str(type(truth_problem)) + "\n" +
@@ -68,11 +76,15 @@ def ReductionMethodFactory(truth_problem, category, **kwargs):
     for t in range(1, len(TypesList)):
         ComposedType = TypesList[t](ComposedType)
         
-    # Finally, return an instance of the generated class
-    return ComposedType(truth_problem, **kwargs)
+    # Finally, return the generated class
+    return ComposedType
     
 def ReducedBasis(truth_problem, **kwargs):
     return ReductionMethodFactory(truth_problem, "ReducedBasis", **kwargs)
 
 def PODGalerkin(truth_problem, **kwargs):
     return ReductionMethodFactory(truth_problem, "PODGalerkin", **kwargs)
+
+def HPReducedBasis(truth_problem, **kwargs):
+    from rbnics.reduction_methods.base import HPRBReduction
+    return HPRBReduction(_ReductionMethodType(truth_problem, "ReducedBasis", **kwargs))(truth_problem, **kwargs)
@@ -16,9 +16,12 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
+from rbnics.utils.io.binary_io import BinaryIO
+from rbnics.utils.io.cache_index import CacheIndex
 from rbnics.utils.io.component_name_to_basis_component_index_dict import ComponentNameToBasisComponentIndexDict
 from rbnics.utils.io.csv_io import CSVIO
 from rbnics.utils.io.error_analysis_table import ErrorAnalysisTable
+from rbnics.utils.io.export_queue import ExportQueue
 from rbnics.utils.io.exportable_list import ExportableList
 from rbnics.utils.io.folders import Folders
 from rbnics.utils.io.greedy_error_estimators_list import GreedyErrorEstimatorsList
@@ -34,9 +37,12 @@ from rbnics.utils.io.text_line import TextLine
 from rbnics.utils.io.timer import Timer
 
 __all__ = [
+    'BinaryIO',
+    'CacheIndex',
     'ComponentNameToBasisComponentIndexDict',
     'CSVIO',
     'ErrorAnalysisTable',
+    'ExportQueue',
     'ExportableList',
     'Folders',
     'GreedyErrorEstimatorsList',
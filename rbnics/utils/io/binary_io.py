@@ -0,0 +1,226 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+import os
+import struct
+import zlib
+from collections import OrderedDict
+from numbers import Integral, Number
+import numpy
+from rbnics.utils.io.text_io import TextIO
+from rbnics.utils.mpi import is_io_process
+
+# Binary counterpart of TextIO, which does not require to parse python source to load variables.
+# Each file starts with a header storing a magic string, the format version, a CRC32 checksum and
+# the length of the payload, which contains a tagged serialization of the variable.
+# Files previously written by TextIO are still loaded, if a binary file is not available.
+class BinaryIO(object):
+    # Save a variable to file
+    @staticmethod
+    def save_file(content, directory, filename):
+        if os.path.splitext(filename)[1] == "":
+            filename = filename + ".bin"
+        if is_io_process():
+            payload = bytearray()
+            _encode(content, payload)
+            with open(os.path.join(str(directory), filename), "wb") as outfile:
+                outfile.write(_header.pack(_magic, _version, zlib.crc32(payload), len(payload)))
+                outfile.write(payload)
+        is_io_process.mpi_comm.barrier()
+        
+    # Load a variable from file
+    @staticmethod
+    def load_file(directory, filename, globals=None):
+        if os.path.splitext(filename)[1] == "":
+            binary_filename = filename + ".bin"
+        else:
+            binary_filename = filename
+        if not os.path.exists(os.path.join(str(directory), binary_filename)): # legacy text file
+            return TextIO.load_file(directory, filename, globals)
+        with open(os.path.join(str(directory), binary_filename), "rb") as infile:
+            (magic, version, checksum, length) = _header.unpack(infile.read(_header.size))
+            if magic != _magic:
+                raise ValueError("Invalid binary file " + binary_filename)
+            if version > _version:
+                raise ValueError("Unsupported binary file version " + str(version) + " for " + binary_filename)
+            payload = infile.read()
+        if len(payload) != length or zlib.crc32(payload) != checksum:
+            raise ValueError("Corrupted binary file " + binary_filename)
+        (content, _) = _decode(memoryview(payload), 0, globals)
+        return content
+        
+    # Check if the file exists
+    @staticmethod
+    def exists_file(directory, filename):
+        if os.path.splitext(filename)[1] == "":
+            filenames = (filename + ".bin", filename + ".txt")
+        else:
+            filenames = (filename, )
+        exists = None
+        if is_io_process():
+            exists = any(os.path.exists(os.path.join(str(directory), f)) for f in filenames)
+        exists = is_io_process.mpi_comm.bcast(exists, root=is_io_process.root)
+        return exists
+        
+_magic = b"RBniCS"
+_version = 1
+_header = struct.Struct("<6sBIQ")
+_length = struct.Struct("<Q")
+_int = struct.Struct("<q")
+_float = struct.Struct("<d")
+_complex = struct.Struct("<dd")
+
+# Dictionary subclasses which are stored along with their name, to be able to restore their type
+_dict_types = ("ComponentNameToBasisComponentIndexDict", "OnlineSizeDict", "OrderedDict")
+
+def _dict_type(type_name, globals):
+    if globals is not None and type_name in globals:
+        return globals[type_name]
+    elif type_name == "ComponentNameToBasisComponentIndexDict":
+        from rbnics.utils.io.component_name_to_basis_component_index_dict import ComponentNameToBasisComponentIndexDict # cannot import globally due to cyclic imports
+        return ComponentNameToBasisComponentIndexDict
+    elif type_name == "OnlineSizeDict":
+        from rbnics.utils.io.online_size_dict import OnlineSizeDict # cannot import globally due to cyclic imports
+        return OnlineSizeDict
+    elif type_name == "OrderedDict":
+        return OrderedDict
+    else:
+        raise TypeError("Invalid dictionary type " + type_name + " in BinaryIO")
+
+def _encode(content, payload):
+    if content is None:
+        payload += b"N"
+    elif isinstance(content, (bool, numpy.bool_)):
+        payload += b"T" if content else b"F"
+    elif isinstance(content, Integral):
+        content = int(content)
+        if -2**63 <= content < 2**63:
+            payload += b"i"
+            payload += _int.pack(content)
+        else:
+            _encode_bytes(b"I", str(content).encode("utf-8"), payload)
+    elif isinstance(content, numpy.ndarray):
+        payload += b"a"
+        _encode(content.dtype.str, payload)
+        _encode(tuple(content.shape), payload)
+        _encode_bytes(b"b", numpy.ascontiguousarray(content).tobytes(), payload)
+    elif isinstance(content, numpy.generic):
+        _encode(content.item(), payload)
+    elif isinstance(content, Number) and not isinstance(content, complex):
+        payload += b"f"
+        payload += _float.pack(float(content))
+    elif isinstance(content, complex):
+        payload += b"c"
+        payload += _complex.pack(content.real, content.imag)
+    elif isinstance(content, str):
+        _encode_bytes(b"s", content.encode("utf-8"), payload)
+    elif isinstance(content, bytes):
+        _encode_bytes(b"b", content, payload)
+    elif isinstance(content, (tuple, list, set, frozenset)):
+        if isinstance(content, tuple):
+            payload += b"t"
+        elif isinstance(content, list):
+            payload += b"l"
+        else:
+            payload += b"S"
+        payload += _length.pack(len(content))
+        for item in content:
+            _encode(item, payload)
+    elif isinstance(content, dict):
+        if type(content) is dict:
+            payload += b"d"
+        else:
+            type_name = type(content).__name__
+            if type_name not in _dict_types:
+                raise TypeError("Invalid dictionary type " + type_name + " in BinaryIO")
+            payload += b"D"
+            _encode(type_name, payload)
+        payload += _length.pack(len(content))
+        for (key, value) in content.items():
+            _encode(key, payload)
+            _encode(value, payload)
+    else:
+        raise TypeError("Invalid type " + type(content).__name__ + " in BinaryIO")
+        
+def _encode_bytes(tag, content, payload):
+    payload += tag
+    payload += _length.pack(len(content))
+    payload += content
+    
+def _decode(payload, offset, globals):
+    tag = bytes(payload[offset:offset + 1])
+    offset += 1
+    if tag == b"N":
+        return (None, offset)
+    elif tag == b"T":
+        return (True, offset)
+    elif tag == b"F":
+        return (False, offset)
+    elif tag == b"i":
+        return (_int.unpack_from(payload, offset)[0], offset + _int.size)
+    elif tag == b"I":
+        (content, offset) = _decode_bytes(payload, offset)
+        return (int(content.decode("utf-8")), offset)
+    elif tag == b"f":
+        return (_float.unpack_from(payload, offset)[0], offset + _float.size)
+    elif tag == b"c":
+        return (complex(*_complex.unpack_from(payload, offset)), offset + _complex.size)
+    elif tag == b"s":
+        (content, offset) = _decode_bytes(payload, offset)
+        return (content.decode("utf-8"), offset)
+    elif tag == b"b":
+        return _decode_bytes(payload, offset)
+    elif tag == b"a":
+        (dtype, offset) = _decode(payload, offset, globals)
+        (shape, offset) = _decode(payload, offset, globals)
+        offset += 1 # skip the tag of the bytes
+        (content, offset) = _decode_bytes(payload, offset)
+        return (numpy.frombuffer(content, dtype=dtype).reshape(shape).copy(), offset)
+    elif tag in (b"t", b"l", b"S"):
+        length = _length.unpack_from(payload, offset)[0]
+        offset += _length.size
+        items = list()
+        for _ in range(length):
+            (item, offset) = _decode(payload, offset, globals)
+            items.append(item)
+        if tag == b"t":
+            return (tuple(items), offset)
+        elif tag == b"l":
+            return (items, offset)
+        else:
+            return (set(items), offset)
+    elif tag in (b"d", b"D"):
+        if tag == b"d":
+            content = dict()
+        else:
+            (type_name, offset) = _decode(payload, offset, globals)
+            content = _dict_type(type_name, globals)()
+        length = _length.unpack_from(payload, offset)[0]
+        offset += _length.size
+        for _ in range(length):
+            (key, offset) = _decode(payload, offset, globals)
+            (value, offset) = _decode(payload, offset, globals)
+            content[key] = value
+        return (content, offset)
+    else:
+        raise ValueError("Invalid tag " + str(tag) + " in BinaryIO")
+        
+def _decode_bytes(payload, offset):
+    length = _length.unpack_from(payload, offset)[0]
+    offset += _length.size
+    return (bytes(payload[offset:offset + length]), offset + length)
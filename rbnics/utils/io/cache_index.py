@@ -0,0 +1,252 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+import glob
+import os
+import re
+import time
+from contextlib import contextmanager
+from rbnics.utils.io.binary_io import BinaryIO
+from rbnics.utils.mpi import is_io_process
+
+class CacheIndex(object):
+    """
+    Index of the entries stored in a disk cache folder. Cache entries are identified by the sha1 digest
+    which prefixes the name of all the files they consist of, and the index maps each of them to its last
+    access time and size (in bytes). The index is read only once (on first use), so that cache lookups
+    do not require to hit the file system, and is rebuilt by scanning the folder in case it was populated
+    by a version of the library which did not store any index. If a maximum size is provided, least recently
+    used entries are removed from disk as soon as the total size of the cache exceeds it. Sizes are only
+    computed if a maximum size is provided.
+
+    Added and removed entries are appended to a journal file, while the index file (which also stores access
+    times) is only rewritten when flushed, e.g. at the end of each stage.
+
+    Indices are shared among all objects which store their cache in the same folder.
+
+    :param folder: the cache folder.
+    :param max_size: maximum size of the cache (in megabytes). A value equal to zero means unlimited size.
+    """
+
+    _indices = dict() # from folder name to CacheIndex
+    _writes_disabled = False
+    _filename = "cache_index"
+    _journal_filename = "cache_index_journal.txt"
+    _entry_pattern = re.compile("^([0-9a-f]{40})")
+
+    def __new__(cls, folder, max_size=0):
+        index = cls._get(folder)
+        index._max_size = max_size*1024*1024
+        return index
+
+    def __init__(self, folder, max_size=0):
+        pass # already initialized by __new__
+
+    @classmethod
+    def _get(cls, folder):
+        folder_name = os.path.abspath(str(folder))
+        if folder_name not in cls._indices:
+            index = object.__new__(cls)
+            index._folder = folder_name
+            index._max_size = 0
+            index._entries = None # will be loaded on first use, since the folder may not have been created yet
+            cls._indices[folder_name] = index
+        return cls._indices[folder_name]
+
+    def __contains__(self, cache_file):
+        self._load()
+        if cache_file in self._entries:
+            (_, size) = self._entries[cache_file]
+            self._entries[cache_file] = (time.time(), size) # will be stored to file on flush
+            return True
+        else:
+            return False
+
+    def __len__(self):
+        self._load()
+        return len(self._entries)
+
+    def add(self, cache_file):
+        self._load()
+        size = None
+        if self._max_size > 0:
+            if is_io_process():
+                size = sum(self._entry_sizes(cache_file).values())
+            size = is_io_process.mpi_comm.bcast(size, root=is_io_process.root)
+        self._entries[cache_file] = (time.time(), size)
+        if not self._writes_disabled:
+            self._append_to_journal(cache_file)
+            self._evict(cache_file)
+
+    def flush(self):
+        """
+        Store the index (including access times) to file. This method is collective.
+        """
+        self._load()
+        self._save()
+
+    @classmethod
+    def flush_all(cls):
+        """
+        Store all indices which have been used on any process to file. This method is collective.
+        """
+        for folder_name in cls._folder_names_on_all_processes():
+            cls._get(folder_name).flush()
+
+    @classmethod
+    @contextmanager
+    def writes_disabled(cls):
+        """
+        Neither write index files nor evict entries within the context, e.g. while processes add entries to
+        the same folders independently of each other. Indices should be refreshed afterwards.
+        """
+        cls._writes_disabled = True
+        try:
+            yield
+        finally:
+            cls._writes_disabled = False
+
+    @classmethod
+    def refresh_all(cls):
+        """
+        Rescan the folders of all indices which have been used on any process, e.g. after entries have been
+        added by other processes. Access times of entries which were already known are preserved.
+        """
+        is_io_process.mpi_comm.barrier() # wait for other processes to complete writing their entries
+        for folder_name in cls._folder_names_on_all_processes():
+            cls._get(folder_name)._refresh()
+
+    @classmethod
+    def _folder_names_on_all_processes(cls):
+        folder_names = [folder_name for (folder_name, index) in cls._indices.items() if index._entries is not None]
+        return sorted(set([folder_name for folder_names_ in is_io_process.mpi_comm.allgather(folder_names) for folder_name in folder_names_]))
+
+    def _refresh(self):
+        self._load()
+        entries = None
+        if is_io_process():
+            entries = dict()
+            for (cache_file, size) in self._scan().items():
+                (access_time, _) = self._entries.get(cache_file, (0., size))
+                entries[cache_file] = (access_time, size)
+        self._entries = is_io_process.mpi_comm.bcast(entries, root=is_io_process.root)
+        self._evict(None)
+        self._save()
+
+    def _load(self):
+        if self._entries is not None:
+            return
+        entries = None
+        if is_io_process():
+            if os.path.exists(os.path.join(self._folder, self._filename + ".bin")):
+                entries = BinaryIO.load_file(self._folder, self._filename)
+                self._apply_journal(entries)
+            else:
+                entries = dict()
+                for (cache_file, size) in self._scan().items():
+                    entries[cache_file] = (0., size)
+                self._apply_journal(entries) # to restore access times
+        self._entries = is_io_process.mpi_comm.bcast(entries, root=is_io_process.root)
+
+    def _save(self):
+        # Write to a temporary file first, so that an interrupted run cannot leave a corrupted index behind.
+        # The journal is removed afterwards, since all its entries are now stored in the index
+        BinaryIO.save_file(self._entries, self._folder, self._filename + "_tmp")
+        if is_io_process():
+            os.replace(os.path.join(self._folder, self._filename + "_tmp.bin"), os.path.join(self._folder, self._filename + ".bin"))
+            if os.path.exists(os.path.join(self._folder, self._journal_filename)):
+                os.remove(os.path.join(self._folder, self._journal_filename))
+        is_io_process.mpi_comm.barrier()
+
+    def _append_to_journal(self, cache_file):
+        # Each line contains either the cache file, its access time and size (for added entries),
+        # or only the cache file (for removed entries)
+        if is_io_process():
+            with open(os.path.join(self._folder, self._journal_filename), "a") as journal:
+                if cache_file in self._entries:
+                    (access_time, size) = self._entries[cache_file]
+                    journal.write(cache_file + " " + repr(access_time) + " " + repr(size) + "\n")
+                else:
+                    journal.write(cache_file + "\n")
+
+    def _apply_journal(self, entries):
+        if not os.path.exists(os.path.join(self._folder, self._journal_filename)):
+            return
+        with open(os.path.join(self._folder, self._journal_filename), "r") as journal:
+            for line in journal:
+                fields = line.split()
+                if len(fields) == 3:
+                    entries[fields[0]] = (float(fields[1]), None if fields[2] == "None" else int(fields[2]))
+                elif len(fields) == 1:
+                    entries.pop(fields[0], None)
+                # otherwise, the line was truncated by an interrupted run
+
+    def _evict(self, keep):
+        if self._max_size == 0:
+            return
+        if any(size is None for (_, size) in self._entries.values()): # e.g. if the index was built without maximum size
+            sizes = None
+            if is_io_process():
+                sizes = self._scan()
+            sizes = is_io_process.mpi_comm.bcast(sizes, root=is_io_process.root)
+            for (cache_file, (access_time, size)) in self._entries.items():
+                if size is None:
+                    self._entries[cache_file] = (access_time, sizes.get(cache_file, 0))
+        total_size = sum(size for (_, size) in self._entries.values())
+        for cache_file in sorted(self._entries.keys(), key=lambda cache_file: self._entries[cache_file][0]):
+            if total_size <= self._max_size:
+                break
+            if cache_file == keep:
+                continue
+            if is_io_process():
+                for filename in self._entry_sizes(cache_file).keys():
+                    os.remove(os.path.join(self._folder, filename))
+            total_size -= self._entries[cache_file][1]
+            del self._entries[cache_file]
+            self._append_to_journal(cache_file)
+        is_io_process.mpi_comm.barrier()
+
+    def _entry_sizes(self, cache_file):
+        """
+        Return a dict from file name to file size of all files in the folder which belong to the given cache entry.
+        Only the files of the given entry are accessed.
+        """
+        sizes = dict()
+        for path in glob.glob(os.path.join(glob.escape(self._folder), cache_file + "*")):
+            if os.path.isfile(path):
+                sizes[os.path.basename(path)] = os.path.getsize(path)
+        return sizes
+
+    def _scan(self):
+        """
+        Return a dict from cache entry to overall size of all its files (or None, if no maximum size is
+        provided) for all entries in the folder.
+        """
+        sizes = dict()
+        if not os.path.exists(self._folder):
+            return sizes
+        for dir_entry in os.scandir(self._folder):
+            match = self._entry_pattern.match(dir_entry.name)
+            if match is None or not dir_entry.is_file():
+                continue
+            entry = match.group(1)
+            if self._max_size > 0:
+                sizes[entry] = sizes.get(entry, 0) + dir_entry.stat().st_size
+            else:
+                sizes[entry] = None
+        return sizes
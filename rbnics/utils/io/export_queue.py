@@ -0,0 +1,96 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+import os
+import shutil
+from queue import Queue
+from threading import Thread
+from rbnics.utils.io.folders import Folders
+from rbnics.utils.mpi import is_io_process
+
+class ExportQueue(object):
+    """
+    Asynchronous export of solutions. Each solution is first exported by the main thread to a new
+    subfolder of a staging folder (which should be located on a fast file system, shared among all
+    processes), and then moved to its destination folder by a background thread on the I/O process,
+    so that the transfer to the (possibly slow) destination file system overlaps with the following
+    truth solves. The background thread only moves files, while backend exports (which may be
+    collective, or temporarily move the mesh in case of shape parametrization) are still carried out
+    by the main thread. The queue is bounded: once the maximum number of pending transfers is reached,
+    the next export waits for the oldest transfer to complete. The queue must be flushed before
+    exported files are read back.
+    An empty staging folder corresponds to export solutions directly to their destination folder.
+    Solutions of time dependent problems are always exported directly, because the backend may keep
+    their files open to append further time steps.
+    
+    :param staging_folder: staging folder, or an empty string.
+    :param max_size: maximum number of pending transfers, 0 for no maximum.
+    """
+    
+    _counter = 0 # shared among all queues, which may use the same staging folder
+    
+    def __init__(self, staging_folder="", max_size=0):
+        assert max_size >= 0
+        self._staging_folder = staging_folder
+        self._max_size = max_size
+        self._queue = None
+        self._error = None
+        
+    def put(self, problem, directory, filename, *args):
+        if self._staging_folder == "" or hasattr(problem, "set_time"):
+            problem.export_solution(directory, filename, *args)
+        else:
+            staging_directory = os.path.join(str(self._staging_folder), str(ExportQueue._counter))
+            ExportQueue._counter += 1
+            if is_io_process() and os.path.exists(staging_directory): # left over by a previous run
+                shutil.rmtree(staging_directory)
+            Folders.Folder(staging_directory).create()
+            problem.export_solution(staging_directory, filename, *args)
+            is_io_process.mpi_comm.barrier() # all processes have completed the export to the staging directory
+            if is_io_process():
+                if self._queue is None:
+                    self._queue = Queue(self._max_size)
+                    thread = Thread(target=self._move, daemon=True)
+                    thread.start()
+                self._queue.put((staging_directory, str(directory)))
+                
+    def flush(self):
+        error = None
+        if is_io_process() and self._queue is not None:
+            self._queue.join()
+            error = self._error
+            self._error = None
+        error = is_io_process.mpi_comm.bcast(error, root=is_io_process.root)
+        if error is not None:
+            raise RuntimeError("Export of solutions to their destination folder failed: " + error)
+            
+    def _move(self):
+        while True:
+            (staging_directory, directory) = self._queue.get()
+            try:
+                for (root, _, files) in os.walk(staging_directory):
+                    destination = os.path.join(directory, os.path.relpath(root, staging_directory))
+                    os.makedirs(destination, exist_ok=True)
+                    for file_ in files:
+                        shutil.move(os.path.join(root, file_), os.path.join(destination, file_))
+                shutil.rmtree(staging_directory)
+            except Exception as e:
+                if self._error is None:
+                    self._error = str(e)
+            finally:
+                self._queue.task_done()
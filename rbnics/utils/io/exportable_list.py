@@ -16,6 +16,7 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
+from rbnics.utils.io.binary_io import BinaryIO
 from rbnics.utils.io.numpy_io import NumpyIO
 from rbnics.utils.io.pickle_io import PickleIO
 from rbnics.utils.io.text_io import TextIO
@@ -24,7 +25,9 @@ from rbnics.utils.decorators import list_of, overload
 class ExportableList(object):
     def __init__(self, import_export_backend, original_list=None):
         self._list = list()
-        if import_export_backend == "numpy":
+        if import_export_backend == "binary":
+            self._FileIO = BinaryIO
+        elif import_export_backend == "numpy":
             self._FileIO = NumpyIO
         elif import_export_backend == "pickle":
             self._FileIO = PickleIO
@@ -20,4 +20,4 @@ from rbnics.utils.io.exportable_list import ExportableList
 
 class GreedyErrorEstimatorsList(ExportableList):
     def __init__(self):
-        ExportableList.__init__(self, "text")
+        ExportableList.__init__(self, "binary") # falls back to text files written by previous versions
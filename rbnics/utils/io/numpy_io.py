@@ -32,10 +32,10 @@ class NumpyIO(object):
     
     # Load a variable from file
     @staticmethod
-    def load_file(directory, filename):
+    def load_file(directory, filename, mmap_mode=None):
         if not filename.endswith(".npy"):
             filename = filename + ".npy"
-        return numpy.load(os.path.join(str(directory), filename))
+        return numpy.load(os.path.join(str(directory), filename), mmap_mode=mmap_mode)
             
     # Check if the file exists
     @staticmethod
@@ -47,3 +47,14 @@ class NumpyIO(object):
             exists = os.path.exists(os.path.join(str(directory), filename))
         exists = is_io_process.mpi_comm.bcast(exists, root=is_io_process.root)
         return exists
+        
+    # Remove the file, if it exists
+    @staticmethod
+    def remove_file(directory, filename):
+        if not filename.endswith(".npy"):
+            filename = filename + ".npy"
+        if is_io_process():
+            full_filename = os.path.join(str(directory), filename)
+            if os.path.exists(full_filename):
+                os.remove(full_filename)
+        is_io_process.mpi_comm.barrier()
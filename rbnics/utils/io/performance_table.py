@@ -18,9 +18,11 @@
 
 import os
 import collections
-from numpy import exp, isnan, log, max, mean, min, nan, zeros as Content
+from numpy import exp, frombuffer, full, isnan, log, max, mean, min, minimum, nan, uint8, where, zeros as Content
 from rbnics.utils.io.csv_io import CSVIO
 from rbnics.utils.io.folders import Folders
+from rbnics.utils.io.numpy_io import NumpyIO
+from rbnics.utils.io.pickle_io import PickleIO
 
 class PerformanceTable(object):
     
@@ -32,7 +34,7 @@ class PerformanceTable(object):
         self._columns = dict() # string to Content matrix
         self._columns_operations = dict() # string to tuple
         self._columns_not_implemented = dict() # string to bool
-        self._rows_not_implemented = dict() # string to dict of bool
+        self._rows_not_implemented = dict() # string to bytearray of _NOT_SET, _IMPLEMENTED or _NOT_IMPLEMENTED
         self._groups = dict() # string to list
         self._group_names_sorted = list()
         self._len_testing_set = len(testing_set)
@@ -51,7 +53,7 @@ class PerformanceTable(object):
         assert column_name not in self._columns and column_name not in self._columns_operations
         self._columns[column_name] = Content((self._Nmax - self._Nmin + 1, self._len_testing_set))
         self._columns_not_implemented[column_name] = None # will be set to a bool
-        self._rows_not_implemented[column_name] = {n: None for n in range(self._Nmax - self._Nmin + 1)} # will be set to a bool
+        self._rows_not_implemented[column_name] = bytearray(self._Nmax - self._Nmin + 1) # initialized to _NOT_SET, and vectorized through numpy views
         if group_name not in self._groups:
             self._groups[group_name] = list()
             self._group_names_sorted.append(group_name) # preserve the ordering provided by the user
@@ -85,11 +87,11 @@ class PerformanceTable(object):
         N = args[1]
         mu_index = args[2]
         assert self._columns_not_implemented[column_name] in (True, False)
-        assert self._rows_not_implemented[column_name][N - self._Nmin] in (True, False)
+        assert self._rows_not_implemented[column_name][N - self._Nmin] != _NOT_SET
         if (
             not self._columns_not_implemented[column_name]
                 and
-            not self._rows_not_implemented[column_name][N - self._Nmin]
+            self._rows_not_implemented[column_name][N - self._Nmin] == _IMPLEMENTED
         ):
             return self._columns[column_name][N - self._Nmin, mu_index]
         else:
@@ -98,26 +100,52 @@ class PerformanceTable(object):
     def __setitem__(self, args, value):
         assert len(args) == 3
         column_name = args[0]
-        N = args[1]
+        n = args[1] - self._Nmin
         mu_index = args[2]
+        rows_not_implemented = self._rows_not_implemented[column_name]
+        assert self._columns_not_implemented[column_name] in (None, True, False)
         if is_not_implemented(value):
-            assert self._columns_not_implemented[column_name] in (None, True, False)
             if self._columns_not_implemented[column_name] is None:
                 self._columns_not_implemented[column_name] = True
-            assert self._rows_not_implemented[column_name][N - self._Nmin] in (None, True)
-            if self._rows_not_implemented[column_name][N - self._Nmin] is None:
-                self._rows_not_implemented[column_name][N - self._Nmin] = True
+            assert rows_not_implemented[n] != _IMPLEMENTED
+            rows_not_implemented[n] = _NOT_IMPLEMENTED
         else:
-            assert self._columns_not_implemented[column_name] in (None, True, False)
-            if self._columns_not_implemented[column_name] in (None, True):
+            if self._columns_not_implemented[column_name] is not False:
                 self._columns_not_implemented[column_name] = False
-            assert self._rows_not_implemented[column_name][N - self._Nmin] in (None, False)
-            if self._rows_not_implemented[column_name][N - self._Nmin] is None:
-                self._rows_not_implemented[column_name][N - self._Nmin] = False
+            assert rows_not_implemented[n] != _NOT_IMPLEMENTED
+            rows_not_implemented[n] = _IMPLEMENTED
             if column_name not in self._preprocessor_setitem:
-                self._columns[column_name][N - self._Nmin, mu_index] = value
+                self._columns[column_name][n, mu_index] = value
             else:
-                self._columns[column_name][N - self._Nmin, mu_index] = self._preprocessor_setitem[column_name](value)
+                self._columns[column_name][n, mu_index] = self._preprocessor_setitem[column_name](value)
+            
+    def merge(self, other, mu_indices):
+        """
+        Copy into this table the entries associated to the provided testing set indices, which have been
+        filled in on another table with the same columns (e.g., by a different process, or by a different
+        run and then loaded from file).
+        """
+        assert self._columns.keys() == other._columns.keys()
+        for column_name in self._columns:
+            self._columns[column_name][:, mu_indices] = other._columns[column_name][:, mu_indices]
+            self._columns_not_implemented[column_name] = _merge_not_implemented(self._columns_not_implemented[column_name], other._columns_not_implemented[column_name])
+            rows_not_implemented = frombuffer(self._rows_not_implemented[column_name], dtype=uint8)
+            other_rows_not_implemented = frombuffer(other._rows_not_implemented[column_name], dtype=uint8)
+            self._rows_not_implemented[column_name][:] = where(
+                rows_not_implemented == _NOT_SET, other_rows_not_implemented, where(
+                    other_rows_not_implemented == _NOT_SET, rows_not_implemented,
+                    minimum(rows_not_implemented, other_rows_not_implemented) # i.e. logical and
+                )
+            ).astype(uint8).tobytes()
+            
+    def merge_across_processes(self, mu_indices, mpi_comm):
+        """
+        Merge into this table the entries filled in by all processes of the provided communicator, where
+        mu_indices are the testing set indices of the entries filled in by the current process. This method
+        is collective.
+        """
+        for (other_mu_indices, other) in mpi_comm.allgather((mu_indices, self)):
+            self.merge(other, other_mu_indices)
             
     def _process(self):
         groups_content = collections.OrderedDict()
@@ -157,22 +185,26 @@ class PerformanceTable(object):
                         raise ValueError("Invalid operation in PerformanceTable")
                     table_index.append(current_table_index)
                     table_header[current_table_index] = current_table_header
-                    # Compute the required operation of each column over the second index (testing set)
-                    table_content[current_table_index] = Content((self._Nmax - self._Nmin + 1,))
-                    for n in range(self._Nmin, self._Nmax + 1):
-                        assert self._rows_not_implemented[column][n - self._Nmin] in (True, False)
-                        if self._rows_not_implemented[column][n - self._Nmin] is False:
-                            if operation == "min":
-                                current_table_content = min(self._columns[column][n - self._Nmin, :])
-                            elif operation == "mean":
-                                current_table_content = exp(mean(log(self._columns[column][n - self._Nmin, :])))
-                            elif operation == "max":
-                                current_table_content = max(self._columns[column][n - self._Nmin, :])
-                            else:
-                                raise ValueError("Invalid operation in PerformanceTable")
-                            table_content[current_table_index][n - self._Nmin] = current_table_content
+                    # Compute the required operation of each column over the second index (testing set),
+                    # for all reduced dimensions at once
+                    rows_not_implemented = frombuffer(self._rows_not_implemented[column], dtype=uint8)
+                    assert not (rows_not_implemented == _NOT_SET).any()
+                    implemented_rows = (rows_not_implemented == _IMPLEMENTED)
+                    table_content[current_table_index] = full((self._Nmax - self._Nmin + 1, ), nan)
+                    if implemented_rows.any():
+                        if implemented_rows.all():
+                            column_content = self._columns[column] # avoid a copy in the most common case
+                        else:
+                            column_content = self._columns[column][implemented_rows]
+                        if operation == "min":
+                            current_table_content = min(column_content, axis=1)
+                        elif operation == "mean":
+                            current_table_content = exp(mean(log(column_content), axis=1))
+                        elif operation == "max":
+                            current_table_content = max(column_content, axis=1)
                         else:
-                            table_content[current_table_index][n - self._Nmin] = nan
+                            raise ValueError("Invalid operation in PerformanceTable")
+                        table_content[current_table_index][implemented_rows] = current_table_content
                     # Get the width of the columns
                     column_size[current_table_index] = max([max([len(str(x)) for x in table_content[current_table_index]]), len(current_table_header)])
             # Save content
@@ -225,10 +257,49 @@ class PerformanceTable(object):
                     current_file.append([table_content[t][n - self._Nmin] for t in table_index])
             # Save
             CSVIO.save_file(current_file, full_directory, group)
+        # Also save the content of all columns in binary format, so that it can be loaded back
+        content = Content((len(self._columns), self._Nmax - self._Nmin + 1, self._len_testing_set))
+        rows_not_implemented = full((len(self._columns), self._Nmax - self._Nmin + 1), _NOT_SET, dtype=uint8)
+        for (c, column_name) in enumerate(self._columns):
+            content[c] = self._columns[column_name]
+            rows_not_implemented[c] = frombuffer(self._rows_not_implemented[column_name], dtype=uint8)
+        NumpyIO.save_file(content, full_directory, "content")
+        PickleIO.save_file({
+            "columns": list(self._columns.keys()),
+            "columns_not_implemented": [self._columns_not_implemented[column_name] for column_name in self._columns],
+            "rows_not_implemented": rows_not_implemented
+        }, full_directory, "content_info")
     
     def load(self, directory, filename):
-        raise RuntimeError("PerformanceTable.load has not been implemented yet")
+        """
+        Load the content of all columns saved by save(). Columns must have already been added, with the same
+        names, reduced dimensions and testing set length as in the saved table.
+        """
+        full_directory = os.path.join(str(directory), filename)
+        if not PickleIO.exists_file(full_directory, "content_info"):
+            return False
+        content_info = PickleIO.load_file(full_directory, "content_info")
+        assert content_info["columns"] == list(self._columns.keys())
+        content = NumpyIO.load_file(full_directory, "content")
+        assert content.shape == (len(self._columns), self._Nmax - self._Nmin + 1, self._len_testing_set)
+        for (c, column_name) in enumerate(self._columns):
+            self._columns[column_name][:] = content[c]
+            self._columns_not_implemented[column_name] = content_info["columns_not_implemented"][c]
+            self._rows_not_implemented[column_name][:] = content_info["rows_not_implemented"][c].tobytes()
+        return True
+        
+# Status of each row of a column
+_NOT_SET = 0
+_IMPLEMENTED = 1
+_NOT_IMPLEMENTED = 2
         
+def _merge_not_implemented(value, other_value):
+    if value is None:
+        return other_value
+    elif other_value is None:
+        return value
+    else:
+        return value and other_value
         
 class CustomNotImplementedType(object):
     def __init__(self):
@@ -16,6 +16,7 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
+from contextlib import contextmanager
 from mpi4py import MPI
 from mpi4py.MPI import MAX
 
@@ -33,6 +34,23 @@ def is_io_process(mpi_comm=None):
 is_io_process.root = 0
 is_io_process.mpi_comm = _default_io_mpi_comm
 
+@contextmanager
+def io_on_each_process():
+    """
+    Make every process an I/O process (i.e., replace the default I/O communicator with MPI.COMM_SELF)
+    within the context, so that processes which work independently, e.g. on different parameters of
+    a replicated problem, do not issue collective operations on the default communicator.
+    """
+    global _default_io_mpi_comm
+    default_io_mpi_comm = _default_io_mpi_comm
+    _default_io_mpi_comm = MPI.COMM_SELF
+    is_io_process.mpi_comm = MPI.COMM_SELF
+    try:
+        yield
+    finally:
+        _default_io_mpi_comm = default_io_mpi_comm
+        is_io_process.mpi_comm = default_io_mpi_comm
+
 # Get max in parallel
 def parallel_max(mpi_comm, local_value_max, local_args=None, postprocessor=None):
     if postprocessor is None:
@@ -0,0 +1,235 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+import json
+import os
+import weakref
+from collections import Counter
+from numbers import Number
+from numpy import ndarray
+from rbnics.utils.mpi import is_io_process
+
+class MemoryProfiler(object):
+    """
+    Accounting of the memory held by the largest data structures of offline runs (functions lists, snapshots
+    matrices, affine expansion storages and RAM caches), which are tracked by category through weak references.
+    Sizes are estimated from the underlying storage (local size of vectors, number of nonzeros of matrices, size
+    of dense arrays) only when a report or a check is requested.
+    
+    Memory usage is recorded at the end of each phase if the memory profiler is enabled. Furthermore, if a memory
+    budget (in megabytes per process, 0 for no budget) is set, RAM caches are spilled to disk as soon as the
+    tracked memory exceeds the budget, and callers are notified if the budget is still exceeded afterwards.
+    Since estimating the tracked memory requires to visit all tracked objects and to communicate among processes,
+    the budget is only checked once every check interval calls.
+    """
+    
+    def __init__(self):
+        self.enabled = False
+        self.budget = 0 # in bytes
+        self.check_interval = 1
+        self._check_calls = 0
+        self._tracked = dict() # from (object id, attribute) to (category, weak reference to the object, attribute, is cache)
+        self._peak = Counter() # from category to peak memory usage since the end of the last phase
+        self._phases = list() # of (phase, memory usage, peak memory usage)
+        
+    def enable(self):
+        self.enabled = True
+        
+    def disable(self):
+        self.enabled = False
+        
+    def clear(self):
+        self._peak.clear()
+        self._phases.clear()
+        
+    def set_budget(self, budget):
+        """
+        :param budget: the memory budget in megabytes, or 0 for no budget.
+        """
+        assert budget >= 0
+        self.budget = budget*1024**2
+        
+    def set_check_interval(self, check_interval):
+        """
+        :param check_interval: the number of calls to check() between two actual checks of the budget.
+        """
+        assert check_interval > 0
+        self.check_interval = check_interval
+        self._check_calls = 0
+        
+    def track(self, category, obj, attribute=None):
+        """
+        Track the memory held by an object (or by one of its attributes, if provided), as long as the
+        object is alive.
+        """
+        self._track(category, obj, attribute, False)
+        
+    def track_cache(self, category, obj, attribute):
+        """
+        Track the memory held by a RAM cache, i.e. a dict stored as attribute of an object that has a
+        cache_config set. The cache may be cleared and disabled when spilling to disk.
+        """
+        self._track(category, obj, attribute, True)
+        
+    def _track(self, category, obj, attribute, is_cache):
+        key = (id(obj), attribute)
+        tracked = self._tracked
+        def remove(_):
+            tracked.pop(key, None)
+        self._tracked[key] = (category, weakref.ref(obj, remove), attribute, is_cache)
+        
+    def usage(self):
+        """
+        :return: a Counter from category to the number of bytes held by tracked objects on the current process.
+        """
+        usage = Counter()
+        visited = set()
+        for (category, obj, attribute, _) in list(self._tracked.values()):
+            obj = obj()
+            if obj is not None:
+                if attribute is not None:
+                    obj = getattr(obj, attribute, None)
+                usage[category] += _nbytes(obj, visited)
+        for (category, bytes_) in usage.items():
+            self._peak[category] = max(self._peak[category], bytes_)
+        return usage
+        
+    def check(self):
+        """
+        Check if the tracked memory exceeds the budget on any process and, in that case, spill RAM caches to disk.
+        The check is actually carried out only once every check interval calls. This method is collective.
+        
+        :return: True if the budget is still exceeded after spilling RAM caches.
+        """
+        if self.budget == 0:
+            return False
+        self._check_calls += 1
+        if self._check_calls < self.check_interval:
+            return False
+        self._check_calls = 0
+        if not self._exceeds_budget():
+            return False
+        print("memory budget exceeded: spilling RAM caches to disk")
+        self.spill_caches()
+        return self._exceeds_budget()
+        
+    def _exceeds_budget(self):
+        total = sum(self.usage().values())
+        is_io_process() # make sure that is_io_process.mpi_comm is the default I/O communicator
+        return any([total_ > self.budget for total_ in is_io_process.mpi_comm.allgather(total)])
+        
+    def spill_caches(self):
+        """
+        Clear all tracked RAM caches and disable further storage in RAM. Objects which provide a disk cache
+        (i.e., truth problems and EIM/SCM approximations) switch to the disk cache, which contains every
+        entry that was stored in RAM because solutions are always exported to file.
+        """
+        for (_, obj, attribute, is_cache) in list(self._tracked.values()):
+            obj = obj()
+            if obj is not None and is_cache:
+                getattr(obj, attribute).clear()
+                cache_config = obj.cache_config - {"RAM"}
+                if hasattr(obj, "disk_cache_size"):
+                    cache_config = cache_config | {"Disk"}
+                obj.cache_config = cache_config
+                
+    def record(self, phase):
+        """
+        Record the current and peak memory usage at the end of a phase, if the memory profiler is enabled.
+        """
+        if self.enabled:
+            usage = self.usage()
+            self._phases.append((phase, usage, Counter(self._peak)))
+            self._peak = Counter(usage)
+            
+    def gather(self):
+        """
+        Gather phases of all processes on the I/O process.
+        
+        :return: the list of phases on each process (None on other processes).
+        """
+        is_io_process() # make sure that is_io_process.mpi_comm is the default I/O communicator
+        return is_io_process.mpi_comm.gather(self._phases, root=is_io_process.root)
+        
+    def summary(self):
+        """
+        :return: a text summary (only on the I/O process) reporting, for each phase and category, the memory
+            usage at the end of the phase and its peak during the phase, both in megabytes and summed over processes.
+        """
+        all_phases = self.gather()
+        if not is_io_process():
+            return None
+        lines = list()
+        lines.append("{:<60}{:>14}{:>14}".format("phase/category", "end [MB]", "peak [MB]"))
+        for (p, (phase, _, _)) in enumerate(all_phases[0]):
+            usage = sum([phases[p][1] for phases in all_phases], Counter())
+            peak = sum([phases[p][2] for phases in all_phases], Counter())
+            lines.append("{:<60}{:>14.6g}{:>14.6g}".format(phase, sum(usage.values())/1024**2, sum(peak.values())/1024**2))
+            for category in sorted(peak):
+                lines.append("{:<60}{:>14.6g}{:>14.6g}".format("    " + category, usage[category]/1024**2, peak[category]/1024**2))
+        return "\n".join(lines)
+        
+    def save(self, directory, filename):
+        """
+        Save the memory usage of each phase (in bytes, on each process) to filename.json, and the summary to filename.txt.
+        """
+        all_phases = self.gather()
+        summary = self.summary()
+        is_io_process() # make sure that is_io_process.mpi_comm is the default I/O communicator
+        mpi_comm = is_io_process.mpi_comm
+        if is_io_process():
+            content = [
+                {"phase": phase, "usage": [dict(phases[p][1]) for phases in all_phases], "peak": [dict(phases[p][2]) for phases in all_phases]}
+                for (p, (phase, _, _)) in enumerate(all_phases[0])
+            ]
+            with open(os.path.join(str(directory), filename + ".json"), "w") as outfile:
+                json.dump(content, outfile)
+            with open(os.path.join(str(directory), filename + ".txt"), "w") as outfile:
+                outfile.write(summary + "\n")
+        mpi_comm.barrier()
+
+# Estimate the number of bytes held by an object, without counting twice objects in visited
+def _nbytes(obj, visited):
+    if obj is None or isinstance(obj, (Number, str)) or id(obj) in visited:
+        return 0
+    visited.add(id(obj))
+    if isinstance(obj, ndarray):
+        if obj.dtype == object:
+            return sum([_nbytes(item, visited) for item in obj.flat])
+        else:
+            return obj.nbytes
+    elif isinstance(obj, dict):
+        return sum([_nbytes(value, visited) for value in obj.values()])
+    elif isinstance(obj, (list, tuple)):
+        return sum([_nbytes(item, visited) for item in obj])
+    elif hasattr(obj, "vector") and callable(obj.vector): # Function
+        return _nbytes(obj.vector(), visited)
+    elif hasattr(obj, "content"): # online vector or matrix
+        return _nbytes(obj.content, visited)
+    elif hasattr(obj, "local_size"): # distributed vector
+        return obj.local_size()*8
+    elif hasattr(obj, "nnz"): # distributed sparse matrix, storing values and column indices
+        return obj.nnz()*12
+    elif hasattr(obj, "_list"): # FunctionsList, SnapshotsMatrix, TimeSeries
+        return _nbytes(obj._list, visited)
+    elif hasattr(obj, "_content"): # AffineExpansionStorage
+        return _nbytes(obj._content, visited)
+    else:
+        return 0
+
+memory_profiler = MemoryProfiler()
@@ -0,0 +1,154 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+import json
+import os
+from collections import Counter
+from functools import wraps
+from timeit import default_timer as python_timer
+from rbnics.utils.mpi import is_io_process
+
+class Profiler(object):
+    """
+    Lightweight instrumentation of offline and online phases by means of named spans (i.e., timed regions of code)
+    and counters. Data are only recorded if the profiler is enabled, and are stored locally on each process: they
+    are gathered on the I/O process only when a summary is requested or saved (e.g., at the end of a phase), rather
+    than every time a span is closed.
+    """
+    
+    def __init__(self):
+        self.enabled = False
+        self._origin = python_timer()
+        self._events = list() # of (name, start, duration) of closed spans
+        self._open_spans = list() # of (name, start)
+        self._counters = Counter()
+        
+    def enable(self):
+        self.enabled = True
+        
+    def disable(self):
+        self.enabled = False
+        self._open_spans.clear()
+        
+    def clear(self):
+        self._origin = python_timer()
+        self._events.clear()
+        self._open_spans.clear()
+        self._counters.clear()
+        
+    def start(self, name):
+        if self.enabled:
+            self._open_spans.append((name, python_timer()))
+            
+    def stop(self, name):
+        # The span may be missing if the profiler has been enabled while the span was open
+        if self.enabled and len(self._open_spans) > 0 and self._open_spans[-1][0] == name:
+            end = python_timer()
+            (_, start) = self._open_spans.pop()
+            self._events.append((name, start - self._origin, end - start))
+            
+    def span(self, name):
+        """
+        Decorator to record each call of a function as a span. Recursive calls (e.g., through several
+        levels of overridden methods) are recorded only once.
+        
+        :param name: the name of the span.
+        """
+        def span_decorator(function):
+            @wraps(function)
+            def wrapped_function(*args, **kwargs):
+                if not self.enabled or (len(self._open_spans) > 0 and self._open_spans[-1][0] == name):
+                    return function(*args, **kwargs)
+                self.start(name)
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    self.stop(name)
+            return wrapped_function
+        return span_decorator
+        
+    def increment(self, name, count=1):
+        if self.enabled:
+            self._counters[name] += count
+            
+    def gather(self):
+        """
+        Gather spans and counters of all processes on the I/O process.
+        
+        :return: a tuple containing the list of events and the counters on each process (None on other processes).
+        """
+        is_io_process() # make sure that is_io_process.mpi_comm is the default I/O communicator
+        mpi_comm = is_io_process.mpi_comm
+        all_events = mpi_comm.gather(self._events, root=is_io_process.root)
+        all_counters = mpi_comm.gather(self._counters, root=is_io_process.root)
+        return (all_events, all_counters)
+        
+    def summary(self):
+        """
+        :return: a text summary (only on the I/O process) reporting, for each span, the number of calls and the
+            total time (minimum, mean and maximum over processes), followed by the counters summed over processes.
+        """
+        (all_events, all_counters) = self.gather()
+        if not is_io_process():
+            return None
+        calls = Counter()
+        times = dict() # from span name to list of total time on each process
+        for (rank, events) in enumerate(all_events):
+            for (name, _, duration) in events:
+                calls[name] += 1
+                if name not in times:
+                    times[name] = [0.]*len(all_events)
+                times[name][rank] += duration
+        lines = list()
+        lines.append("{:<40}{:>12}{:>14}{:>14}{:>14}".format("span", "calls", "min time", "mean time", "max time"))
+        for name in sorted(times, key=lambda name: - max(times[name])):
+            lines.append("{:<40}{:>12}{:>14.6g}{:>14.6g}{:>14.6g}".format(
+                name, calls[name], min(times[name]), sum(times[name])/len(times[name]), max(times[name])))
+        counters = sum(all_counters, Counter())
+        if len(counters) > 0:
+            lines.append("")
+            lines.append("{:<40}{:>12}".format("counter", "count"))
+            for (name, count) in sorted(counters.items()):
+                lines.append("{:<40}{:>12}".format(name, count))
+        return "\n".join(lines)
+        
+    def save(self, directory, filename):
+        """
+        Save the spans of all processes as a trace in Chrome trace event format (which can be displayed by
+        chrome://tracing or similar viewers) to filename.json, and the summary to filename.txt.
+        """
+        (all_events, all_counters) = self.gather()
+        summary = self.summary()
+        is_io_process() # make sure that is_io_process.mpi_comm is the default I/O communicator
+        mpi_comm = is_io_process.mpi_comm
+        if is_io_process():
+            trace_events = list()
+            for (rank, (events, counters)) in enumerate(zip(all_events, all_counters)):
+                end = 0.
+                for (name, start, duration) in events:
+                    trace_events.append({"name": name, "ph": "X", "ts": start*1e6, "dur": duration*1e6, "pid": rank, "tid": 0})
+                    end = max(end, start + duration)
+                if len(counters) > 0:
+                    trace_events.append({"name": "counters", "ph": "C", "ts": end*1e6, "pid": rank, "args": dict(counters)})
+            with open(os.path.join(str(directory), filename + ".json"), "w") as outfile:
+                json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, outfile)
+            with open(os.path.join(str(directory), filename + ".txt"), "w") as outfile:
+                outfile.write(summary + "\n")
+        mpi_comm.barrier()
+        
+profiler = Profiler()
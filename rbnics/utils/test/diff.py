@@ -20,16 +20,22 @@ import os
 from numbers import Number
 from numpy import isclose
 from rbnics.utils.decorators import dict_of, list_of, overload, tuple_of
-from rbnics.utils.io import CSVIO, TextIO
+from rbnics.utils.io import BinaryIO, CSVIO, TextIO
 
 def diff(reference_file, current_file):
     reference_ext = os.path.splitext(reference_file)[1]
     current_ext = os.path.splitext(current_file)[1]
     assert reference_ext == current_ext
+    if reference_ext in (".txt", ".bin") and not os.path.exists(current_file):
+        # Lists which were stored to text files by previous versions are now stored to binary files
+        current_file = os.path.splitext(current_file)[0] + (".bin" if reference_ext == ".txt" else ".txt")
+        return _diff_content(_load_txt_or_bin(reference_file), _load_txt_or_bin(current_file), "")
     if reference_ext == ".txt":
         return _diff_txt(reference_file, current_file)
     elif reference_ext == ".csv":
         return _diff_csv(reference_file, current_file)
+    elif reference_ext == ".bin":
+        return _diff_bin(reference_file, current_file)
     else:
         raise ValueError("Invalid argument to diff")
     
@@ -38,6 +44,17 @@ def _diff_txt(reference_file, current_file):
     current_content = TextIO.load_file("", current_file)
     return _diff_content(reference_content, current_content, "")
     
+def _diff_bin(reference_file, current_file):
+    reference_content = BinaryIO.load_file("", reference_file)
+    current_content = BinaryIO.load_file("", current_file)
+    return _diff_content(reference_content, current_content, "")
+    
+def _load_txt_or_bin(filename):
+    if os.path.splitext(filename)[1] == ".bin":
+        return BinaryIO.load_file("", filename)
+    else:
+        return TextIO.load_file("", filename)
+    
 def _diff_csv(reference_file, current_file):
     reference_lines = CSVIO.load_file("", reference_file)
     current_lines = CSVIO.load_file("", current_file)
@@ -0,0 +1,87 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""
+Compare the results of test_tutorials.py to a stored baseline, and flag regressions, i.e. offline times,
+online latencies or peak memory usages which increased by more than a given relative tolerance.
+
+Usage:
+    python3 compare_tutorials.py BASELINE_DIRECTORY CURRENT_DIRECTORY [--tolerance TOLERANCE]
+    
+where each directory contains the JSON files written by test_tutorials.py (by default in .benchmarks/tutorials).
+A baseline is stored by simply copying such directory. The exit code is 1 if any regression is found.
+"""
+
+import os
+import sys
+import json
+import argparse
+
+def compare(baseline, current, tolerance):
+    """
+    Compare the results of a tutorial to its baseline.
+    
+    :return: a list of (metric, baseline value, current value) for each metric which regressed.
+    """
+    metrics = [("total time", ), ("offline time", ), ("peak memory", )]
+    metrics.extend([("online latency", p) for p in sorted(baseline["online latency"])])
+    metrics.extend([("spans", name) for name in sorted(baseline["spans"])])
+    regressions = list()
+    for metric in metrics:
+        baseline_value = baseline
+        current_value = current
+        for key in metric:
+            baseline_value = baseline_value[key]
+            current_value = current_value.get(key, 0.)
+        if current_value > (1. + tolerance)*baseline_value:
+            regressions.append((" ".join(metric), baseline_value, current_value))
+    return regressions
+    
+def main(argv):
+    parser = argparse.ArgumentParser(description="Compare the results of test_tutorials.py to a stored baseline.")
+    parser.add_argument("baseline_directory")
+    parser.add_argument("current_directory")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="relative tolerance above which an increase is flagged as regression")
+    args = parser.parse_args(argv)
+    
+    regressions_found = False
+    for filename in sorted(os.listdir(args.baseline_directory)):
+        if not filename.endswith(".json"):
+            continue
+        tutorial = os.path.splitext(filename)[0]
+        if not os.path.exists(os.path.join(args.current_directory, filename)):
+            print(tutorial + ": missing from current results")
+            continue
+        with open(os.path.join(args.baseline_directory, filename), "r") as infile:
+            baseline = json.load(infile)
+        with open(os.path.join(args.current_directory, filename), "r") as infile:
+            current = json.load(infile)
+        regressions = compare(baseline, current, args.tolerance)
+        if len(regressions) > 0:
+            regressions_found = True
+            for (metric, baseline_value, current_value) in regressions:
+                message = tutorial + ": REGRESSION in " + metric + ": " + str(baseline_value) + " -> " + str(current_value)
+                if baseline_value > 0.:
+                    message += " (" + "{:+.1%}".format(current_value/baseline_value - 1.) + ")"
+                print(message)
+        else:
+            print(tutorial + ": OK")
+    return 1 if regressions_found else 0
+    
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -17,7 +17,7 @@
 #
 
 import dolfin # otherwise the next import from rbnics would disable dolfin as a required backend  # noqa
-from rbnics.utils.test import add_performance_options, patch_benchmark_plugin
+from rbnics.utils.test import add_performance_options, patch_benchmark_plugin, tempdir  # noqa
 
 def pytest_addoption(parser):
     add_performance_options(parser)
@@ -0,0 +1,127 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+import os
+import sys
+import json
+import shutil
+import importlib.util
+import multiprocessing
+import resource
+from timeit import default_timer as python_timer
+import pytest
+from numpy import percentile
+import dolfin # otherwise the next import from rbnics would disable dolfin as a required backend in spawned processes  # noqa
+from rbnics.utils.profiler import profiler
+from rbnics.utils.test import disable_matplotlib, enable_matplotlib
+
+tutorials_directory = os.path.join(os.path.dirname(os.path.realpath(__file__)), os.pardir, os.pardir, "tutorials")
+
+# Reduced size version of the tutorials: training set size, testing set size and reduced dimensions are capped
+# to the following values. Reduced dimensions and training set sizes of EIM/DEIM/SCM approximations are not capped,
+# since tutorials may require a given number of EIM/DEIM basis functions in the online stage (e.g. solve(EIM=11))
+ntrain_max = 10
+ntest_max = 5
+Nmax_max = 5
+
+# Spans of the profiler which belong to the offline stage
+offline_spans = ("EIM offline", "SCM offline", "offline")
+
+def _run_tutorial(tutorial, directory):
+    import rbnics.reduction_methods.base
+    ReductionMethod = rbnics.reduction_methods.base.ReductionMethod
+    DifferentialProblemReductionMethod = rbnics.reduction_methods.base.DifferentialProblemReductionMethod
+    
+    # Cap sizes. This is done in a separate process, so that patches do not affect other tests
+    original_set_Nmax = ReductionMethod.set_Nmax
+    def set_Nmax(self, Nmax, **kwargs):
+        if isinstance(self, DifferentialProblemReductionMethod):
+            Nmax = min(Nmax, Nmax_max)
+        original_set_Nmax(self, Nmax, **kwargs)
+    ReductionMethod.set_Nmax = set_Nmax
+    
+    original_initialize_training_set = ReductionMethod.initialize_training_set
+    def initialize_training_set(self, mu_range, ntrain, enable_import=True, sampling=None, **kwargs):
+        if isinstance(self, DifferentialProblemReductionMethod):
+            ntrain = min(ntrain, ntrain_max)
+        return original_initialize_training_set(self, mu_range, ntrain, enable_import, sampling, **kwargs)
+    ReductionMethod.initialize_training_set = initialize_training_set
+    
+    original_initialize_testing_set = ReductionMethod.initialize_testing_set
+    def initialize_testing_set(self, mu_range, ntest, enable_import=False, sampling=None, **kwargs):
+        return original_initialize_testing_set(self, mu_range, min(ntest, ntest_max), enable_import, sampling, **kwargs)
+    ReductionMethod.initialize_testing_set = initialize_testing_set
+    
+    # Run the tutorial in the provided directory
+    disable_matplotlib()
+    os.chdir(directory)
+    sys.path.append(directory)
+    profiler.clear()
+    profiler.enable()
+    start = python_timer()
+    spec = importlib.util.spec_from_file_location(os.path.splitext(os.path.basename(tutorial))[0], os.path.join(directory, os.path.basename(tutorial)))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    total_time = python_timer() - start
+    profiler.disable()
+    enable_matplotlib()
+    
+    # Collect results
+    spans = dict()
+    offline_end = 0.
+    for (name, start, duration) in profiler._events:
+        spans[name] = spans.get(name, 0.) + duration
+        if name in offline_spans:
+            offline_end = max(offline_end, start + duration)
+    online_latencies = [duration for (name, start, duration) in profiler._events if name == "reduced solve" and start > offline_end]
+    return {
+        "total time": total_time,
+        "offline time": sum([spans.get(name, 0.) for name in offline_spans]),
+        "spans": spans,
+        "counters": dict(profiler._counters),
+        "online latency": {str(p): percentile(online_latencies, p) if len(online_latencies) > 0 else 0. for p in (50, 90, 99)},
+        "peak memory": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss*1024 # ru_maxrss is in kilobytes on Linux
+    }
+    
+@pytest.mark.parametrize("tutorial", [
+    "01_thermal_block/tutorial_thermal_block.py",
+    "05_gaussian/tutorial_gaussian_eim.py",
+    "06_thermal_block_unsteady/tutorial_thermal_block_unsteady_1_rb.py",
+    "12_stokes/tutorial_stokes_1_rb.py",
+    "17_navier_stokes/tutorial_navier_stokes_exact_1.py"
+])
+def test_tutorials(tutorial, tempdir, request):
+    # Copy the tutorial folder (including its data) to a temporary folder, so that the offline stage is always carried out
+    directory = os.path.join(tempdir, os.path.dirname(tutorial))
+    shutil.copytree(os.path.join(tutorials_directory, os.path.dirname(tutorial)), directory)
+    
+    # Run the tutorial in a new process, so that the peak memory usage refers to the current tutorial only.
+    # The process is spawned rather than forked, since a forked process would inherit the memory usage of
+    # the test session (and thus of the tutorials which have been run before)
+    pool = multiprocessing.get_context("spawn").Pool(1)
+    results = pool.apply(_run_tutorial, (tutorial, directory))
+    pool.close()
+    pool.join()
+    print(json.dumps(results, indent=4))
+    
+    # Save results
+    storage_directory = os.path.join(request.config.getoption("overhead_speedup_storage"), "tutorials")
+    if not os.path.exists(storage_directory):
+        os.makedirs(storage_directory)
+    with open(os.path.join(storage_directory, os.path.splitext(os.path.basename(tutorial))[0] + ".json"), "w") as outfile:
+        json.dump(results, outfile, indent=4)
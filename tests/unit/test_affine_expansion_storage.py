@@ -0,0 +1,92 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+import os
+import pytest
+from numpy import isclose
+from rbnics.backends.online.numpy import AffineExpansionStorage, Matrix, Vector
+from rbnics.utils.config import config
+
+# Helper functions
+def generate_matrices_storage(Q, M, N, shift):
+    storage = AffineExpansionStorage(Q, Q)
+    for q1 in range(Q):
+        for q2 in range(Q):
+            matrix = Matrix(M, N)
+            for i in range(M):
+                for j in range(N):
+                    matrix[i, j] = shift + 1000*q1 + 100*q2 + 10*i + j
+            storage[q1, q2] = matrix
+    return storage
+    
+def generate_vectors_storage(Q, N, shift):
+    storage = AffineExpansionStorage(Q)
+    for q in range(Q):
+        vector = Vector(N)
+        for i in range(N):
+            vector[i] = shift + 10*q + i
+        storage[q] = vector
+    return storage
+    
+def assert_storages_equal(storage, loaded_storage):
+    for (key, tensor) in _items(storage):
+        assert isclose(loaded_storage[key].content, tensor.content).all()
+        
+def _items(storage):
+    if len(storage._content.shape) == 1:
+        return [(q, storage[q]) for q in range(storage._content.shape[0])]
+    else:
+        return [((q1, q2), storage[q1, q2]) for q1 in range(storage._content.shape[0]) for q2 in range(storage._content.shape[1])]
+        
+@pytest.fixture
+def storage_format():
+    storage_format_bak = config.get("backends", "online storage format")
+    yield
+    config.set("backends", "online storage format", storage_format_bak)
+
+# Test save and load of affine expansions of matrices and vectors in every storage format
+@pytest.mark.parametrize("format_", ["files", "stacked"])
+def test_affine_expansion_storage_io(format_, storage_format, tempdir):
+    config.set("backends", "online storage format", format_)
+    matrices = generate_matrices_storage(3, 4, 5, 0.)
+    matrices.save(tempdir, "matrices")
+    vectors = generate_vectors_storage(3, 4, 0.)
+    vectors.save(tempdir, "vectors")
+    loaded_matrices = AffineExpansionStorage(3, 3)
+    assert loaded_matrices.load(tempdir, "matrices")
+    assert_storages_equal(matrices, loaded_matrices)
+    loaded_vectors = AffineExpansionStorage(3)
+    assert loaded_vectors.load(tempdir, "vectors")
+    assert_storages_equal(vectors, loaded_vectors)
+    
+# Test that content saved in a storage format is not shadowed by stale content saved in the other one
+@pytest.mark.parametrize("formats", [("files", "stacked"), ("stacked", "files")])
+def test_affine_expansion_storage_io_change_format(formats, storage_format, tempdir):
+    (old_format, new_format) = formats
+    config.set("backends", "online storage format", old_format)
+    generate_matrices_storage(2, 3, 3, 0.).save(tempdir, "matrices")
+    config.set("backends", "online storage format", new_format)
+    matrices = generate_matrices_storage(2, 3, 3, 0.5)
+    matrices.save(tempdir, "matrices")
+    if new_format == "files":
+        assert not os.path.exists(os.path.join(tempdir, "matrices", "content.npy"))
+    else:
+        assert not os.path.exists(os.path.join(tempdir, "matrices", "content_item_0.npy"))
+    loaded_matrices = AffineExpansionStorage(2, 2)
+    assert loaded_matrices.load(tempdir, "matrices")
+    assert_storages_equal(matrices, loaded_matrices)
@@ -0,0 +1,87 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+import os
+import pytest
+from numpy import array, isclose
+from rbnics.sampling import ParameterSpaceSubset
+from rbnics.utils.io import BinaryIO, ComponentNameToBasisComponentIndexDict, GreedyErrorEstimatorsList, OnlineSizeDict, TextIO
+
+# Test save and load of the typical content of BinaryIO files
+def test_binary_io_save_load(tempdir):
+    N = OnlineSizeDict()
+    N["u"] = 3
+    N["p"] = 2
+    component_name_to_basis_component_index = ComponentNameToBasisComponentIndexDict()
+    component_name_to_basis_component_index["u"] = 0
+    component_name_to_basis_component_index["p"] = 1
+    content = [(1., 2.5), (3., 4.), None, True, 2**70, "matrix", {"tolerance": 1.e-10}, N, component_name_to_basis_component_index]
+    BinaryIO.save_file(content, tempdir, "content")
+    assert BinaryIO.exists_file(tempdir, "content")
+    loaded_content = BinaryIO.load_file(tempdir, "content")
+    assert loaded_content == content
+    assert isinstance(loaded_content[7], OnlineSizeDict)
+    assert isinstance(loaded_content[8], ComponentNameToBasisComponentIndexDict)
+    
+    vector = array([1., 2., 3.])
+    BinaryIO.save_file(vector, tempdir, "vector")
+    assert isclose(BinaryIO.load_file(tempdir, "vector"), vector).all()
+    
+# Test that files written by TextIO are still loaded
+def test_binary_io_load_legacy_text(tempdir):
+    content = [(1., 2.5), (3., 4.)]
+    TextIO.save_file(content, tempdir, "legacy")
+    assert BinaryIO.exists_file(tempdir, "legacy")
+    assert BinaryIO.load_file(tempdir, "legacy") == content
+    assert not BinaryIO.exists_file(tempdir, "missing")
+    
+# Test that parameter sets and greedy error estimators are stored to binary files, and that text files
+# written by previous versions are still loaded
+def test_binary_io_exportable_lists(tempdir):
+    parameter_space_subset = ParameterSpaceSubset()
+    parameter_space_subset.generate([(0., 1.), (2., 3.)], 10)
+    parameter_space_subset.save(tempdir, "training_set")
+    assert os.path.exists(os.path.join(tempdir, "training_set.bin"))
+    loaded_parameter_space_subset = ParameterSpaceSubset()
+    assert loaded_parameter_space_subset.load(tempdir, "training_set")
+    assert loaded_parameter_space_subset._list == parameter_space_subset._list
+    
+    TextIO.save_file(parameter_space_subset._list, tempdir, "legacy_training_set")
+    loaded_parameter_space_subset = ParameterSpaceSubset()
+    assert loaded_parameter_space_subset.load(tempdir, "legacy_training_set")
+    assert loaded_parameter_space_subset._list == parameter_space_subset._list
+    
+    greedy_error_estimators = GreedyErrorEstimatorsList()
+    greedy_error_estimators.append(1.)
+    greedy_error_estimators.append(0.1)
+    greedy_error_estimators.save(tempdir, "error_estimator_max")
+    assert os.path.exists(os.path.join(tempdir, "error_estimator_max.bin"))
+    loaded_greedy_error_estimators = GreedyErrorEstimatorsList()
+    assert loaded_greedy_error_estimators.load(tempdir, "error_estimator_max")
+    assert loaded_greedy_error_estimators._list == [1., 0.1]
+    
+# Test that corrupted files are detected through the checksum
+def test_binary_io_checksum(tempdir):
+    BinaryIO.save_file([1., 2., 3.], tempdir, "corrupted")
+    with open(os.path.join(tempdir, "corrupted.bin"), "r+b") as corrupted_file:
+        corrupted_file.seek(-1, os.SEEK_END)
+        last_byte = corrupted_file.read(1)
+        corrupted_file.seek(-1, os.SEEK_END)
+        corrupted_file.write(bytes([last_byte[0] ^ 0xFF]))
+    with pytest.raises(ValueError):
+        BinaryIO.load_file(tempdir, "corrupted")
@@ -0,0 +1,108 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+import os
+import hashlib
+from rbnics.utils.io import CacheIndex
+
+def _write_entry(folder, key, size):
+    cache_file = hashlib.sha1(str(key).encode("utf-8")).hexdigest()
+    with open(os.path.join(folder, cache_file + "_solution.h5"), "wb") as entry_file:
+        entry_file.write(bytes(size))
+    return cache_file
+    
+# Test that the index is stored to disk and that legacy cache folders are scanned
+def test_cache_index_add_and_reload(tempdir):
+    legacy_cache_file = _write_entry(tempdir, "legacy", 10)
+    index = CacheIndex(tempdir)
+    assert legacy_cache_file in index
+    cache_file = _write_entry(tempdir, "new", 10)
+    assert cache_file not in index
+    index.add(cache_file)
+    assert cache_file in index
+    assert not os.path.exists(os.path.join(tempdir, "cache_index.bin"))
+    assert os.path.exists(os.path.join(tempdir, "cache_index_journal.txt"))
+    CacheIndex._indices.clear()
+    reloaded_index = CacheIndex(tempdir)
+    assert len(reloaded_index) == 2
+    assert legacy_cache_file in reloaded_index
+    assert cache_file in reloaded_index
+    CacheIndex.flush_all()
+    assert os.path.exists(os.path.join(tempdir, "cache_index.bin"))
+    assert not os.path.exists(os.path.join(tempdir, "cache_index_journal.txt"))
+    other_cache_file = _write_entry(tempdir, "other", 10)
+    reloaded_index.add(other_cache_file)
+    CacheIndex._indices.clear()
+    reloaded_index = CacheIndex(tempdir)
+    assert len(reloaded_index) == 3
+    assert other_cache_file in reloaded_index
+    
+# Test that least recently used entries are evicted when exceeding the maximum size
+def test_cache_index_eviction(tempdir):
+    index = CacheIndex(tempdir, 1)
+    cache_files = list()
+    for key in range(3):
+        cache_files.append(_write_entry(tempdir, key, 400*1024))
+        index.add(cache_files[-1])
+    assert cache_files[0] not in index
+    assert not os.path.exists(os.path.join(tempdir, cache_files[0] + "_solution.h5"))
+    assert cache_files[1] in index
+    assert cache_files[2] in index
+    
+# Test that access times are stored when flushing, so that the least recently used order is preserved across runs
+def test_cache_index_access_times(tempdir):
+    index = CacheIndex(tempdir, 1)
+    cache_files = list()
+    for key in range(2):
+        cache_files.append(_write_entry(tempdir, key, 400*1024))
+        index.add(cache_files[-1])
+    assert cache_files[0] in index # now the most recently used entry
+    CacheIndex.flush_all()
+    CacheIndex._indices.clear()
+    index = CacheIndex(tempdir, 1)
+    cache_files.append(_write_entry(tempdir, 2, 400*1024))
+    index.add(cache_files[-1])
+    assert cache_files[0] in index
+    assert cache_files[1] not in index
+    assert not os.path.exists(os.path.join(tempdir, cache_files[1] + "_solution.h5"))
+    assert cache_files[2] in index
+    
+# Test that entries added by other processes are picked up when refreshing
+def test_cache_index_refresh_all(tempdir):
+    index = CacheIndex(tempdir)
+    cache_file = _write_entry(tempdir, "current", 10)
+    index.add(cache_file)
+    other_cache_file = _write_entry(tempdir, "other", 10)
+    assert other_cache_file not in index
+    CacheIndex.refresh_all()
+    assert cache_file in index
+    assert other_cache_file in index
+    assert not any("_tmp" in filename for filename in os.listdir(tempdir))
+    
+# Test that index files are not written while writes are disabled, and that entries are kept after refreshing
+def test_cache_index_writes_disabled(tempdir):
+    index = CacheIndex(tempdir)
+    cache_file = _write_entry(tempdir, "current", 10)
+    with CacheIndex.writes_disabled():
+        index.add(cache_file)
+        assert cache_file in index
+        assert not os.path.exists(os.path.join(tempdir, "cache_index.bin"))
+    CacheIndex.refresh_all()
+    assert os.path.exists(os.path.join(tempdir, "cache_index.bin"))
+    CacheIndex._indices.clear()
+    assert cache_file in CacheIndex(tempdir)
@@ -0,0 +1,75 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+import os
+import pytest
+from rbnics.utils.io import ExportQueue
+
+class Problem(object):
+    def __init__(self):
+        self.exported = list()
+        
+    def export_solution(self, folder, filename, solution):
+        self.exported.append(folder)
+        with open(os.path.join(str(folder), filename), "w") as file_:
+            file_.write(str(solution))
+            
+class TimeDependentProblem(Problem):
+    def set_time(self, t):
+        pass
+        
+def _read(folder, filename):
+    with open(os.path.join(folder, filename), "r") as file_:
+        return file_.read()
+
+# Test that solutions are exported to the staging folder and then moved to their destination folder
+@pytest.mark.parametrize("max_size", [0, 1])
+def test_export_queue(tempdir, max_size):
+    staging_folder = os.path.join(tempdir, "staging")
+    snapshots_folder = os.path.join(tempdir, "snapshots")
+    os.makedirs(snapshots_folder)
+    problem = Problem()
+    export_queue = ExportQueue(staging_folder, max_size)
+    for i in range(5):
+        export_queue.put(problem, snapshots_folder, "truth_" + str(i), i)
+    export_queue.flush()
+    assert all(folder.startswith(staging_folder) for folder in problem.exported)
+    assert len(os.listdir(staging_folder)) == 0
+    for i in range(5):
+        assert _read(snapshots_folder, "truth_" + str(i)) == str(i)
+        
+# Test that solutions are exported directly if there is no staging folder or the problem is time dependent
+def test_export_queue_direct(tempdir):
+    staging_folder = os.path.join(tempdir, "staging")
+    for (problem, export_queue) in ((Problem(), ExportQueue()), (TimeDependentProblem(), ExportQueue(staging_folder))):
+        export_queue.put(problem, tempdir, "truth", 0)
+        assert problem.exported == [tempdir]
+        assert _read(tempdir, "truth") == "0"
+        export_queue.flush()
+    assert not os.path.exists(staging_folder)
+    
+# Test that errors while moving files are raised on flush
+def test_export_queue_error(tempdir):
+    staging_folder = os.path.join(tempdir, "staging")
+    not_a_folder = os.path.join(tempdir, "file")
+    open(not_a_folder, "w").close()
+    export_queue = ExportQueue(staging_folder)
+    export_queue.put(Problem(), not_a_folder, "truth", 0)
+    with pytest.raises(RuntimeError):
+        export_queue.flush()
+    export_queue.flush()
@@ -0,0 +1,148 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+import gc
+import pytest
+from numpy import isclose
+from petsc4py import PETSc
+from dolfin import assemble, avg, dS, ds, dx, FunctionSpace, grad, inner, TestFunction, TrialFunction, UnitSquareMesh, VectorFunctionSpace
+from rbnics.backends.dolfin import evaluate as _evaluate, ParametrizedTensorFactory
+from rbnics.backends.dolfin.wrapping import form_iterator, ParametrizedConstant, ParametrizedExpression, to_petsc4py
+from rbnics.backends.dolfin.parametrized_tensor_factory import _assemble_empty_snapshot
+from rbnics.backends.dolfin.wrapping.form_on_truth_function_space import _affine_decomposition
+from rbnics.eim.utils.decorators import add_to_map_from_parametrized_expression_to_problem
+from rbnics.utils.decorators import ModuleWrapper
+
+# Meshes
+@pytest.fixture(scope="module")
+def mesh():
+    return UnitSquareMesh(10, 10)
+    
+# Mock problem, providing the parameters to parametrized expressions
+class Problem(object):
+    def __init__(self, V):
+        self.V = V
+        self.mu = (1., 1.)
+        
+    def set_mu(self, mu):
+        self.mu = mu
+        
+def evaluate(tensor, problem):
+    add_to_map_from_parametrized_expression_to_problem(tensor, problem)
+    return _evaluate(tensor)
+    
+# Forms: decomposable, because they only depend on the parameters through parametrized constants
+def generate_scalar_bilinear_form(V, problem):
+    mu_0 = ParametrizedConstant(problem, "mu[0]", mu=problem.mu)
+    mu_1 = ParametrizedConstant(problem, "mu[1]", mu=problem.mu)
+    u = TrialFunction(V)
+    v = TestFunction(V)
+    return mu_0*inner(grad(u), grad(v))*dx + mu_1*mu_0*u*v*dx + u*v*ds
+    
+def generate_scalar_linear_form(V, problem):
+    mu_1 = ParametrizedConstant(problem, "mu[1]", mu=problem.mu)
+    v = TestFunction(V)
+    return mu_1*v*dx + 2.*v*ds
+    
+def generate_vector_bilinear_form(V, problem):
+    mu_0 = ParametrizedConstant(problem, "mu[0]", mu=problem.mu)
+    u = TrialFunction(V)
+    v = TestFunction(V)
+    return mu_0*inner(grad(u), grad(v))*dx + inner(u, v)*dx
+    
+# Forms: not decomposable, because of spatially varying parametrized expressions
+def generate_scalar_bilinear_form_with_expression(V, problem):
+    f = ParametrizedExpression(problem, "mu[0]*x[0] + mu[1]", mu=problem.mu, element=V.ufl_element())
+    u = TrialFunction(V)
+    v = TestFunction(V)
+    return f*u*v*dx + inner(grad(u), grad(v))*dx
+    
+generate_spaces_and_forms = pytest.mark.parametrize("generate_space, generate_form, decomposable", [
+    (lambda mesh: FunctionSpace(mesh, "Lagrange", 1), generate_scalar_bilinear_form, True),
+    (lambda mesh: FunctionSpace(mesh, "Lagrange", 2), generate_scalar_linear_form, True),
+    (lambda mesh: VectorFunctionSpace(mesh, "Lagrange", 1), generate_vector_bilinear_form, True),
+    (lambda mesh: FunctionSpace(mesh, "Lagrange", 1), generate_scalar_bilinear_form_with_expression, False)
+])
+
+# Helper functions
+def assert_tensors_close(tensor, expected_tensor):
+    if tensor.rank() == 2:
+        assert isclose(tensor.array(), expected_tensor.array()).all()
+    else:
+        assert isclose(tensor.get_local(), expected_tensor.get_local()).all()
+        
+# Test that evaluation from the affine decomposition matches standard assembly for several parameters
+@generate_spaces_and_forms
+def test_form_on_truth_function_space_affine_decomposition(mesh, generate_space, generate_form, decomposable):
+    V = generate_space(mesh)
+    problem = Problem(V)
+    form = generate_form(V, problem)
+    assert (_affine_decomposition(form, ModuleWrapper(form_iterator)) is not None) == decomposable
+    tensor = ParametrizedTensorFactory(form)
+    for mu in [(1., 1.), (2., 0.5), (0.1, 3.), (1., 1.)]:
+        problem.set_mu(mu)
+        assert_tensors_close(evaluate(tensor, problem), assemble(form, keep_diagonal=True))
+        
+# Forms: different integral types, to check the layout of empty snapshots
+def generate_bilinear_form(V):
+    u = TrialFunction(V)
+    v = TestFunction(V)
+    return inner(u, v)*dx + inner(u, v)*ds
+    
+def generate_interior_facet_bilinear_form(V):
+    u = TrialFunction(V)
+    v = TestFunction(V)
+    return inner(avg(u), avg(v))*dS + inner(u, v)*dx
+    
+def generate_linear_form(V):
+    v = TestFunction(V)
+    if len(v.ufl_shape) > 0:
+        v = v[0]
+    return v*dx + v*ds
+    
+# Test that the empty snapshot has the same layout of the assembled form
+@pytest.mark.parametrize("generate_form", [generate_bilinear_form, generate_interior_facet_bilinear_form, generate_linear_form])
+@pytest.mark.parametrize("generate_space", [
+    lambda mesh: FunctionSpace(mesh, "Lagrange", 2),
+    lambda mesh: FunctionSpace(mesh, "Discontinuous Lagrange", 1),
+    lambda mesh: VectorFunctionSpace(mesh, "Lagrange", 1)
+])
+def test_form_on_truth_function_space_empty_snapshot(mesh, generate_space, generate_form):
+    V = generate_space(mesh)
+    form = generate_form(V)
+    expected_tensor = assemble(form, keep_diagonal=True)
+    empty_snapshot = ParametrizedTensorFactory(form).create_empty_snapshot()
+    assert empty_snapshot.norm("l2" if empty_snapshot.rank() == 1 else "frobenius") == 0.
+    # Adding the assembled form must not require any new nonzero entry
+    if empty_snapshot.rank() == 2:
+        to_petsc4py(empty_snapshot).axpy(1., to_petsc4py(expected_tensor), PETSc.Mat.Structure.SUBSET_NONZERO_PATTERN)
+    else:
+        empty_snapshot.axpy(1., expected_tensor)
+    assert_tensors_close(empty_snapshot, expected_tensor)
+    
+# Test that stored empty snapshots are released together with their function space
+def test_form_on_truth_function_space_empty_snapshot_storage(mesh):
+    storage_size = len(_assemble_empty_snapshot._storage)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    factory = ParametrizedTensorFactory(generate_bilinear_form(V))
+    factory.create_empty_snapshot()
+    factory.create_empty_snapshot()
+    assert len(_assemble_empty_snapshot._storage) == storage_size + 1
+    del V, factory
+    gc.collect()
+    assert len(_assemble_empty_snapshot._storage) == storage_size
@@ -0,0 +1,132 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+import os
+from rbnics.reduction_methods.base import HPRBReduction
+from rbnics.sampling import ParameterSpaceSubset
+from rbnics.utils.io import Folders, GreedyErrorEstimatorsList
+
+class TruthProblem(object):
+    def __init__(self, folder_prefix):
+        self.folder_prefix = folder_prefix
+        self.mu_range = [(0., 1.)]
+        self.mu = (0., )
+        
+    def set_mu(self, mu):
+        self.mu = mu
+        
+    def name(self):
+        return "TruthProblem"
+        
+class ReducedProblem(object):
+    def __init__(self, folder_prefix):
+        self.folder_prefix = folder_prefix
+        self.folder = Folders()
+        self.mu = None
+        
+    def set_mu(self, mu):
+        self.mu = mu
+        
+class ReductionMethod(object):
+    def __init__(self, truth_problem, **kwargs):
+        self.truth_problem = truth_problem
+        self._init_kwargs = kwargs
+        self.folder_prefix = truth_problem.folder_prefix
+        self.folder = Folders()
+        self.folder["training_set"] = os.path.join(self.folder_prefix, "training_set")
+        self.folder["testing_set"] = os.path.join(self.folder_prefix, "testing_set")
+        self.folder["post_processing"] = os.path.join(self.folder_prefix, "post_processing")
+        self.training_set = ParameterSpaceSubset()
+        self.testing_set = ParameterSpaceSubset()
+        self.greedy_error_estimators = GreedyErrorEstimatorsList()
+        self.greedy_relative_error_estimators = GreedyErrorEstimatorsList()
+        self.label = "RB"
+        self.Nmax = 0
+        self.tol = 0.
+        self.batch_size = 1
+        self.batch_minimum_distance = 0.
+        
+    def set_Nmax(self, Nmax, **kwargs):
+        self.Nmax = Nmax
+        
+    def set_tolerance(self, tol, **kwargs):
+        self.tol = tol
+        
+    def set_batch_size(self, batch_size, minimum_distance=0., **kwargs):
+        self.batch_size = batch_size
+        self.batch_minimum_distance = minimum_distance
+        
+    def initialize_training_set(self, ntrain, enable_import=True, sampling=None, **kwargs):
+        self.folder["training_set"].create()
+        self.training_set.generate(self.truth_problem.mu_range, ntrain, sampling)
+        
+    def initialize_testing_set(self, ntest, enable_import=False, sampling=None, **kwargs):
+        self.folder["testing_set"].create()
+        self.testing_set.generate(self.truth_problem.mu_range, ntest, sampling)
+        
+    def _create_reduced_problem(self):
+        return ReducedProblem(self.folder_prefix)
+        
+    # Mock the greedy: the relative error estimator is proportional to the width of the local training set.
+    # The last batch only contains the parameter with the largest error estimator (e.g. because the remaining
+    # ones were closer than the minimum distance), while the previous batch error estimators are large
+    def offline(self):
+        self.reduced_problem = self._create_reduced_problem()
+        width = max(mu[0] for mu in self.training_set) - min(mu[0] for mu in self.training_set)
+        self.greedy_error_estimators.extend([1., 0.9, 0.8, width/2.])
+        self.greedy_relative_error_estimators.extend([1., width/2.])
+        self.folder["post_processing"].create()
+        self.greedy_error_estimators.save(self.folder["post_processing"], "error_estimator_max")
+        self.greedy_relative_error_estimators.save(self.folder["post_processing"], "relative_error_estimator_max")
+        return self.reduced_problem
+        
+def _create_reduction_method(tempdir):
+    reduction_method = HPRBReduction(ReductionMethod)(TruthProblem(os.path.join(tempdir, "hp")))
+    reduction_method.set_Nmax(3)
+    reduction_method.set_tolerance(0.15)
+    reduction_method.set_batch_size(3)
+    reduction_method.initialize_training_set(100, sampling=None)
+    return reduction_method
+    
+# Test that subdomains are split until the local relative error estimator of the last greedy iteration
+# is below the tolerance, and that the partition is loaded by subsequent runs
+def test_hp_rb_reduction(tempdir):
+    reduction_method = _create_reduction_method(tempdir)
+    reduced_problem = reduction_method.offline()
+    assert sorted(reduction_method.partition.leaves()) == ["00", "01", "10", "11"]
+    assert sorted(reduction_method.local_reduction_methods.keys()) == ["00", "01", "10", "11"]
+    for (node, local_reduction_method) in reduction_method.local_reduction_methods.items():
+        assert local_reduction_method.folder_prefix == os.path.join(tempdir, "hp", "partition", "subdomain" + node)
+        assert all(reduction_method.partition.find(mu) == node for mu in local_reduction_method.training_set)
+        assert local_reduction_method.greedy_relative_error_estimators[-1] < 0.15
+    reduced_problem.set_mu((0.6, ))
+    assert reduced_problem.local_reduced_problem is reduction_method.local_reduction_methods["10"].reduced_problem
+    assert reduced_problem.mu == (0.6, )
+    
+    # Subsequent runs load the partition, and do not split subdomains any further
+    reduction_method = _create_reduction_method(tempdir)
+    reduction_method.offline()
+    assert sorted(reduction_method.partition.leaves()) == ["00", "01", "10", "11"]
+    
+# Test that subdomains are not split if their children would have fewer training parameters than Nmax
+def test_hp_rb_reduction_small_training_set(tempdir):
+    reduction_method = _create_reduction_method(tempdir)
+    reduction_method.initialize_training_set(5, sampling=None)
+    reduction_method.offline()
+    assert reduction_method.partition.leaves() == [""]
+    assert list(reduction_method.local_reduction_methods.keys()) == [""]
@@ -16,10 +16,12 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
-from numpy import dot, isclose
+from numpy import allclose, arange, diag, dot, isclose, ones
+from numpy.linalg import solve
 from dolfin import assemble, DirichletBC, DOLFIN_EPS, dx, Expression, Function, FunctionSpace, grad, inner, IntervalMesh, pi, project, TestFunction, TrialFunction
 from rbnics.backends.dolfin import LinearSolver as SparseLinearSolver
 from rbnics.backends.online.numpy import Function as DenseFunction, LinearSolver as DenseLinearSolver, Matrix as DenseMatrix, Vector as DenseVector
+from rbnics.utils.config import config
 
 """
 Solve
@@ -133,3 +135,65 @@ def test_linear_solver():
         error_dense = _test_linear_solver_dense(V, A, F, X, exact_solution)
         assert isclose(error_dense, error_sparse_tensor_callbacks)
         assert isclose(error_dense, error_sparse_form_callbacks)
+        
+# ~~~ Test function for multiple right-hand sides ~~~ #
+def test_linear_solver_solve_many():
+    (_, V, A, F, X, exact_solution) = _test_linear_solver_sparse("tensor callbacks")
+    
+    # Define boundary condition
+    def boundary(x):
+        return x[0] < 0 + DOLFIN_EPS or x[0] > 2*pi - 10*DOLFIN_EPS
+    bc = [DirichletBC(V, exact_solution, boundary)]
+    
+    # Solve for several right-hand sides, reusing the same factorization
+    sparse_solution = Function(V)
+    sparse_solver = SparseLinearSolver(A, sparse_solution, F, bc)
+    sparse_solver.solve()
+    sparse_solutions = sparse_solver.solve_many([F, 2*F])
+    assert len(sparse_solutions) == 2
+    
+    # Factorizations are shared among solvers only if the factorization cache is enabled
+    assert len(SparseLinearSolver._factorization_cache) == 0
+    config.set("backends", "linear solver factorization cache size", 1)
+    SparseLinearSolver(A, Function(V), F, bc).solve()
+    SparseLinearSolver(A, Function(V), 2*F, bc).solve()
+    assert len(SparseLinearSolver._factorization_cache) == 1
+    config.set("backends", "linear solver factorization cache size", 0)
+    SparseLinearSolver._factorization_cache.clear()
+    
+    # Compute the errors: the second solution is not equal to 2*sparse_solution due to the non-homogeneous bc
+    sparse_error = sparse_solutions[0].vector() - sparse_solution.vector()
+    assert isclose(sparse_error.inner(X*sparse_error), 0.)
+    sparse_error = sparse_solutions[1].vector() - sparse_solution.vector()
+    assert not isclose(sparse_error.inner(X*sparse_error), 0.)
+
+    # Solve again with BCs values which are scaled together with the right-hand side
+    scaled_exact_solution = Function(V)
+    scaled_exact_solution.vector().add_local(2*exact_solution.vector().get_local())
+    scaled_exact_solution.vector().apply("add")
+    scaled_bc = [DirichletBC(V, scaled_exact_solution, boundary)]
+    sparse_solutions = sparse_solver.solve_many([F, 2*F], [bc, scaled_bc])
+    sparse_error = sparse_solutions[1].vector() - 2*sparse_solution.vector()
+    assert isclose(sparse_error.inner(X*sparse_error), 0.)
+    
+# ~~~ Test function for nested solves on the leading subsystems ~~~ #
+def test_linear_solver_solve_nested():
+    N = 10
+    symmetric_A_array = 2*diag(ones(N)) - diag(ones(N - 1), 1) - diag(ones(N - 1), -1)
+    non_symmetric_A_array = symmetric_A_array + 0.5*diag(ones(N - 1), 1) - 0.5*diag(ones(N - 1), -1)
+    # Nonsymmetric matrices which are close to symmetric in absolute terms must not be factorized by Cholesky
+    badly_scaled_A_array = 1.e-9*non_symmetric_A_array
+    slightly_non_symmetric_A_array = symmetric_A_array + 1.e-6*diag(ones(N - 1), 1)
+    # Nonsymmetric matrix with a small (but not too small) leading pivot, causing large growth in LU factorization without pivoting
+    pivot_growth_A_array = non_symmetric_A_array.copy()
+    pivot_growth_A_array[0, 0] = 1.e-13
+    for dense_A_array in (symmetric_A_array, non_symmetric_A_array, badly_scaled_A_array, slightly_non_symmetric_A_array, pivot_growth_A_array):
+        dense_A = DenseMatrix(N, N)
+        dense_F = DenseVector(N)
+        dense_A[:, :] = dense_A_array
+        dense_F[:] = arange(1., N + 1.)
+        dense_solutions = [DenseFunction(n) for n in (2, 5, N)]
+        dense_solver = DenseLinearSolver(dense_A, DenseFunction(N), dense_F)
+        dense_solver.solve_nested(dense_solutions)
+        for (n, dense_solution) in zip((2, 5, N), dense_solutions):
+            assert allclose(dense_solution.vector(), solve(dense_A_array[:n, :n], arange(1., n + 1.)), rtol=1.e-10, atol=0.)
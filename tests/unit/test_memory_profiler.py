@@ -0,0 +1,110 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+import json
+import os
+from numpy import zeros
+from rbnics.utils.profiler import MemoryProfiler
+
+class Storage(object):
+    def __init__(self, *arrays):
+        self._list = list(arrays)
+
+class Problem(object):
+    def __init__(self):
+        self._solution_cache = dict()
+        self.cache_config = {"Disk", "RAM"}
+        self.disk_cache_size = 0
+
+def test_memory_profiler(tempdir):
+    # Create a memory profiler, initially disabled
+    memory_profiler = MemoryProfiler()
+    
+    # Track a storage and a cache
+    storage = Storage(zeros(1000), zeros(1000))
+    memory_profiler.track("storages", storage)
+    problem = Problem()
+    memory_profiler.track_cache("caches", problem, "_solution_cache")
+    problem._solution_cache[0] = zeros(2000)
+    problem._solution_cache[1] = storage._list[0] # not counted twice
+    usage = memory_profiler.usage()
+    assert usage["storages"] == 16000
+    assert usage["caches"] == 16000
+    
+    # Nothing is recorded while the memory profiler is disabled
+    memory_profiler.record("first phase")
+    assert len(memory_profiler._phases) == 0
+    
+    # Record phases, with peak memory usage
+    memory_profiler.enable()
+    memory_profiler.record("first phase")
+    storage._list.append(zeros(1000))
+    memory_profiler.usage()
+    storage._list.pop()
+    memory_profiler.record("second phase")
+    assert memory_profiler._phases[1][1]["storages"] == 16000
+    assert memory_profiler._phases[1][2]["storages"] == 24000
+    
+    # Objects are not tracked anymore once they are deleted
+    del storage
+    assert "storages" not in memory_profiler.usage()
+    
+    # No action is taken if the memory budget is not exceeded
+    memory_profiler.set_budget(1)
+    assert not memory_profiler.check()
+    assert len(problem._solution_cache) == 2
+    
+    # Spill caches if the memory budget is exceeded
+    for i in range(2, 100):
+        problem._solution_cache[i] = zeros(2000)
+    assert not memory_profiler.check()
+    assert len(problem._solution_cache) == 0
+    assert problem.cache_config == {"Disk"}
+    
+    # Print summary
+    summary = memory_profiler.summary()
+    print(summary)
+    assert "second phase" in summary
+    
+    # Save to file
+    memory_profiler.save(tempdir, "memory")
+    assert os.path.isfile(os.path.join(tempdir, "memory.txt"))
+    with open(os.path.join(tempdir, "memory.json"), "r") as infile:
+        phases = json.load(infile)
+    assert [phase["phase"] for phase in phases] == ["first phase", "second phase"]
+    
+    # Clear
+    memory_profiler.clear()
+    assert len(memory_profiler._phases) == 0
+    
+def test_memory_profiler_check_interval():
+    memory_profiler = MemoryProfiler()
+    problem = Problem()
+    memory_profiler.track_cache("caches", problem, "_solution_cache")
+    memory_profiler.set_budget(1)
+    memory_profiler.set_check_interval(3)
+    for i in range(100):
+        problem._solution_cache[i] = zeros(2000)
+        
+    # The budget is checked (and caches are spilled) only once every three calls
+    assert not memory_profiler.check()
+    assert not memory_profiler.check()
+    assert len(problem._solution_cache) == 100
+    assert not memory_profiler.check()
+    assert len(problem._solution_cache) == 0
+    assert problem.cache_config == {"Disk"}
@@ -0,0 +1,70 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+import pytest
+from numpy import isclose
+from dolfin import ALE, cells, FunctionSpace, MeshFunction, UnitSquareMesh
+from rbnics.backends.dolfin import MeshMotion
+
+# Mesh, with subdomains
+@pytest.fixture(scope="module")
+def mesh():
+    return UnitSquareMesh(4, 4)
+    
+def generate_subdomains(mesh):
+    subdomains = MeshFunction("size_t", mesh, mesh.topology().dim())
+    for cell in cells(mesh):
+        subdomains[cell] = 1 if cell.midpoint().x() < 0.5 else 2
+    return subdomains
+    
+# Shape parametrization, continuous across subdomains and non-affine in both x and mu
+shape_parametrization_expression = [
+    ("mu[0]*x[0]", "x[1] + mu[1]**2*x[0]**2"),
+    ("0.5*mu[0] + x[0] - 0.5", "x[1] + 0.25*mu[1]**2")
+]
+
+# Mock problem, providing the parameters to the shape parametrization
+class Problem(object):
+    def __init__(self, V, mu):
+        self.V = V
+        self.mu = mu
+        
+    def set_mu(self, mu):
+        self.mu = mu
+        
+# Test that moving the mesh by vectorized evaluation of the shape parametrization at vertices gives the same
+# coordinates as moving it by the displacement interpolated on each subdomain
+@pytest.mark.parametrize("mu", [(1., 0.), (2., 0.5), (0.5, -1.)])
+def test_mesh_motion(mesh, mu):
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    subdomains = generate_subdomains(mesh)
+    mesh_motion = MeshMotion(V, subdomains, tuple(shape_parametrization_expression))
+    mesh_motion.init(Problem(V, mu))
+    
+    # Vectorized evaluation at vertices
+    mesh_motion.move_mesh()
+    deformed_coordinates = mesh.coordinates().copy()
+    mesh_motion.reset_reference()
+    
+    # Interpolation of the displacement
+    ALE.move(mesh, mesh_motion.compute_displacement())
+    expected_deformed_coordinates = mesh.coordinates().copy()
+    mesh_motion.reset_reference()
+    
+    assert isclose(deformed_coordinates, expected_deformed_coordinates).all()
+    assert isclose(mesh.coordinates(), mesh_motion.reference_coordinates).all()
@@ -0,0 +1,98 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from numpy import array, dot, isclose
+from numpy.random import rand, seed
+from rbnics.backends.online import OnlineFunction, OnlineMatrix, OnlineVector
+from rbnics.problems.parabolic_coercive import ParabolicCoerciveRBReducedProblem
+
+# Reduced problem providing a trajectory of reduced solutions, and thetas which are piecewise constant in time
+class ReducedProblem(object):
+    def __init__(self, N, n_steps):
+        self.dt = 1./n_steps
+        self.t = 0.
+        self._solution_over_time = [self._random_function(N) for _ in range(n_steps + 1)]
+        self._solution_dot_over_time = [self._random_function(N) for _ in range(n_steps + 1)]
+        self.operators = dict()
+        self.operators["ff"] = rand()
+        for term in ("af", "mf"):
+            self.operators[term] = rand(N)
+        for term in ("aa", "ma", "mm"):
+            self.operators[term] = rand(N, N)
+        self.assembled_thetas = list()
+        
+    def _random_function(self, N):
+        function = OnlineFunction(N)
+        function.vector()[:] = rand(N)
+        return function
+        
+    def set_time(self, t):
+        self.t = t
+        
+    def compute_theta(self, term):
+        if term == "f":
+            return (1., )
+        elif self.t < 0.5:
+            return (1., )
+        else:
+            return (2., )
+        
+    def _assemble_residual_norm_squared_operators(self, N, theta_m, theta_a, theta_f):
+        self.assembled_thetas.append((theta_m, theta_a, theta_f))
+        scaling = {"f": theta_f[0], "a": theta_a[0], "m": theta_m[0]}
+        operators = list()
+        for term in ("ff", "af", "aa", "mf", "ma", "mm"):
+            if term == "ff":
+                operator = self.operators[term]
+            elif len(self.operators[term].shape) == 1:
+                operator = OnlineVector(N)
+                operator[:] = self.operators[term]
+            else:
+                operator = OnlineMatrix(N, N)
+                operator[:, :] = self.operators[term]
+            operators.append(scaling[term[0]]*scaling[term[1]]*operator)
+        return tuple(operators)
+        
+# Test that residual norms over time are computed assembling error estimation operators only once for each distinct
+# thetas. Contractions with the reduced solution are instead carried out one time step at a time through the backend
+# agnostic online interface: their cost is negligible compared to the one of the assembly of operators, since the
+# reduced dimension is small, and thus the trajectory is not stacked in a (number of time steps) x N array
+def test_parabolic_coercive_rb_reduced_problem_residual_norm_squared():
+    seed(0)
+    reduced_problem = ReducedProblem(5, 10)
+    residual_norm_squared_over_time = ParabolicCoerciveRBReducedProblem.get_residual_norm_squared(reduced_problem)
+    assert len(residual_norm_squared_over_time) == 11
+    assert residual_norm_squared_over_time[0] == 0.
+    assert reduced_problem.assembled_thetas == [((1., ), (1., ), (1., )), ((2., ), (2., ), (1., ))]
+    
+    # Compare to the residual norms computed one time step at a time
+    operators = reduced_problem.operators
+    for (k, (solution, solution_dot)) in enumerate(zip(reduced_problem._solution_over_time, reduced_problem._solution_dot_over_time)):
+        if k > 0:
+            scaling = 1. if k*reduced_problem.dt < 0.5 else 2.
+            u = array(solution.vector())
+            u_dot = array(solution_dot.vector())
+            expected = (
+                  operators["ff"]
+                + 2.*scaling*dot(u, operators["af"])
+                + scaling**2*dot(u, dot(operators["aa"], u))
+                + 2.*scaling*dot(u_dot, operators["mf"])
+                + 2.*scaling**2*dot(u_dot, dot(operators["ma"], u))
+                + scaling**2*dot(u_dot, dot(operators["mm"], u_dot))
+            )
+            assert isclose(residual_norm_squared_over_time[k], expected)
@@ -0,0 +1,106 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+import os
+import pickle
+from mpi4py import MPI
+from numpy import exp, isclose, isnan, log, mean
+from rbnics.utils.io import PerformanceTable
+
+def _create_table(testing_set):
+    table = PerformanceTable(testing_set)
+    table.set_Nmax(3)
+    table.add_column("error", group_name="error", operations=("mean", "max"))
+    table.add_column("estimator", group_name="estimator", operations="min")
+    return table
+
+def _fill_table(table, mu_indices):
+    for mu_index in mu_indices:
+        for n in range(1, 4):
+            table["error", n, mu_index] = 10.**(- n)*(mu_index + 1)
+            if n < 3:
+                table["estimator", n, mu_index] = 10.**(- n)
+            else:
+                table["estimator", n, mu_index] = NotImplemented
+
+# Test that statistics are computed for all reduced dimensions, skipping rows which are not implemented
+def test_performance_table_statistics():
+    testing_set = list(range(4))
+    table = _create_table(testing_set)
+    _fill_table(table, range(4))
+    groups_content = table._process()
+    (_, _, error_content, _) = groups_content["error"]
+    for n in range(1, 4):
+        errors = [10.**(- n)*(mu_index + 1) for mu_index in range(4)]
+        assert isclose(error_content["gmean_error"][n - 1], exp(mean(log(errors))))
+        assert isclose(error_content["max_error"][n - 1], max(errors))
+    (_, _, estimator_content, _) = groups_content["estimator"]
+    assert isclose(estimator_content["min_estimator"][0], 0.1)
+    assert isclose(estimator_content["min_estimator"][1], 0.01)
+    assert isnan(estimator_content["min_estimator"][2])
+    assert len(str(table).split("\n")) == 8
+
+# Test that tables filled in on different subsets of the testing set are merged
+def test_performance_table_merge():
+    testing_set = list(range(4))
+    table = _create_table(testing_set)
+    other_tables = [_create_table(testing_set), _create_table(testing_set)]
+    mu_indices_chunks = [[0, 2], [1, 3]]
+    for (other_table, mu_indices) in zip(other_tables, mu_indices_chunks):
+        _fill_table(other_table, mu_indices)
+        table.merge(other_table, mu_indices)
+    expected_table = _create_table(testing_set)
+    _fill_table(expected_table, range(4))
+    assert str(table) == str(expected_table)
+    assert table["estimator", 3, 0] is not NotImplemented # CustomNotImplementedAfterDiv
+    assert table["estimator", 2, 1] == 0.01
+
+# Communicator emulating the allgather of tables filled in on different processes
+class _AllgatherMPIComm(object):
+    def __init__(self, other_objects):
+        self.other_objects = other_objects
+        
+    def allgather(self, obj):
+        return [pickle.loads(pickle.dumps(obj_)) for obj_ in [obj] + self.other_objects]
+        
+# Test that tables filled in by different processes on different subsets of the testing set are merged
+def test_performance_table_merge_across_processes():
+    testing_set = list(range(4))
+    table = _create_table(testing_set)
+    _fill_table(table, [0, 2])
+    other_table = _create_table(testing_set)
+    _fill_table(other_table, [1, 3])
+    table.merge_across_processes([0, 2], _AllgatherMPIComm([([1, 3], other_table)]))
+    expected_table = _create_table(testing_set)
+    _fill_table(expected_table, range(4))
+    assert str(table) == str(expected_table)
+    table.merge_across_processes([0, 1, 2, 3], MPI.COMM_WORLD)
+    assert str(table) == str(expected_table)
+    
+# Test that the content of the table is saved to file and loaded back
+def test_performance_table_save_and_load(tempdir):
+    testing_set = list(range(4))
+    table = _create_table(testing_set)
+    _fill_table(table, range(4))
+    table.save(tempdir, "table")
+    assert os.path.exists(os.path.join(tempdir, "table", "error.csv"))
+    loaded_table = _create_table(testing_set)
+    assert not loaded_table.load(tempdir, "other_table")
+    assert loaded_table.load(tempdir, "table")
+    assert str(loaded_table) == str(table)
+    assert loaded_table["error", 2, 3] == table["error", 2, 3]
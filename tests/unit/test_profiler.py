@@ -0,0 +1,71 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+import json
+import os
+from mpi4py import MPI
+from rbnics.utils.mpi import is_io_process
+from rbnics.utils.profiler import Profiler
+
+def test_profiler(tempdir):
+    # Create a profiler, initially disabled
+    profiler = Profiler()
+    
+    @profiler.span("outer")
+    def outer(n):
+        profiler.increment("outer calls")
+        if n > 0:
+            outer(n - 1) # recursive calls are recorded only once
+        inner()
+        
+    @profiler.span("inner")
+    def inner():
+        pass
+        
+    # Nothing is recorded while the profiler is disabled
+    outer(2)
+    assert len(profiler._events) == 0
+    assert len(profiler._counters) == 0
+    
+    # Record spans and counters
+    profiler.enable()
+    outer(2)
+    profiler.start("explicit")
+    inner()
+    profiler.stop("explicit")
+    profiler.disable()
+    assert [name for (name, _, _) in profiler._events] == ["inner", "inner", "inner", "outer", "inner", "explicit"]
+    assert profiler._counters["outer calls"] == 3
+    
+    # Print summary
+    summary = profiler.summary()
+    print(summary)
+    assert "outer calls" in summary
+    
+    # Save trace and summary to file, also if the I/O communicator has been reset by a call with an explicit communicator
+    is_io_process(MPI.COMM_SELF)
+    profiler.save(tempdir, "profile")
+    assert os.path.isfile(os.path.join(tempdir, "profile.txt"))
+    with open(os.path.join(tempdir, "profile.json"), "r") as infile:
+        trace = json.load(infile)
+    assert len([event for event in trace["traceEvents"] if event["ph"] == "X"]) == 6
+    
+    # Clear
+    profiler.clear()
+    assert len(profiler._events) == 0
+    assert len(profiler._counters) == 0
@@ -25,9 +25,10 @@ from contextlib import contextmanager
 from dolfin import assign, CellDiameter, Constant, cos, div, Expression, FiniteElement, Function, FunctionSpace, grad, inner, Measure, Mesh, MeshFunction, MixedElement, pi, project, sin, split, sqrt, tan, TestFunction, TrialFunction, VectorElement
 from rbnics import ShapeParametrization
 from rbnics.backends.dolfin.wrapping import assemble_operator_for_derivative, compute_theta_for_derivative, PullBackFormsToReferenceDomain
-from rbnics.backends.dolfin.wrapping.pull_back_to_reference_domain import forms_are_close
+from rbnics.backends.dolfin.wrapping.pull_back_to_reference_domain import forms_are_close, PullBackDiskCache
 from rbnics.eim.problems import DEIM, EIM, ExactParametrizedFunctions
 from rbnics.problems.base import ParametrizedProblem
+from rbnics.utils.io import Folders
 
 data_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "data", "test_pull_back_to_reference_domain")
 
@@ -2367,3 +2368,24 @@ def test_pull_back_to_reference_domain_stokes_unsteady(shape_parametrization_pre
         m_on_reference_domain = theta_times_operator(problem_on_reference_domain, "m")
         m_pull_back = theta_times_operator(problem_pull_back, "m")
         assert forms_are_close(m_on_reference_domain, m_pull_back)
+
+# Test persistent storage of symbolic computations carried out while pulling back forms
+def test_pull_back_disk_cache(tempdir):
+    computed = list()
+    def compute():
+        computed.append(True)
+        return ("x[0]*mu[0]", "x[1]*mu[1]")
+    
+    first_run_cache = PullBackDiskCache(Folders.Folder(os.path.join(tempdir, "cache")))
+    assert first_run_cache.get("key", compute) == ("x[0]*mu[0]", "x[1]*mu[1]")
+    assert first_run_cache.get("key", compute) == ("x[0]*mu[0]", "x[1]*mu[1]")
+    assert len(computed) == 1
+    assert [filename for filename in os.listdir(os.path.join(tempdir, "cache")) if filename.startswith("pull_back_")][0].endswith(".bin")
+    
+    second_run_cache = PullBackDiskCache(Folders.Folder(os.path.join(tempdir, "cache")))
+    assert second_run_cache.get("key", compute) == ("x[0]*mu[0]", "x[1]*mu[1]")
+    assert len(computed) == 1
+    
+    disabled_cache = PullBackDiskCache(Folders.Folder(os.path.join(tempdir, "cache")), enabled=False)
+    assert disabled_cache.get("key", compute) == ("x[0]*mu[0]", "x[1]*mu[1]")
+    assert len(computed) == 2
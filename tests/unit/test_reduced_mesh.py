@@ -17,7 +17,8 @@
 #
 
 import pytest
-from numpy import array, isclose, nonzero, sort
+from numpy import arange, array, isclose, nonzero, sort, zeros
+from petsc4py import PETSc
 from dolfin import assemble, dx, Expression, FiniteElement, FunctionSpace, has_pybind11, inner, MixedElement, Point, project, split, TestFunction, TrialFunction, UnitIntervalMesh, UnitSquareMesh, Vector, VectorElement
 if has_pybind11():
     from mpi4py import MPI
@@ -33,7 +34,9 @@ except ImportError:
 else:
     has_mshr = True
 from rbnics.backends.dolfin import ReducedMesh
-from rbnics.backends.dolfin.wrapping import evaluate_and_vectorize_sparse_matrix_at_dofs, evaluate_sparse_function_at_dofs, evaluate_sparse_vector_at_dofs
+from rbnics.backends.dolfin.wrapping import evaluate_and_vectorize_sparse_matrix_at_dofs, evaluate_sparse_function_at_dofs, evaluate_sparse_tensors_at_dofs, evaluate_sparse_vector_at_dofs
+from rbnics.backends.dolfin.wrapping.evaluate_sparse_function_at_dofs import _evaluate_sparse_function_at_dofs
+from rbnics.utils.profiler import profiler
 
 # Meshes
 def structured_mesh_1d():
@@ -95,6 +98,25 @@ def test_reduced_mesh_load_elliptic_matrix(mesh, load_tempdir):
     
     _test_reduced_mesh_elliptic_matrix(V, reduced_mesh)
     
+@generate_meshes
+def test_reduced_mesh_reuse_elliptic_matrix(mesh):
+    log(PROGRESS, "*** Elliptic case, matrix, reuse of reduced mesh ***")
+    V = EllipticFunctionSpace(mesh)
+    reduced_mesh = ReducedMesh((V, V))
+    
+    # Cells of the following pairs of dofs have already been marked by the first one
+    for pair in [(1, 2), (2, 1), (1, 1), (2, 2)]:
+        log(PROGRESS, "Adding " + str(pair))
+        reduced_mesh.append(pair)
+        assert reduced_mesh.get_reduced_mesh() is reduced_mesh.get_reduced_mesh(0)
+        
+        _test_reduced_mesh_elliptic_matrix(V, reduced_mesh)
+        
+    # ... while the following one may require a new reduced mesh
+    reduced_mesh.append((41, 41))
+    
+    _test_reduced_mesh_elliptic_matrix(V, reduced_mesh)
+    
 def _test_reduced_mesh_elliptic_matrix(V, reduced_mesh):
     reduced_V = reduced_mesh.get_reduced_function_spaces()
     dofs = reduced_mesh.get_dofs_list()
@@ -465,3 +487,82 @@ def _test_reduced_mesh_collapsed_vector(V, reduced_mesh):
     log(PROGRESS, "b at dofs:\n" + str(b_dofs))
     log(PROGRESS, "b_N at reduced dofs:\n" + str(b_N_reduced_dofs))
     log(PROGRESS, "Error:\n" + str(b_dofs - b_N_reduced_dofs))
+
+# ~~~ Exchange of values between dofs and reduced dofs ~~~ #
+def test_evaluate_sparse_function_at_dofs_exchange():
+    vec = PETSc.Vec().createMPI(10, comm=PETSc.COMM_SELF)
+    vec.setArray(arange(1., 11.))
+    vec.assemble()
+    out = PETSc.Vec().createMPI(5, comm=PETSc.COMM_SELF)
+    out.set(0.)
+    dofs = [(7, ), (2, ), (9, ), (0, ), (2, )]
+    reduced_dofs = [(2, ), (0, ), (4, ), (1, ), (3, )]
+    
+    # Batched exchange through all-to-all communication on a single process
+    _evaluate_sparse_function_at_dofs(vec, dofs, out, reduced_dofs)
+    
+    # Evaluation of one dof at a time
+    expected = zeros(5)
+    for ((dof, ), (reduced_dof, )) in zip(dofs, reduced_dofs):
+        expected[reduced_dof] = vec.getValue(dof)
+    
+    log(PROGRESS, "Batched exchange:\n" + str(out.getArray()))
+    log(PROGRESS, "Evaluation of one dof at a time:\n" + str(expected))
+    assert isclose(out.getArray(), expected).all()
+    
+# ~~~ Evaluation of several tensors at once ~~~ #
+@generate_meshes
+def test_evaluate_sparse_tensors_at_dofs(mesh):
+    V = EllipticFunctionSpace(mesh)
+    u = TrialFunction(V)
+    v = TestFunction(V)
+    coefficients = [Expression("x[0] + c", c=c, element=V.ufl_element()) for c in (1., 2., 3.)]
+    
+    # Vectors are evaluated at dofs, all at once and one at a time
+    vector_dofs = [(1, ), (11, ), (48, ), (41, ), (11, )]
+    vectors = [assemble(coefficient*v*dx) for coefficient in coefficients]
+    vectors_at_dofs = evaluate_sparse_tensors_at_dofs(vectors, vector_dofs)
+    assert vectors_at_dofs.M == len(vector_dofs)
+    assert vectors_at_dofs.N == len(vectors)
+    for (j, vector) in enumerate(vectors):
+        vector_at_dofs = evaluate_sparse_vector_at_dofs(vector, vector_dofs)
+        for (i, value) in enumerate(vector_at_dofs):
+            assert isclose(vectors_at_dofs[i, j], value)
+            
+    # Matrices are evaluated at pairs of dofs, all at once and one at a time
+    matrix_dofs = [(1, 2), (11, 12), (48, 12), (41, 41)]
+    matrices = [assemble(coefficient*(u.dx(0)*v + u*v)*dx) for coefficient in coefficients]
+    matrices_at_dofs = evaluate_sparse_tensors_at_dofs(matrices, matrix_dofs)
+    assert matrices_at_dofs.M == len(matrix_dofs)
+    assert matrices_at_dofs.N == len(matrices)
+    for (j, matrix) in enumerate(matrices):
+        matrix_at_dofs = evaluate_and_vectorize_sparse_matrix_at_dofs(matrix, matrix_dofs)
+        for (i, value) in enumerate(matrix_at_dofs):
+            assert isclose(matrices_at_dofs[i, j], value)
+            
+# ~~~ Number of collective communications, which must not depend on the number of dofs ~~~ #
+@pytest.mark.mpi
+def test_evaluate_sparse_at_dofs_collectives():
+    vec = PETSc.Vec().createMPI((None, 10), comm=PETSc.COMM_WORLD)
+    vec.setArray(arange(1., 11.))
+    vec.assemble()
+    out = PETSc.Vec().createMPI((None, 5), comm=PETSc.COMM_WORLD)
+    out.set(0.)
+    global_size = vec.getSize()
+    profiler.enable()
+    try:
+        for n_dofs in (1, 5, global_size):
+            dofs = [(dof, ) for dof in range(n_dofs)]
+            reduced_dofs = [(dof % out.getSize(), ) for dof in range(n_dofs)]
+            profiler.clear()
+            evaluate_sparse_vector_at_dofs(vec, dofs)
+            assert profiler._counters["MPI collectives"] == 1
+            profiler.clear()
+            evaluate_sparse_tensors_at_dofs([vec, vec, vec], dofs)
+            assert profiler._counters["MPI collectives"] == 1
+            profiler.clear()
+            _evaluate_sparse_function_at_dofs(vec, dofs, out, reduced_dofs)
+            assert profiler._counters["MPI collectives"] == 4
+    finally:
+        profiler.clear()
+        profiler.disable()
@@ -20,7 +20,7 @@ from math import log
 from numpy import linspace, random
 import scipy.stats as stats
 import matplotlib.pyplot as plt
-from rbnics.sampling import ParameterSpaceSubset
+from rbnics.sampling import AdaptiveParameterSpaceSubset, ParameterSpacePartition, ParameterSpaceSubset
 from rbnics.sampling.distributions import DrawFrom, EquispacedDistribution, LogUniformDistribution, UniformDistribution
 
 # Common data
@@ -171,3 +171,96 @@ def test_sampling_composite_log_uniform_and_beta():
     plot(0, box, parameter_space_subset, bins, stats_loguniform, loc=box[0][min], scale=box[0][max]-box[0][min])
     plot(1, box, parameter_space_subset, bins, stats.beta, a=2, b=5, loc=box[1][min], scale=box[1][max]-box[1][min])
     plt.show()
+
+# Adaptive subset: skipping parameters under the saturation assumption does not change the maximizer,
+# and enrichment adds parameters inside the box
+def test_sampling_adaptive():
+    parameter_space_subset = ParameterSpaceSubset()
+    parameter_space_subset.generate(box, 100)
+    adaptive_parameter_space_subset = AdaptiveParameterSpaceSubset(box, saturation_constant=1., enrichment_size=2)
+    adaptive_parameter_space_subset._list = list(parameter_space_subset._list)
+    for it in range(1, 6):
+        def generator(mu):
+            return (mu[0] + mu[1]/1000.)/it
+        evaluations = list()
+        def counting_generator(mu):
+            evaluations.append(mu)
+            return generator(mu)
+        (value_max, i_max) = adaptive_parameter_space_subset.max(counting_generator)
+        (expected_value_max, expected_i_max) = parameter_space_subset.max(generator)
+        assert value_max == expected_value_max
+        assert adaptive_parameter_space_subset[i_max] == parameter_space_subset[expected_i_max]
+        if it > 1:
+            assert len(evaluations) < len(adaptive_parameter_space_subset)
+        parameter_space_subset._list = list(adaptive_parameter_space_subset._list)
+    assert len(adaptive_parameter_space_subset) == 100 + 5*2
+    for mu in adaptive_parameter_space_subset:
+        for (mu_p, box_p) in zip(mu, box):
+            assert box_p[0] <= mu_p <= box_p[1]
+
+# Partition: each parameter is found in the leaf whose subdomain contains it
+def test_sampling_partition(tempdir):
+    parameter_space_subset = ParameterSpaceSubset()
+    parameter_space_subset.generate(box, 1000)
+    partition = ParameterSpacePartition(box)
+    assert partition.split("") == ("0", "1")
+    assert partition.subdomain("0") == [(2., 3.5), (10., 1000.)] # first parameter has the largest relative size
+    assert partition.split("1") == ("10", "11")
+    assert partition.subdomain("11") == [(3.5, 5.), (505., 1000.)]
+    assert partition.split("11") == ("110", "111")
+    partition.merge("11")
+    assert partition.leaves() == ["0", "10", "11"]
+    assert sum([len(partition.subset(parameter_space_subset, leaf)) for leaf in partition.leaves()]) == len(parameter_space_subset)
+    for mu in parameter_space_subset:
+        leaf = partition.find(mu)
+        assert leaf in partition.leaves()
+        for (mu_p, subdomain_p) in zip(mu, partition.subdomain(leaf)):
+            assert subdomain_p[0] <= mu_p <= subdomain_p[1]
+    partition.save(tempdir, "partition")
+    loaded_partition = ParameterSpacePartition(box)
+    assert loaded_partition.load(tempdir, "partition")
+    for mu in parameter_space_subset:
+        assert loaded_partition.find(mu) == partition.find(mu)
+
+# Batch max: largest values sorted in decreasing order, which are far enough apart
+def test_sampling_max_batch():
+    parameter_space_subset = ParameterSpaceSubset()
+    parameter_space_subset.generate(box, 100)
+    def generator(mu):
+        return mu[0] + mu[1]/1000.
+    (value_max, i_max) = parameter_space_subset.max(generator)
+    (values, indices) = parameter_space_subset.max_batch(generator, 5)
+    assert len(values) == 5
+    assert values[0] == value_max
+    assert indices[0] == i_max
+    assert values == sorted([generator(mu) for mu in parameter_space_subset], reverse=True)[:5]
+    (values, indices) = parameter_space_subset.max_batch(generator, 5, minimum_distance=100.)
+    assert indices[0] == i_max
+    for i in range(len(indices)):
+        for j in range(i):
+            mu_i = parameter_space_subset[indices[i]]
+            mu_j = parameter_space_subset[indices[j]]
+            assert sum([(x - y)**2 for (x, y) in zip(mu_i, mu_j)]) >= 100.**2
+
+# Adaptive batch max: skipping parameters under the saturation assumption does not change the selected batch,
+# and enrichment adds parameters after each call
+def test_sampling_adaptive_max_batch():
+    parameter_space_subset = ParameterSpaceSubset()
+    parameter_space_subset.generate(box, 100)
+    adaptive_parameter_space_subset = AdaptiveParameterSpaceSubset(box, saturation_constant=1., enrichment_size=2)
+    adaptive_parameter_space_subset._list = list(parameter_space_subset._list)
+    for it in range(1, 6):
+        def generator(mu):
+            return (mu[0] + mu[1]/1000.)/it
+        evaluations = list()
+        def counting_generator(mu):
+            evaluations.append(mu)
+            return generator(mu)
+        (values, indices) = adaptive_parameter_space_subset.max_batch(counting_generator, 5, minimum_distance=100.)
+        (expected_values, expected_indices) = parameter_space_subset.max_batch(generator, 5, minimum_distance=100.)
+        assert values == expected_values
+        assert [adaptive_parameter_space_subset[i] for i in indices] == [parameter_space_subset[i] for i in expected_indices]
+        if it > 1:
+            assert len(evaluations) < len(adaptive_parameter_space_subset)
+        parameter_space_subset._list = list(adaptive_parameter_space_subset._list)
+    assert len(adaptive_parameter_space_subset) == 100 + 5*2